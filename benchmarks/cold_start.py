@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+
+MAIN = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "main.py"))
+QUERY = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "query",
+    "params": [
+        {
+            "rawQuery": "wordle ",
+            "search": "",
+            "actionKeyword": "wordle",
+            "isReQuery": False,
+        },
+        {"black_letters_display_type": "Qwerty", "show_hints": False},
+    ],
+}
+
+
+def cold_start(cwd: str) -> tuple[float, dict[str, Any]]:
+    # Starts the plugin the way Flow does, sends a query straight away, and times
+    # how long it takes for the response to come back.
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, MAIN],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        cwd=cwd,
+    )
+    assert process.stdin and process.stdout
+    try:
+        process.stdin.write(json.dumps(QUERY).encode() + b"\r\n")
+        process.stdin.flush()
+        line = process.stdout.readline()
+        elapsed = time.perf_counter() - start
+    finally:
+        process.kill()
+        process.wait()
+
+    return elapsed, json.loads(line)
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(
+        description="Measure the time from launching the plugin to its first query response."
+    )
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--json",
+        dest="json_path",
+        default=None,
+        help="also write the report to this file",
+    )
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as cwd:
+        # The first launch also writes the bytecode caches, so it isn't counted.
+        cold_start(cwd)
+        samples: list[float] = []
+        for _ in range(args.runs):
+            elapsed, response = cold_start(cwd)
+            if "result" not in response:
+                raise SystemExit(f"The plugin answered with an error: {response!r}")
+            samples.append(elapsed)
+
+    report = {
+        "runs": args.runs,
+        "mean_ms": statistics.fmean(samples) * 1e3,
+        "median_ms": statistics.median(samples) * 1e3,
+        "min_ms": min(samples) * 1e3,
+        "max_ms": max(samples) * 1e3,
+    }
+    print(
+        f"Cold start to first response over {args.runs} runs: median {report['median_ms']:.1f}ms, mean {report['mean_ms']:.1f}ms, min {report['min_ms']:.1f}ms, max {report['max_ms']:.1f}ms"
+    )
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=4)
+
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any
+
+parent_folder_path = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(parent_folder_path)
+
+from flogin.testing import PluginTester  # noqa: E402
+
+from wordle import WordleGame  # noqa: E402
+from wordle_plugin.plugin import WordlePlugin  # noqa: E402
+
+KEYWORD = "wordle"
+SCENARIOS: dict[str, tuple[list[str], str]] = {
+    # name: (guesses made before the query, query text)
+    "start prompt": ([], ""),
+    "too short": (["crane", "bloat"], "ab"),
+    "valid guess": (["crane", "bloat"], "abbey"),
+    "invalid word": (["crane", "bloat"], "zzzzz"),
+    "late game": (["crane", "bloat", "sight", "dumpy"], "abbey"),
+}
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.sent = 0
+
+    def write(self, data: bytes) -> None:
+        self.sent += len(data)
+
+    async def drain(self) -> None:
+        pass
+
+
+async def measure(
+    guesses: list[str], text: str, *, prepared: bool, iterations: int
+) -> dict[str, Any]:
+    plugin = WordlePlugin()
+    PluginTester(plugin, metadata=PluginTester.create_bogus_plugin_metadata())
+    plugin.prepared_responses = prepared
+    plugin.persist_games = False
+    writer = _Writer()
+    plugin.jsonrpc.writer = writer  # pyright: ignore[reportAttributeAccessIssue]
+
+    if guesses or text:
+        game = WordleGame("abbey")
+        for guess in guesses:
+            game.guess(guess)
+        plugin.set_game(plugin.sessions.get(KEYWORD), game)
+
+    settings = {"black_letters_display_type": "Qwerty", "show_hints": False}
+    params = [
+        {
+            "rawQuery": f"{KEYWORD} {text}",
+            "search": text,
+            "actionKeyword": KEYWORD,
+            "isReQuery": False,
+        },
+        settings,
+    ]
+
+    samples: list[float] = []
+    for idx in range(iterations + 1):
+        line = json.dumps(
+            {"jsonrpc": "2.0", "id": idx, "method": "query", "params": params}
+        )
+        start = time.perf_counter()
+        await plugin.jsonrpc.process_input(line)
+        # The first query builds the caches, which is measured separately.
+        if idx:
+            samples.append(time.perf_counter() - start)
+        else:
+            first = time.perf_counter() - start
+
+    samples.sort()
+    return {
+        "first_us": first * 1e6,
+        "mean_us": statistics.fmean(samples) * 1e6,
+        "p50_us": samples[len(samples) // 2] * 1e6,
+        "p95_us": samples[int(len(samples) * 0.95)] * 1e6,
+        "bytes": writer.sent // (iterations + 1),
+    }
+
+
+async def run(iterations: int) -> dict[str, dict[str, Any]]:
+    report: dict[str, dict[str, Any]] = {}
+    for name, (guesses, text) in SCENARIOS.items():
+        for prepared in (False, True):
+            key = f"{name} ({'prepared' if prepared else 'plain'})"
+            report[key] = await measure(
+                guesses, text, prepared=prepared, iterations=iterations
+            )
+    return report
+
+
+def main(argv: list[str] | None = None) -> dict[str, dict[str, Any]]:
+    parser = argparse.ArgumentParser(
+        description="Measure the time from a query request to its response being written, with and without prepared responses."
+    )
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument(
+        "--json",
+        dest="json_path",
+        default=None,
+        help="also write the report to this file",
+    )
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args.iterations))
+
+    print(
+        f"{'scenario':<28} {'first':>9} {'mean':>9} {'p50':>9} {'p95':>9} {'bytes':>7}"
+    )
+    for name, row in report.items():
+        print(
+            f"{name:<28} {row['first_us']:>7.0f}us {row['mean_us']:>7.1f}us {row['p50_us']:>7.1f}us {row['p95_us']:>7.1f}us {row['bytes']:>7}"
+        )
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=4)
+
+    return report
+
+
+if __name__ == "__main__":
+    main()
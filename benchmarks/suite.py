@@ -0,0 +1,393 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import TYPE_CHECKING, Any
+
+parent_folder_path = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(parent_folder_path)
+
+from flogin.testing import PluginTester  # noqa: E402
+
+from wordle import (  # noqa: E402
+    MultiWordleGame,
+    WordleGame,
+    unload_compiled_words,
+    unload_words,
+)
+from wordle.utils import IndexableDict, SequenceProxy  # noqa: E402
+from wordle_plugin.enums import BlackDisplay  # noqa: E402
+from wordle_plugin.plugin import WordlePlugin  # noqa: E402
+from wordle_plugin.settings import WordleSettings  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    Case = Callable[[], Callable[[], object]]
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+KEYWORD = "wordle"
+WORD = "abbey"
+GUESSES = ["crane", "bloat", "sight"]
+# Ops faster than this are timed in batches, so the timer's resolution and the
+# loop around the call don't swamp the measurement.
+MIN_ROUND = 0.01
+# Cleanup registered by a case's setup, run once the case has been measured.
+TEARDOWN = contextlib.ExitStack()
+
+
+class FakeFlowApi:
+    # Stands in for Flow Launcher. Every API call is recorded and answered with None,
+    # which is all the plugin ever needs back.
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        async def call(*args: Any, **kwargs: Any) -> None:
+            self.calls.append((name, args))
+
+        return call
+
+
+def settings(display: BlackDisplay = BlackDisplay.querty) -> WordleSettings:
+    return WordleSettings(
+        {
+            "black_letters_display_type": display.value,
+            "show_hints": False,
+            "word_length": "5",
+            "dictionary": "default",
+            "boards": "1",
+            "hard_mode": False,
+        }
+    )
+
+
+def make_game() -> WordleGame:
+    game = WordleGame(WORD)
+    for guess in GUESSES:
+        game.guess(guess)
+    return game
+
+
+def make_plugin(display: BlackDisplay) -> tuple[WordlePlugin, PluginTester[Any]]:
+    plugin = WordlePlugin()
+    plugin.persist_games = False
+    # The warm-up would otherwise run next to whatever is being timed.
+    plugin.warm_up_in_background = False
+    tester = PluginTester(
+        plugin,
+        metadata=PluginTester.create_bogus_plugin_metadata(),
+        flow_api_client=FakeFlowApi(),
+    )
+    plugin.settings = settings(display)
+    return plugin, tester
+
+
+def make_multi_game(boards: int) -> MultiWordleGame:
+    # Words spread evenly over the list, so every run plays the same game.
+    pool = WordleGame(WORD).candidate_pool
+    step = len(pool) // boards
+    game = MultiWordleGame([pool[idx * step] for idx in range(boards)], boards=boards)
+    for guess in GUESSES:
+        game.guess(guess)
+    return game
+
+
+def case_init_cold() -> Callable[[], object]:
+    def run() -> object:
+        unload_compiled_words()
+        unload_words()
+        return WordleGame()
+
+    return run
+
+
+def case_init_warm() -> Callable[[], object]:
+    WordleGame()
+    return WordleGame
+
+
+def case_validate_valid() -> Callable[[], object]:
+    game = make_game()
+    return lambda: game.validate_guess("abbey")
+
+
+def case_validate_unknown() -> Callable[[], object]:
+    game = make_game()
+    return lambda: game.validate_guess("zzzzz")
+
+
+def case_guess() -> Callable[[], object]:
+    # A guess changes the game, so every call makes its own. The word list is
+    # already loaded, which leaves the construction a small part of the time.
+    words = WordleGame(WORD).valid_words
+
+    def run() -> object:
+        return WordleGame(WORD, valid_words=words).guess("crane")
+
+    return run
+
+
+def case_all_chars() -> Callable[[], object]:
+    return make_game().all_chars
+
+
+def case_indexable_dict_build() -> Callable[[], object]:
+    pairs = [(word, idx) for idx, word in enumerate([WORD, *GUESSES, "dumpy", "fjord"])]
+    return lambda: IndexableDict(*pairs)
+
+
+def case_indexable_dict_get_key() -> Callable[[], object]:
+    data = IndexableDict(*((word, idx) for idx, word in enumerate(GUESSES)))
+    return lambda: data["bloat"]
+
+
+def case_indexable_dict_get_position() -> Callable[[], object]:
+    data = IndexableDict(*((word, idx) for idx, word in enumerate(GUESSES)))
+    return lambda: data[1]
+
+
+def case_indexable_dict_delete() -> Callable[[], object]:
+    pairs = [(word, idx) for idx, word in enumerate([WORD, *GUESSES, "dumpy", "fjord"])]
+
+    def run() -> object:
+        data = IndexableDict(*pairs)
+        del data[0]
+        return data
+
+    return run
+
+
+def case_sequence_proxy_list() -> Callable[[], object]:
+    proxy = SequenceProxy(GUESSES)
+    return lambda: proxy[1]
+
+
+def case_sequence_proxy_sorted() -> Callable[[], object]:
+    proxy = SequenceProxy(set(GUESSES), sorted=True)
+    return lambda: proxy[1]
+
+
+def case_sequence_proxy_iterate() -> Callable[[], object]:
+    proxy = SequenceProxy(GUESSES)
+    return lambda: list(proxy)
+
+
+def state_results_case(display: BlackDisplay, *, cached: bool, boards: int = 1) -> Case:
+    def setup() -> Callable[[], object]:
+        plugin, _ = make_plugin(display)
+        game = make_multi_game(boards) if boards > 1 else make_game()
+        session = plugin.sessions.get(KEYWORD)
+        plugin.set_game(session, game)
+        plugin.gen_state_results(session)
+
+        if cached:
+            return lambda: plugin.gen_state_results(session)
+
+        def run() -> object:
+            session.state_results = None
+            return plugin.gen_state_results(session)
+
+        return run
+
+    return setup
+
+
+def query_case(display: BlackDisplay, text: str) -> Case:
+    # The whole per keystroke path through flogin, from the query to its results.
+    def setup() -> Callable[[], object]:
+        plugin, tester = make_plugin(display)
+        plugin.set_game(plugin.sessions.get(KEYWORD), make_game())
+        query_settings = settings(display)
+        runner = TEARDOWN.enter_context(asyncio.Runner())
+
+        def run() -> object:
+            return runner.run(
+                tester.test_query(text, keyword=KEYWORD, settings=query_settings)
+            )
+
+        run()
+        return run
+
+    return setup
+
+
+CASES: dict[str, Case] = {
+    "WordleGame() cold word list": case_init_cold,
+    "WordleGame() warm word list": case_init_warm,
+    "validate_guess valid": case_validate_valid,
+    "validate_guess unknown word": case_validate_unknown,
+    "guess on a new game": case_guess,
+    "all_chars": case_all_chars,
+    "IndexableDict build 6 items": case_indexable_dict_build,
+    "IndexableDict get by key": case_indexable_dict_get_key,
+    "IndexableDict get by position": case_indexable_dict_get_position,
+    "IndexableDict build and delete first": case_indexable_dict_delete,
+    "SequenceProxy index list": case_sequence_proxy_list,
+    "SequenceProxy index sorted set": case_sequence_proxy_sorted,
+    "SequenceProxy iterate": case_sequence_proxy_iterate,
+}
+for _display in BlackDisplay:
+    CASES[f"gen_state_results {_display.value} cached"] = state_results_case(
+        _display, cached=True
+    )
+    CASES[f"gen_state_results {_display.value} rebuilt"] = state_results_case(
+        _display, cached=False
+    )
+    CASES[f"gen_state_results {_display.value} 8 boards rebuilt"] = state_results_case(
+        _display, cached=False, boards=8
+    )
+    CASES[f"query {_display.value} valid guess"] = query_case(_display, "dumpy")
+    CASES[f"query {_display.value} prefix"] = query_case(_display, "du")
+
+
+def measure(case: Case, rounds: int) -> dict[str, Any]:
+    with TEARDOWN:
+        return _measure(case(), rounds)
+
+
+def _measure(run: Callable[[], object], rounds: int) -> dict[str, Any]:
+    run()
+
+    # Calls per round, doubled until a round takes at least MIN_ROUND.
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        if time.perf_counter() - start >= MIN_ROUND:
+            break
+        number *= 2
+
+    samples: list[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        samples.append((time.perf_counter() - start) / number)
+
+    return {
+        "median_us": statistics.median(samples) * 1e6,
+        "min_us": min(samples) * 1e6,
+        "calls": number * rounds,
+    }
+
+
+def compare(
+    report: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+    floor_us: float,
+) -> list[str]:
+    # A case regressed when its fastest round is slower than the baseline's by more
+    # than `threshold` as a fraction and by more than `floor_us`. Noise only ever
+    # makes rounds slower, so the fastest round is the steadiest to compare, and the
+    # floor keeps sub-microsecond cases from being reported over timer jitter.
+    regressions: list[str] = []
+    for name, row in report.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        new_us, old_us = row["min_us"], old["min_us"]
+        if new_us > old_us * (1 + threshold) and new_us - old_us > floor_us:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(
+        description="Time the engine and plugin hot paths, and compare them against a stored baseline."
+    )
+    parser.add_argument("--rounds", type=int, default=15)
+    parser.add_argument(
+        "-k",
+        "--filter",
+        default=None,
+        help="only run the cases with this in their name",
+    )
+    parser.add_argument(
+        "--json",
+        dest="json_path",
+        default=None,
+        help="also write the report to this file",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=BASELINE,
+        help="the report to compare against (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="replace the baseline with this run instead of comparing against it",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="how much slower than the baseline counts as a regression, as a fraction",
+    )
+    parser.add_argument(
+        "--floor",
+        type=float,
+        default=1.0,
+        help="differences under this many microseconds are never regressions",
+    )
+    args = parser.parse_args(argv)
+
+    results: dict[str, dict[str, Any]] = {}
+    for name, case in CASES.items():
+        if args.filter is None or args.filter.lower() in name.lower():
+            results[name] = measure(case, args.rounds)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "rounds": args.rounds,
+        "results": results,
+    }
+
+    # Timings only compare on the same machine, so the baseline is kept locally
+    # rather than in the repo.
+    baseline: dict[str, dict[str, Any]] = {}
+    if not args.save_baseline:
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)["results"]
+        else:
+            print(f"No baseline at {args.baseline}, save one with --save-baseline")
+    regressions = compare(results, baseline, args.threshold, args.floor)
+    report["regressions"] = regressions
+
+    print(f"{'case':<54} {'median':>11} {'min':>11} {'vs min':>10}")
+    for name, row in results.items():
+        old = baseline.get(name)
+        change = f"{row['min_us'] / old['min_us'] - 1:>+10.0%}" if old else " " * 10
+        flag = "  REGRESSED" if name in regressions else ""
+        print(
+            f"{name:<54} {row['median_us']:>9.2f}us {row['min_us']:>9.2f}us {change}{flag}"
+        )
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=4)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=4)
+        print(f"Saved the baseline to {args.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} case(s) regressed against {args.baseline}")
+        raise SystemExit(1)
+
+    return report
+
+
+if __name__ == "__main__":
+    main()
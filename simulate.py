@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+parent_folder_path = os.path.abspath(os.path.dirname(__file__))
+sys.path.append(parent_folder_path)
+
+from wordle import OutOfGuesses, WordleGame, WordList  # noqa: E402
+from wordle.compiled import load_compiled_words  # noqa: E402
+from wordle.dictionary import load_words  # noqa: E402
+from wordle.solver import Solver  # noqa: E402
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    Strategy = Callable[[WordleGame], str]
+
+PHASES = ("setup", "choose", "guess", "narrow")
+
+_solvers: dict[int, Solver] = {}
+
+
+def _words() -> WordList:
+    return load_compiled_words() or load_words()
+
+
+def solver_strategy(game: WordleGame) -> str:
+    solver = _solvers.get(id(game.candidate_pool))
+    if solver is None:
+        solver = _solvers[id(game.candidate_pool)] = Solver(game.candidate_pool)
+        # Ranking only ever reads stored openers, and simulations want the exact
+        # first turn, so they are built up front when the list has none yet.
+        solver.openers(1)
+    return solver.rank(game.candidate_indices, 1)[0].word
+
+
+def random_strategy(game: WordleGame) -> str:
+    pool = game.candidate_pool
+    return pool[int(random.choice(game.candidate_indices))]
+
+
+def first_strategy(game: WordleGame) -> str:
+    return game.candidate_pool[int(game.candidate_indices[0])]
+
+
+STRATEGIES: dict[str, Strategy] = {
+    "solver": solver_strategy,
+    "random": random_strategy,
+    "first": first_strategy,
+}
+
+
+def resolve_strategy(name: str) -> Strategy:
+    if name in STRATEGIES:
+        return STRATEGIES[name]
+
+    # Anything else is a 'package.module:function' path to a custom strategy.
+    module, _, attr = name.partition(":")
+    if not attr:
+        raise SystemExit(
+            f"Unknown strategy {name!r}, expected one of {sorted(STRATEGIES)} or 'module:function'"
+        )
+    return getattr(importlib.import_module(module), attr)
+
+
+def play_batch(
+    words: list[str], strategy_name: str, amount_of_guesses: int, seed: str
+) -> dict[str, Any]:
+    random.seed(seed)
+    strategy = resolve_strategy(strategy_name)
+    valid_words = _words()
+
+    distribution: Counter[int] = Counter()
+    failures: list[str] = []
+    timings = dict.fromkeys(PHASES, 0.0)
+    guesses = 0
+
+    for word in words:
+        start = time.perf_counter()
+        game = WordleGame(
+            word, valid_words=valid_words, amount_of_guesses=amount_of_guesses
+        )
+        timings["setup"] += time.perf_counter() - start
+
+        while True:
+            start = time.perf_counter()
+            guess = strategy(game)
+            timings["choose"] += time.perf_counter() - start
+
+            start = time.perf_counter()
+            try:
+                solved = game.guess(guess)
+            except OutOfGuesses:
+                solved = False
+                failures.append(word)
+            finally:
+                timings["guess"] += time.perf_counter() - start
+                guesses += 1
+
+            if solved:
+                distribution[len(game.past_guesses)] += 1
+            if solved or game.remaining_guesses == 0:
+                break
+
+            start = time.perf_counter()
+            _ = game.candidate_indices
+            timings["narrow"] += time.perf_counter() - start
+
+    return {
+        "distribution": dict(distribution),
+        "failures": failures,
+        "timings": timings,
+        "guesses": guesses,
+    }
+
+
+def main(argv: list[str] | None = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(
+        description="Play every word in the word list with a guessing strategy, and report how it did."
+    )
+    parser.add_argument(
+        "--strategy",
+        default="solver",
+        help=f"one of {sorted(STRATEGIES)}, or 'module:function'",
+    )
+    parser.add_argument(
+        "--sample",
+        type=int,
+        default=None,
+        help="only play this many randomly chosen words",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--guesses", type=int, default=6, help="the amount of guesses per game"
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument(
+        "--json",
+        dest="json_path",
+        default=None,
+        help="also write the report to this file",
+    )
+    args = parser.parse_args(argv)
+
+    resolve_strategy(args.strategy)
+    words = list(_words())
+    if args.sample is not None:
+        words = random.Random(args.seed).sample(words, min(args.sample, len(words)))
+
+    batches = [
+        words[i : i + args.batch_size] for i in range(0, len(words), args.batch_size)
+    ]
+    distribution: Counter[int] = Counter()
+    failures: list[str] = []
+    timings = dict.fromkeys(PHASES, 0.0)
+    guesses = 0
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(args.workers) as pool:
+        futures = [
+            # Batches get their own seed, distinct from the one used to sample the words.
+            pool.submit(
+                play_batch, batch, args.strategy, args.guesses, f"{args.seed}:{idx}"
+            )
+            for idx, batch in enumerate(batches)
+        ]
+        for future in futures:
+            result = future.result()
+            distribution.update({int(k): v for k, v in result["distribution"].items()})
+            failures.extend(result["failures"])
+            guesses += result["guesses"]
+            for phase, seconds in result["timings"].items():
+                timings[phase] += seconds
+    elapsed = time.perf_counter() - start
+
+    played = len(words)
+    solved = sum(distribution.values())
+    report = {
+        "strategy": args.strategy,
+        "games": played,
+        "workers": args.workers,
+        "elapsed": elapsed,
+        "games_per_second": played / elapsed if elapsed else 0.0,
+        "failure_rate": len(failures) / played if played else 0.0,
+        "average_guesses": sum(k * v for k, v in distribution.items()) / solved
+        if solved
+        else 0.0,
+        "distribution": dict(sorted(distribution.items())),
+        "failures": sorted(failures),
+        "phase_seconds": timings,
+        "phase_microseconds_per_guess": {
+            phase: seconds / guesses * 1e6 if guesses else 0.0
+            for phase, seconds in timings.items()
+        },
+    }
+
+    print(
+        f"Played {played} games with the {args.strategy!r} strategy on {args.workers} worker(s) in {elapsed:.2f}s ({report['games_per_second']:.1f} games/s)"
+    )
+    print(
+        f"Solved {solved}, failed {len(failures)} ({report['failure_rate']:.2%}), average {report['average_guesses']:.3f} guesses"
+    )
+    width = max(distribution.values(), default=0)
+    for count in range(1, args.guesses + 1):
+        amount = distribution.get(count, 0)
+        bar = "#" * (round(40 * amount / width) if width else 0)
+        print(f"  {count}: {amount:>6} {bar}")
+    print(f"  X: {len(failures):>6}")
+    print("Time per guess (summed across workers):")
+    for phase, micros in report["phase_microseconds_per_guess"].items():
+        print(f"  {phase:<7} {micros:>10.1f}us")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=4)
+
+    return report
+
+
+if __name__ == "__main__":
+    main()
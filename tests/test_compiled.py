@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from wordle import (
+    CompiledWordList,
+    WordDictionary,
+    WordleGame,
+    compile_word_list,
+    load_compiled_words,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+WORDS = ["crane", "abbey", "sight", "plot", "spines", "bloat", "fjord", "gaze"]
+
+
+def write_source(directory: Path, words: list[str] = WORDS) -> Path:
+    path = directory / "words.txt"
+    path.write_text("\n".join(words))
+    return path
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    source = write_source(tmp_path)
+    dest = compile_word_list(source)
+    assert dest == tmp_path / "words.bin"
+
+    compiled = CompiledWordList.open(dest)
+    expected = WordDictionary(WORDS)
+    assert list(compiled) == list(expected)
+    assert len(compiled) == len(expected)
+    assert compiled.lengths == expected.lengths == (4, 5, 6)
+    for idx, word in enumerate(expected):
+        assert compiled[idx] == word
+        assert compiled.index(word) == idx
+        assert word in compiled
+    assert compiled[-1] == expected[-1]
+    assert compiled[1:3] == list(expected[1:3])
+    for length in compiled.lengths:
+        assert list(compiled.with_length(length)) == list(expected.with_length(length))
+    assert len(compiled.with_length(7)) == 0
+    compiled.close()
+
+
+def test_missing_words(tmp_path: Path) -> None:
+    compiled = CompiledWordList.open(compile_word_list(write_source(tmp_path)))
+    for word in ("zesty", "cran", "cranes", "CRANE", "ünder"):
+        assert word not in compiled
+        with pytest.raises(ValueError):
+            compiled.index(word)
+    assert 5 not in compiled
+    with pytest.raises(IndexError):
+        compiled[len(compiled)]
+    compiled.close()
+
+
+def test_rejects_other_files(tmp_path: Path) -> None:
+    path = tmp_path / "words.bin"
+    path.write_bytes(b"not a word list" * 4)
+    with pytest.raises(ValueError):
+        CompiledWordList.open(path)
+    assert load_compiled_words(path, source=None) is None
+    assert load_compiled_words(tmp_path / "missing.bin", source=None) is None
+
+
+def test_stale_lists_are_ignored(tmp_path: Path) -> None:
+    source = write_source(tmp_path)
+    dest = compile_word_list(source)
+    assert load_compiled_words(dest, source=source) is not None
+
+    # A different size is caught from the stat alone.
+    write_source(tmp_path, [*WORDS, "zesty"])
+    assert load_compiled_words(dest, source=source) is None
+
+    # The same size with other words is caught by the crc.
+    write_source(tmp_path, ["zesty" if word == "crane" else word for word in WORDS])
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_compiled_words(dest, source=source) is None
+
+    compile_word_list(source)
+    words = load_compiled_words(dest, source=source)
+    assert words is not None
+    assert "zesty" in words
+    assert "crane" not in words
+
+
+def test_games_use_the_bundled_list() -> None:
+    # The bundled list has to be rebuilt whenever the text list changes.
+    words = load_compiled_words()
+    assert words is not None
+    assert WordleGame().valid_words is words
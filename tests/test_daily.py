@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import datetime
+
+import pytest
+
+from wordle import DAILY_EPOCH, DailySchedule, WordDictionary
+
+WORDS = WordDictionary(
+    ["abbey", "babes", "kebab", "crane", "slate", "trace", "bloat", "sight"]
+)
+DAY = datetime.timedelta(days=1)
+
+
+def test_every_word_once_per_cycle() -> None:
+    schedule = DailySchedule(WORDS)
+    assert len(schedule) == len(WORDS)
+    cycle = [schedule.word(DAILY_EPOCH + idx * DAY) for idx in range(len(WORDS))]
+    assert sorted(cycle) == sorted(WORDS)
+    # Then it starts over in the same order.
+    assert [
+        schedule.word(DAILY_EPOCH + (len(WORDS) + idx) * DAY)
+        for idx in range(len(WORDS))
+    ] == cycle
+
+
+def test_same_seed_same_words() -> None:
+    date = datetime.date(2024, 3, 1)
+    assert DailySchedule(WORDS).word(date) == DailySchedule(WORDS).word(date)
+    days = [DAILY_EPOCH + idx * DAY for idx in range(len(WORDS))]
+    assert [DailySchedule(WORDS).word(day) for day in days] != [
+        DailySchedule(WORDS, seed="other").word(day) for day in days
+    ]
+
+
+def test_numbers_and_dates() -> None:
+    schedule = DailySchedule(WORDS)
+    assert schedule.number(DAILY_EPOCH) == 0
+    assert schedule.number(DAILY_EPOCH + 10 * DAY) == 10
+    assert schedule.date(10) == DAILY_EPOCH + 10 * DAY
+
+
+def test_last_and_next_date() -> None:
+    schedule = DailySchedule(WORDS)
+    today = datetime.date(2024, 3, 1)
+    word = schedule.word(today)
+    assert schedule.last_date(word, today) == today
+    assert schedule.next_date(word, today) == today
+    assert schedule.next_date(word, today + DAY) == today + len(WORDS) * DAY
+    assert schedule.last_date(word, today - DAY) == today - len(WORDS) * DAY
+
+    for other in WORDS:
+        last = schedule.last_date(other, today)
+        assert last is not None
+        assert today - len(WORDS) * DAY < last <= today
+        assert schedule.word(last) == other
+        upcoming = schedule.next_date(other, today)
+        assert today <= upcoming < today + len(WORDS) * DAY
+        assert schedule.word(upcoming) == other
+
+
+def test_before_the_first_day() -> None:
+    schedule = DailySchedule(WORDS)
+    first = schedule.word(DAILY_EPOCH + DAY)
+    assert schedule.last_date(first, DAILY_EPOCH) is None
+    assert schedule.next_date(first, DAILY_EPOCH) == DAILY_EPOCH + DAY
+
+
+def test_unknown_words() -> None:
+    schedule = DailySchedule(WORDS)
+    with pytest.raises(ValueError):
+        schedule.last_date("zesty")
+    with pytest.raises(ValueError):
+        DailySchedule(WordDictionary([]))
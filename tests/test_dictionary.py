@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from wordle import WordDictionary, WordleGame, load_words
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+WORDS = ["crane", "abbey", "sight", "crane", "bloat", "fjord", "plot", "spines"]
+
+
+def test_words_are_sorted_and_unique() -> None:
+    words = WordDictionary(WORDS)
+    assert len(words) == 7
+    assert sorted(words) == sorted(set(WORDS))
+    assert list(words) == list(words.words)
+
+
+def test_membership() -> None:
+    words = WordDictionary(WORDS)
+    assert "crane" in words
+    assert "plot" in words
+    assert "zesty" not in words
+    assert "CRANE" not in words
+    assert 5 not in words
+    assert ["crane"] not in words
+    assert words.count("abbey") == 1
+    assert words.count("zesty") == 0
+
+
+def test_index() -> None:
+    words = WordDictionary(WORDS)
+    for idx, word in enumerate(words):
+        assert words.index(word) == idx
+        assert words[idx] == word
+
+    with pytest.raises(ValueError):
+        words.index("zesty")
+    with pytest.raises(ValueError):
+        words.index(["crane"])
+
+    idx = words.index("sight")
+    assert words.index("sight", idx, idx + 1) == idx
+    with pytest.raises(ValueError):
+        words.index("sight", idx + 1)
+    with pytest.raises(ValueError):
+        words.index("sight", 0, idx)
+
+
+def test_with_length() -> None:
+    words = WordDictionary(WORDS)
+    assert words.lengths == (4, 5, 6)
+    assert list(words.with_length(5)) == ["abbey", "bloat", "crane", "fjord", "sight"]
+    assert list(words.with_length(4)) == ["plot"]
+    assert list(words.with_length(6)) == ["spines"]
+    assert len(words.with_length(7)) == 0
+    # Built once and shared by every call after.
+    assert words.with_length(5) is words.with_length(5)
+
+    # A dictionary with a single length is its own bucket.
+    five = words.with_length(5)
+    assert five.with_length(5) is five
+
+
+def test_equality() -> None:
+    assert WordDictionary(WORDS) == WordDictionary(reversed(WORDS))
+    assert hash(WordDictionary(WORDS)) == hash(WordDictionary(reversed(WORDS)))
+    assert WordDictionary(WORDS) != WordDictionary(WORDS[:3])
+
+
+def test_game_accepts_any_iterable() -> None:
+    game = WordleGame("crane", valid_words=iter(["crane", "abbey"]))
+    assert isinstance(game.valid_words, WordDictionary)
+    assert "abbey" in game.valid_words
+
+    words = WordDictionary(WORDS)
+    assert WordleGame("crane", valid_words=words).valid_words is words
+
+
+def test_load_words_is_shared(tmp_path: Path) -> None:
+    path = tmp_path / "words.txt"
+    path.write_text("crane\nabbey\n")
+    words = load_words(path)
+    assert list(words) == ["abbey", "crane"]
+    assert load_words(path) is words
+    assert load_words(str(path)) is words
+
+
+def test_load_words_picks_up_edits(tmp_path: Path) -> None:
+    path = tmp_path / "words.txt"
+    path.write_text("crane\nabbey\n")
+    stat = path.stat()
+    words = load_words(path)
+
+    # A different size is a different file.
+    path.write_text("crane\nabbey\nsight\n")
+    edited = load_words(path)
+    assert edited is not words
+    assert "sight" in edited
+
+    # So is the same size with a newer mtime.
+    path.write_text("crane\nabbey\nfjord\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    again = load_words(path)
+    assert again is not edited
+    assert "fjord" in again
+    assert "sight" not in again
+    assert load_words(path) is again
+
+
+def test_default_games_share_their_words() -> None:
+    assert WordleGame().valid_words is WordleGame().valid_words
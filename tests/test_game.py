@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import pytest
+
+from wordle import WordDictionary, WordleGame
+from wordle.compiled import load_compiled_words
+
+WORDS = WordDictionary(
+    ["abbey", "babes", "kebab", "crane", "slate", "trace", "bloat", "sight"]
+)
+
+
+def feedback(guess: str, answer: str) -> str:
+    # Scored the slow way, greens first and then yellows from the letters left.
+    result = ["b"] * len(guess)
+    left: list[str] = []
+    for idx, (char, target) in enumerate(zip(guess, answer)):
+        if char == target:
+            result[idx] = "g"
+        else:
+            left.append(target)
+    for idx, char in enumerate(guess):
+        if result[idx] != "g" and char in left:
+            left.remove(char)
+            result[idx] = "y"
+    return "".join(result)
+
+
+def brute_force(words: WordDictionary, guesses: list[str], answer: str) -> list[str]:
+    return [
+        word
+        for word in words
+        if all(feedback(guess, word) == feedback(guess, answer) for guess in guesses)
+    ]
+
+
+def sample_words() -> WordDictionary:
+    bundled = load_compiled_words()
+    assert bundled is not None
+    extra = ["abbey", "babes", "kebab", "ebbed", "crane", "slate", "trace"]
+    return WordDictionary([*bundled[::25], *extra])
+
+
+@pytest.mark.parametrize(
+    ("answer", "guesses"),
+    [
+        ("abbey", ["crane", "babes", "kebab"]),
+        ("babes", ["ebbed", "abbey"]),
+        ("kebab", ["abbey"]),
+        ("crane", ["slate", "trace"]),
+        ("ebbed", ["kebab", "babes", "abbey"]),
+    ],
+)
+def test_candidates_match_brute_force(answer: str, guesses: list[str]) -> None:
+    words = sample_words()
+    game = WordleGame(answer, valid_words=words)
+    assert game.remaining_candidate_count == len(words)
+
+    for count in range(1, len(guesses) + 1):
+        game.guess(guesses[count - 1])
+        expected = brute_force(words, guesses[:count], answer)
+        assert game.remaining_candidates == expected
+        assert game.remaining_candidate_count == len(expected)
+        assert answer in game.remaining_candidates
+
+
+def test_candidates_narrowed_all_at_once() -> None:
+    words = sample_words()
+    game = WordleGame("abbey", valid_words=words)
+    for guess in ("crane", "babes", "kebab"):
+        game.guess(guess)
+    assert game.remaining_candidates == brute_force(
+        words, ["crane", "babes", "kebab"], "abbey"
+    )
+    with pytest.raises(ValueError):
+        game.candidate_indices[0] = 1
+
+
+def test_hard_mode_indices_skip_past_guesses() -> None:
+    game = WordleGame("abbey", valid_words=WORDS, hard_mode=True)
+    game.guess("babes")
+
+    pool = game.candidate_pool
+    allowed = [pool[idx] for idx in game.hard_mode_indices]
+    assert "babes" not in allowed
+    assert "abbey" in allowed
+    # Every word offered as a hard mode guess has to be accepted as one, and
+    # every other word of the pool has to be turned down.
+    for word in pool:
+        assert game.validate_guess(word) == (word in allowed)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wordle import (
+    WordDictionary,
+    WordListLibrary,
+    load_compiled_words,
+    load_words,
+    unload_compiled_words,
+    unload_words,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_default_list_is_shared() -> None:
+    assert WordListLibrary().get("default") is load_compiled_words()
+
+
+def test_name_of(tmp_path: Path) -> None:
+    (tmp_path / "short.txt").write_text("abbey\ncrane\nkebab")
+    library = WordListLibrary(tmp_path)
+    words = library.get("short")
+    assert library.name_of(words) == "short"
+    assert library.name_of(library.get("default")) == "default"
+    assert library.name_of(WordDictionary(["abbey"])) is None
+
+
+def test_unload_word_lists() -> None:
+    compiled, words = load_compiled_words(), load_words()
+    assert load_compiled_words() is compiled
+    assert load_words() is words
+
+    assert unload_compiled_words() >= 1
+    assert unload_words() >= 1
+    assert load_compiled_words() is not compiled
+    assert load_words() is not words
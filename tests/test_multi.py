@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import pytest
+
+from wordle import (
+    MultiWordleGame,
+    WordDictionary,
+    WordleGame,
+    dump_snapshot,
+    load_snapshot,
+)
+from wordle.snapshot import MULTI_HEADER
+
+TARGETS = ["abbey", "crane", "sight", "dumpy"]
+GUESSES = ["slate", "bloat", "crane", "fjord", "sight"]
+
+
+@pytest.mark.parametrize("narrow_every_guess", [True, False])
+def test_boards_narrow_like_separate_games(narrow_every_guess: bool) -> None:
+    game = MultiWordleGame(TARGETS)
+    boards = [WordleGame(word, valid_words=game.valid_words) for word in TARGETS]
+
+    for guess in GUESSES:
+        game.guess(guess)
+        for board in boards:
+            if board.word not in board.past_guess_words:
+                board.guess(guess)
+        if narrow_every_guess:
+            assert len(game.candidate_counts) == len(TARGETS)
+
+    for idx, board in enumerate(boards):
+        assert list(game.board_candidate_indices(idx)) == list(board.candidate_indices)
+    assert list(game.solved) == [False, True, True, False]
+    assert set(game.candidate_indices) == {
+        *boards[0].candidate_indices,
+        *boards[3].candidate_indices,
+    }
+
+
+def assert_same_game(loaded: MultiWordleGame, game: MultiWordleGame) -> None:
+    assert loaded.words == game.words
+    assert list(loaded.past_guess_words) == list(game.past_guess_words)
+    assert loaded.amount_of_guesses == game.amount_of_guesses
+    assert loaded.started_at == game.started_at
+    assert list(loaded.solved_at) == list(game.solved_at)
+    for idx in range(game.boards):
+        assert list(loaded.board_candidate_indices(idx)) == list(
+            game.board_candidate_indices(idx)
+        )
+
+
+@pytest.mark.parametrize("words", [TARGETS, ["abbey", "zesty"]])
+def test_snapshot_round_trip(words: list[str]) -> None:
+    game = MultiWordleGame(words, amount_of_guesses=12)
+    for guess in GUESSES[:3]:
+        game.guess(guess)
+
+    loaded = load_snapshot(dump_snapshot(game))
+    assert isinstance(loaded, MultiWordleGame)
+    assert_same_game(loaded, game)
+
+
+def test_snapshot_round_trip_guess_outside_the_list() -> None:
+    # A board's word can be guessed even when it isn't in the word list.
+    words = WordDictionary(["abbey", "crane", "slate"])
+    game = MultiWordleGame(["abbey", "zesty", "crane"], valid_words=words)
+    for guess in ["slate", "zesty", "crane"]:
+        game.guess(guess)
+
+    loaded = load_snapshot(dump_snapshot(game), valid_words=words)
+    assert isinstance(loaded, MultiWordleGame)
+    assert_same_game(loaded, game)
+
+
+def test_snapshot_unknown_version() -> None:
+    game = MultiWordleGame(TARGETS)
+    game.guess("crane")
+    data = dump_snapshot(game)
+    with pytest.raises(ValueError):
+        load_snapshot(data[:4] + b"\x02" + data[5:])
+
+
+def test_corrupt_solved_boards() -> None:
+    game = MultiWordleGame(TARGETS)
+    game.guess("crane")
+    data = bytearray(dump_snapshot(game))
+    # The solved bitmask sits right before the dictionary name length.
+    data[MULTI_HEADER.size - 5] ^= 1
+    with pytest.raises(ValueError):
+        load_snapshot(bytes(data))
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+import wordle.pattern_table
+from wordle import WordDictionary
+from wordle.pattern_table import load_pattern_table, unload_pattern_tables
+from wordle.patterns import score_patterns
+from wordle.solver import Solver
+from wordle_plugin.plugin import WordlePlugin
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+WORDS = WordDictionary(["abbey", "babes", "kebab", "crane", "slate", "trace"])
+
+
+@pytest.fixture(autouse=True)
+def _unload() -> None:
+    unload_pattern_tables([WORDS])
+
+
+def test_builds_table(tmp_path: Path) -> None:
+    table = load_pattern_table(WORDS, cache_dir=tmp_path)
+    assert table is not None
+    assert len(list(tmp_path.iterdir())) == 1
+    assert table.shape == (len(WORDS), len(WORDS))
+    assert np.array_equal(table.matrix, score_patterns(list(WORDS), list(WORDS)))
+    assert table.lookup("crane", "trace") == table.row("crane")[WORDS.index("trace")]
+    assert load_pattern_table(WORDS, cache_dir=tmp_path) is table
+
+
+def test_reopens_table(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    built = load_pattern_table(WORDS, cache_dir=tmp_path)
+    assert built is not None
+    assert unload_pattern_tables([WORDS]) == 1
+
+    def fail(*args: object) -> None:
+        raise AssertionError("The table was built again")
+
+    monkeypatch.setattr(wordle.pattern_table, "_build", fail)
+    reopened = load_pattern_table(WORDS, cache_dir=tmp_path, build=False)
+    assert reopened is not None
+    assert reopened is not built
+    assert np.array_equal(reopened.matrix, built.matrix)
+
+
+def test_rebuilds_for_edited_word_list(tmp_path: Path) -> None:
+    assert load_pattern_table(WORDS, cache_dir=tmp_path) is not None
+
+    edited = WordDictionary([*WORDS, "sight"])
+    assert load_pattern_table(edited, cache_dir=tmp_path, build=False) is None
+    table = load_pattern_table(edited, cache_dir=tmp_path)
+    assert table is not None
+    assert table.shape == (len(edited), len(edited))
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_plugin_builds_table_after_warming_up(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(wordle.pattern_table, "DEFAULT_CACHE_DIR", tmp_path)
+    plugin = WordlePlugin()
+    solver = Solver(WORDS)
+
+    asyncio.run(plugin._build_table(solver))
+    plugin.executor.shutdown()
+    assert solver.table is load_pattern_table(WORDS, build=False)
+    assert solver.table is not None
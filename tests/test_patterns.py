@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import itertools
+
+import numpy as np
+import pytest
+
+from wordle.codes import pattern_code
+from wordle.patterns import encode_words, score_patterns
+
+# Duplicate letters are where the vectorized scorer is easiest to get wrong: a
+# letter can only be yellow as many times as the answer has it left over.
+WORDS = [
+    "abbey",
+    "babes",
+    "kebab",
+    "ebbed",
+    "speed",
+    "erase",
+    "geese",
+    "eerie",
+    "llama",
+    "allay",
+    "crane",
+    "sassy",
+]
+
+
+@pytest.mark.parametrize(("guess", "answer"), list(itertools.product(WORDS, WORDS)))
+def test_single_guess_matches_reference(guess: str, answer: str) -> None:
+    assert int(score_patterns(guess, [answer])[0]) == pattern_code(guess, answer)
+
+
+def test_matrix_matches_reference() -> None:
+    matrix = score_patterns(WORDS, WORDS)
+    assert matrix.shape == (len(WORDS), len(WORDS))
+    for (row, guess), (col, answer) in itertools.product(
+        enumerate(WORDS), enumerate(WORDS)
+    ):
+        assert int(matrix[row, col]) == pattern_code(guess, answer)
+
+
+def test_encoded_input_matches_strings() -> None:
+    assert np.array_equal(
+        score_patterns(encode_words("kebab"), encode_words(WORDS)),
+        score_patterns("kebab", WORDS),
+    )
+
+
+@pytest.mark.parametrize(
+    ("guess", "answer"),
+    [("abbey", "kebab"), ("strengths", "lengthens"), ("aaaa", "abab")],
+)
+def test_other_lengths(guess: str, answer: str) -> None:
+    assert int(score_patterns(guess, [answer])[0]) == pattern_code(guess, answer)
+
+
+def test_length_mismatch() -> None:
+    with pytest.raises(ValueError):
+        score_patterns("abbey", ["abbeys"])
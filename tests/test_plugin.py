@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import json
+import threading
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from flogin import QueryResponse
+
+from wordle import DailyPuzzlePlayed, UnsupportedLength, WordleGame
+from wordle_plugin.enums import BlackDisplay
+from wordle_plugin.plugin import WordlePlugin
+from wordle_plugin.responses import PreparedQueryResponse
+from wordle_plugin.results import Result
+from wordle_plugin.settings import WordleSettings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from wordle.game import WordleOptions
+    from wordle_plugin.sessions import GameSession
+
+KEYWORD = "wordle"
+
+
+def raw_settings(display: BlackDisplay = BlackDisplay.querty) -> dict[str, Any]:
+    return {"black_letters_display_type": display.value, "show_hints": False}
+
+
+def make_plugin(
+    display: BlackDisplay = BlackDisplay.querty,
+) -> tuple[WordlePlugin, GameSession]:
+    plugin = WordlePlugin()
+    plugin.persist_games = False
+    plugin.settings = WordleSettings(raw_settings(display))
+    game = WordleGame("abbey")
+    game.guess("crane")
+    session = plugin.sessions.get(KEYWORD)
+    plugin.set_game(session, game)
+    return plugin, session
+
+
+def set_display(plugin: WordlePlugin, display: BlackDisplay) -> None:
+    plugin.settings.black_letters_display_type = display.value
+
+
+def test_state_results_are_reused() -> None:
+    plugin, session = make_plugin()
+    results = plugin.gen_state_results(session)
+    assert plugin.gen_state_results(session) is results
+    assert results[0].title == "_ _ _ _ _"
+
+
+def test_state_results_follow_guesses() -> None:
+    plugin, session = make_plugin()
+    assert session.game is not None
+    results = plugin.gen_state_results(session)
+
+    session.game.guess("babes")
+    rebuilt = plugin.gen_state_results(session)
+    assert rebuilt is not results
+    assert len(rebuilt) == len(results) + 1
+    assert plugin.gen_state_results(session) is rebuilt
+
+
+def test_state_results_follow_the_display() -> None:
+    plugin, session = make_plugin()
+    qwerty = plugin.gen_state_results(session)
+
+    set_display(plugin, BlackDisplay.only_blacks)
+    blacks = plugin.gen_state_results(session)
+    assert blacks is not qwerty
+    assert blacks[1].title == "cnr"
+
+    set_display(plugin, BlackDisplay.abc)
+    assert plugin.gen_state_results(session)[1].title.startswith("abcdef")
+
+
+def test_state_results_follow_new_games() -> None:
+    plugin, session = make_plugin()
+    results = plugin.gen_state_results(session)
+    plugin.set_game(session, WordleGame("abbey"))
+    assert plugin.gen_state_results(session) is not results
+
+
+def test_prepared_response_matches_flogin() -> None:
+    plugin, session = make_plugin()
+    results = [
+        *plugin.gen_state_results(session),
+        Result("Not cached", sub="Built per query"),
+    ]
+    response = QueryResponse(results, {"show_hints": True}, "debug")
+    prepared = PreparedQueryResponse.from_response(response)
+    assert json.loads(prepared.to_message(7)) == json.loads(response.to_message(7))
+
+
+def test_payloads_follow_the_state() -> None:
+    plugin, session = make_plugin()
+    assert session.game is not None
+    status = plugin.gen_state_results(session)[0]
+    payload = status.payload
+    assert status.payload is payload
+
+    session.game.guess("abbey")
+    status = plugin.gen_state_results(session)[0]
+    assert json.loads(status.payload)["title"] == "a b b e y"
+
+    set_display(plugin, BlackDisplay.only_blacks)
+    blacks = plugin.gen_state_results(session)[1]
+    assert json.loads(blacks.payload)["title"] == blacks.title
+
+
+def test_new_games_need_a_word_length_the_dictionary_has() -> None:
+    plugin, session = make_plugin()
+    plugin.settings.word_length = "7"
+    with pytest.raises(UnsupportedLength) as info:
+        plugin.start_new_game(session)
+    assert info.value.available == (5,)
+    assert "only has 5 letter words" in str(info.value)
+    with pytest.raises(UnsupportedLength):
+        plugin.start_daily_game(session)
+
+    plugin.settings.word_length = "5"
+    assert len(plugin.start_new_game(session).word) == 5
+
+
+def test_daily_puzzle_is_played_once() -> None:
+    plugin, session = make_plugin()
+    today = datetime.date.today()
+    game = plugin.start_daily_game(session)
+    assert plugin.get_daily_played() == today
+
+    plugin.set_game(session, None)
+    with pytest.raises(DailyPuzzlePlayed):
+        plugin.start_daily_game(session, today)
+    assert session.game is None
+
+    tomorrow = plugin.start_daily_game(session, today + datetime.timedelta(days=1))
+    assert tomorrow.word != game.word
+
+
+def test_daily_puzzle_played_is_saved(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def play() -> None:
+        plugin, session = make_plugin()
+        monkeypatch.setattr(plugin, "get_data_dir", lambda: tmp_path)
+        plugin.set_game(session, None)
+        plugin.start_daily_game(session)
+        await asyncio.gather(*plugin._writes)
+
+    asyncio.run(play())
+    plugin, session = make_plugin()
+    monkeypatch.setattr(plugin, "get_data_dir", lambda: tmp_path)
+    plugin.set_game(session, None)
+    assert plugin.get_daily_played() == datetime.date.today()
+    with pytest.raises(DailyPuzzlePlayed):
+        plugin.start_daily_game(session)
+
+
+def test_hints_of_other_keywords_are_kept() -> None:
+    async def main() -> list[list[Any]]:
+        plugin, session = make_plugin()
+        other = plugin.sessions.get("other")
+        plugin.set_game(other, WordleGame("crane"))
+        assert session.game is not None
+        assert other.game is not None
+        jobs = [
+            plugin.rank_hints(session, plugin.prepare_hints(session.game)),
+            plugin.rank_hints(other, plugin.prepare_hints(other.game)),
+        ]
+        try:
+            return await asyncio.gather(*jobs)
+        finally:
+            await plugin.close()
+
+    assert all(asyncio.run(main()))
+
+
+def test_close_writes_pending_saves(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def main() -> WordlePlugin:
+        plugin, session = make_plugin()
+        monkeypatch.setattr(plugin, "get_data_dir", lambda: tmp_path)
+        plugin.save_game(session)
+        await plugin.close()
+        return plugin
+
+    plugin = asyncio.run(main())
+    assert (tmp_path / f"game-{KEYWORD}.bin").exists()
+    assert plugin.executor._thread_pool is None
+
+
+def test_warm_up_reads_the_settings_on_the_event_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    plugin, _ = make_plugin()
+    game_options = plugin.game_options
+    threads: list[threading.Thread] = []
+
+    def record_thread() -> WordleOptions:
+        threads.append(threading.current_thread())
+        return game_options()
+
+    async def skip_table(solver: object) -> None:
+        pass
+
+    monkeypatch.setattr(plugin, "game_options", record_thread)
+    monkeypatch.setattr(plugin, "_build_table", skip_table)
+    monkeypatch.setattr(plugin, "build_openers_later", lambda solver: None)
+
+    async def main() -> None:
+        try:
+            await plugin._warm_up_later()
+        finally:
+            await plugin.close()
+
+    asyncio.run(main())
+    assert threads == [threading.main_thread()]
+    options = game_options()
+    pool = options["valid_words"].with_length(options["word_length"])
+    assert plugin.get_solver(pool) is not None
+
+
+async def send_queries(plugin: WordlePlugin, *texts: str) -> list[Any]:
+    # Sent the way Flow does, one request per keystroke without waiting for the
+    # responses in between.
+    tasks = [
+        plugin.dispatch(
+            "query",
+            {
+                "rawQuery": f"{KEYWORD} {text}",
+                "search": text,
+                "actionKeyword": KEYWORD,
+                "isReQuery": False,
+            },
+            raw_settings(),
+        )
+        for text in texts
+    ]
+    return await asyncio.gather(*tasks)
+
+
+def test_superseded_queries_are_dropped() -> None:
+    plugin, _ = make_plugin()
+    first, second, newest = asyncio.run(send_queries(plugin, "a", "ab", "abbey"))
+    assert first.results == []
+    assert second.results == []
+    assert newest.results
+    assert "abbey" in newest.results[0].title
+
+
+def test_queries_in_turn_are_answered() -> None:
+    plugin, _ = make_plugin()
+
+    async def main() -> list[Any]:
+        return [
+            *await send_queries(plugin, "ab"),
+            *await send_queries(plugin, "abbey"),
+        ]
+
+    for response in asyncio.run(main()):
+        assert response.results
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from wordle import GameRecord, GameStats
+from wordle_plugin.results import StatsResult
+
+
+def stats(*records: tuple[int, bool]) -> GameStats:
+    result = GameStats()
+    for guesses, won in records:
+        result.add(GameRecord("abbey", ["crane"] * guesses, won, 65.0))
+    return result
+
+
+def test_stats_result_without_wins() -> None:
+    result = StatsResult(stats((6, False)))
+    assert result.title == "Played 1, won 0%, streak 0 (best 0)"
+    assert (
+        result.sub
+        == "Wins by guesses: 1:0 2:0 3:0 4:0 5:0 6:0, 1m 05s a game on average"
+    )
+
+
+def test_stats_result_with_wins() -> None:
+    result = StatsResult(stats((3, True), (4, True), (6, False)))
+    assert result.title == "Played 3, won 67%, streak 0 (best 2)"
+    assert result.sub.startswith("Wins by guesses: 1:0 2:0 3:1 4:1 5:0 6:0,")
+
+
+def test_stats_result_shows_long_games() -> None:
+    result = StatsResult(stats((8, True)))
+    assert result.sub.startswith("Wins by guesses: 1:0 2:0 3:0 4:0 5:0 6:0 7:0 8:1,")
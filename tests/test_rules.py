@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pytest
+
+from wordle import CharStatus
+from wordle.rules import HardModeRules
+
+G, Y, B = CharStatus.green, CharStatus.yellow, CharStatus.black
+
+
+def rules_after(*guesses: tuple[str, str]) -> HardModeRules:
+    rules = HardModeRules(5)
+    codes = {"g": G, "y": Y, "b": B}
+    for guess, statuses in guesses:
+        rules = rules.with_guess(guess, [codes[code] for code in statuses])
+    return rules
+
+
+# "babes" against "abbey": both b's and the a are revealed, the b and e in the
+# middle are green, and the first b and the a were yellow where they are.
+BABES = rules_after(("babes", "yyggb"))
+
+
+def test_allows_words_that_keep_everything() -> None:
+    assert BABES.violation("abbey") is None
+    assert BABES.allows("abbey")
+    # Letters that were never revealed can go anywhere.
+    assert BABES.violation("abbes") is None
+
+
+@pytest.mark.parametrize(
+    ("word", "reason"),
+    [
+        ("abzey", "Letter 3 has to be 'b'"),
+        ("abbqy", "Letter 4 has to be 'e'"),
+        ("babey", "Letter 1 can't be 'b', it was yellow there"),
+        ("xabey", "Letter 2 can't be 'a', it was yellow there"),
+        ("xybey", "The guess has to contain 'a'"),
+        ("axbey", "The guess has to contain 2 of 'b'"),
+    ],
+)
+def test_violations(word: str, reason: str) -> None:
+    assert BABES.violation(word) == reason
+    assert not BABES.allows(word)
+
+
+def test_min_counts_keep_the_most_of_a_single_guess() -> None:
+    # One e per guess was revealed, so one e is enough, not two.
+    rules = rules_after(("speed", "bbgbb"), ("eerie", "ybbbb"))
+    assert rules.min_counts == (("e", 1),)
+    assert rules.violation("abend") is None
+    assert rules.violation("ebbed") == "Letter 1 can't be 'e', it was yellow there"
+
+
+def test_black_copies_add_nothing() -> None:
+    # The second e was black, so only one e is required.
+    rules = rules_after(("geese", "bgbbb"))
+    assert rules.min_counts == (("e", 1),)
+    assert rules.violation("xexxx") is None
+
+
+@pytest.mark.parametrize(
+    ("prefix", "reason"),
+    [
+        ("", None),
+        ("a", None),
+        ("abbe", None),
+        ("x", None),
+        ("b", "Letter 1 can't be 'b', it was yellow there"),
+        ("abc", "Letter 3 has to be 'b'"),
+        # Only one free position is left, but an a and another b are needed.
+        ("xxb", "The guess has to contain 2 of 'b'"),
+        ("xbb", None),
+        ("xyb", "The guess has to contain 2 of 'b'"),
+    ],
+)
+def test_prefix_violations(prefix: str, reason: str | None) -> None:
+    assert BABES.prefix_violation(prefix) == reason
+    assert BABES.allows_prefix(prefix) == (reason is None)
+
+
+def test_prefixes_of_allowed_words_are_allowed() -> None:
+    for end in range(6):
+        assert BABES.prefix_violation("abbey"[:end]) is None
+
+
+def test_rules_are_values() -> None:
+    assert rules_after(("babes", "yyggb")) == BABES
+    assert hash(rules_after(("babes", "yyggb"))) == hash(BABES)
+    assert rules_after(("babes", "yygbb")) != BABES
+    assert HardModeRules(5) == rules_after()
+    with pytest.raises(ValueError):
+        HardModeRules(5, greens=(None,) * 4)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from wordle import WordleGame
+from wordle_plugin.sessions import GameManager
+
+
+def keys(manager: GameManager) -> list[str]:
+    return [session.key for session in manager]
+
+
+def test_least_recently_used_is_evicted() -> None:
+    manager = GameManager(capacity=2)
+    a = manager.get("a")
+    manager.get("b")
+    assert manager.get("a") is a
+    manager.get("c")
+    assert keys(manager) == ["a", "c"]
+    assert "b" not in manager
+    assert manager.peek("b") is None
+
+
+def test_loader_brings_games_back() -> None:
+    loaded: list[str] = []
+
+    def loader(key: str) -> WordleGame | None:
+        loaded.append(key)
+        return WordleGame("abbey") if key == "saved" else None
+
+    manager = GameManager(capacity=1, loader=loader)
+    assert manager.get("saved").game is not None
+    assert manager.get("new").game is None
+    assert manager.get("saved").game is not None
+    assert loaded == ["saved", "new", "saved"]
+    # Sessions in memory are never loaded again.
+    manager.get("saved")
+    assert loaded == ["saved", "new", "saved"]
+
+
+def test_locked_sessions_are_kept() -> None:
+    async def main() -> None:
+        manager = GameManager(capacity=2)
+        busy = manager.get("busy")
+        async with busy.lock:
+            manager.get("b")
+            manager.get("c")
+            assert keys(manager) == ["busy", "c"]
+
+            # With every older session busy, the manager goes over its capacity
+            # for a while instead of dropping a game that is in use.
+            async with manager.get("c").lock:
+                manager.get("d")
+                assert keys(manager) == ["busy", "c", "d"]
+
+        manager.get("e")
+        assert keys(manager) == ["d", "e"]
+
+    asyncio.run(main())
+
+
+def test_discard_and_clear() -> None:
+    manager = GameManager(capacity=3)
+    session = manager.get("a")
+    manager.get("b")
+    assert manager.discard("a") is session
+    assert manager.discard("a") is None
+    assert len(manager) == 1
+    manager.clear()
+    assert len(manager) == 0
+
+
+def test_capacity_has_to_be_positive() -> None:
+    with pytest.raises(ValueError):
+        GameManager(capacity=0)
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from wordle import (
+    DictionaryNotFound,
+    WordDictionary,
+    WordleGame,
+    WordListLibrary,
+    dump_snapshot,
+    load_snapshot,
+    read_snapshot,
+    write_snapshot,
+)
+from wordle.snapshot import HEADER
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+WORDS = WordDictionary(
+    ["abbey", "babes", "kebab", "crane", "slate", "trace", "bloat", "sight"]
+)
+
+
+def make_game(word: str = "abbey", **options: bool) -> WordleGame:
+    game = WordleGame(word, valid_words=WORDS, **options)
+    game.guess("crane")
+    game.guess("babes")
+    return game
+
+
+def assert_same_game(loaded: WordleGame, game: WordleGame) -> None:
+    assert loaded.word == game.word
+    assert list(loaded.past_guess_words) == list(game.past_guess_words)
+    assert loaded.all_chars() == game.all_chars()
+    assert loaded.amount_of_guesses == game.amount_of_guesses
+    assert loaded.hard_mode == game.hard_mode
+    assert loaded.started_at == game.started_at
+    assert list(loaded.candidate_indices) == list(game.candidate_indices)
+
+
+@pytest.mark.parametrize("hard_mode", [False, True])
+def test_round_trip(hard_mode: bool) -> None:
+    game = make_game(hard_mode=hard_mode)
+    loaded = load_snapshot(dump_snapshot(game), valid_words=WORDS)
+    assert isinstance(loaded, WordleGame)
+    assert_same_game(loaded, game)
+
+
+def test_round_trip_word_outside_the_list() -> None:
+    game = make_game("zesty")
+    loaded = load_snapshot(dump_snapshot(game), valid_words=WORDS)
+    assert isinstance(loaded, WordleGame)
+    assert_same_game(loaded, game)
+
+
+def test_round_trip_guess_outside_the_list() -> None:
+    game = make_game("zesty")
+    game.guess("zesty")
+    loaded = load_snapshot(dump_snapshot(game), valid_words=WORDS)
+    assert isinstance(loaded, WordleGame)
+    assert_same_game(loaded, game)
+
+
+def test_round_trip_new_game() -> None:
+    game = WordleGame("kebab", valid_words=WORDS, amount_of_guesses=8)
+    loaded = load_snapshot(dump_snapshot(game), valid_words=WORDS)
+    assert isinstance(loaded, WordleGame)
+    assert_same_game(loaded, game)
+
+
+def test_file_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "game.bin"
+    assert read_snapshot(path, valid_words=WORDS) is None
+
+    game = make_game()
+    write_snapshot(path, dump_snapshot(game))
+    loaded = read_snapshot(path, valid_words=WORDS)
+    assert isinstance(loaded, WordleGame)
+    assert_same_game(loaded, game)
+
+    write_snapshot(path, None)
+    assert not path.exists()
+
+
+def corrupt(data: bytes, offset: int, value: int) -> bytes:
+    return data[:offset] + bytes([value]) + data[offset + 1 :]
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        pytest.param(lambda data: data[: HEADER.size - 1], id="truncated header"),
+        pytest.param(lambda data: data[:-1], id="truncated guesses"),
+        pytest.param(lambda data: b"XXXX" + data[4:], id="bad magic"),
+        pytest.param(lambda data: corrupt(data, 4, 99), id="unknown version"),
+        # The last guess index, pointing past the end of the list.
+        pytest.param(lambda data: data[:-4] + b"\xfe\xff\xff\xff", id="bad index"),
+        # The black letter mask no longer matches the guesses.
+        pytest.param(
+            lambda data: corrupt(data, HEADER.size, data[HEADER.size] ^ 1),
+            id="bad letter state",
+        ),
+    ],
+)
+def test_corrupt_snapshots_raise_value_error(damage: Callable[[bytes], bytes]) -> None:
+    data = damage(dump_snapshot(make_game()))
+    with pytest.raises(ValueError):
+        load_snapshot(data, valid_words=WORDS)
+
+
+def test_different_word_list() -> None:
+    data = dump_snapshot(make_game())
+    other = WordDictionary([*WORDS, "dumpy"])
+    with pytest.raises(ValueError):
+        load_snapshot(data, valid_words=other)
+
+
+def make_library(directory: Path) -> WordListLibrary:
+    (directory / "short.txt").write_text("\n".join(WORDS))
+    return WordListLibrary(directory)
+
+
+def test_round_trip_through_the_library(tmp_path: Path) -> None:
+    library = make_library(tmp_path)
+    words = library.get("short")
+    game = WordleGame("abbey", valid_words=words)
+    game.guess("crane")
+    data = dump_snapshot(game, library.name_of(words) or "")
+
+    # The snapshot's dictionary wins over the one in the options.
+    loaded = load_snapshot(data, library=library, valid_words=["zesty"])
+    assert isinstance(loaded, WordleGame)
+    assert loaded.valid_words is words
+    assert_same_game(loaded, game)
+
+    (tmp_path / "short.txt").unlink()
+    with pytest.raises(DictionaryNotFound):
+        load_snapshot(data, library=WordListLibrary(tmp_path))
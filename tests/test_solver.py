@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import wordle.solver
+from wordle import WordDictionary
+from wordle.solver import Solver
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+WORDS = WordDictionary(
+    ["abbey", "babes", "kebab", "crane", "slate", "trace", "bloat", "sight"]
+)
+
+
+def test_first_turn_never_builds_openers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(wordle.solver, "DEFAULT_CACHE_DIR", tmp_path)
+    solver = Solver(WORDS)
+
+    hints = solver.rank(None, 3)
+    assert len(hints) == 3
+    assert not solver.has_openers
+    assert not list(tmp_path.iterdir())
+
+    built = solver.openers(3)
+    assert solver.has_openers
+    assert [hint.word for hint in solver.rank(None, 3)] == [hint.word for hint in built]
+    assert Solver(WORDS).openers(3, build=False)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from wordle import CharStatus, WordleGame
+from wordle.state import LetterState, letter_bit, letter_mask, mask_letters
+
+G, Y, B = CharStatus.green, CharStatus.yellow, CharStatus.black
+
+
+def allows_at(state: LetterState, idx: int, char: str) -> bool:
+    return bool(state.allowed[idx] & letter_bit(char))
+
+
+def test_masks() -> None:
+    assert letter_mask("abz") == letter_bit("a") | letter_bit("b") | letter_bit("z")
+    assert mask_letters(letter_mask("zebra")) == ("a", "b", "e", "r", "z")
+    assert mask_letters(0) == ()
+
+
+def test_yellow_and_black_copy() -> None:
+    # "speed" against "abide": the word has one e, so the second copy is black.
+    state = LetterState(5).with_guess("speed", [B, B, Y, B, Y])
+    assert state.char_status("e") is CharStatus.yellow
+    assert state.black == letter_mask("sp")
+    assert state.yellow == letter_mask("ed")
+    # Neither scored position can be an e, but the others still can.
+    assert not allows_at(state, 2, "e")
+    assert not allows_at(state, 3, "e")
+    assert allows_at(state, 0, "e")
+    assert not allows_at(state, 4, "d")
+    assert not any(allows_at(state, idx, "s") for idx in range(5))
+
+
+def test_green_and_black_copy() -> None:
+    # "geese" against "those": one e, in the last position.
+    state = LetterState(5).with_guess("geese", [B, B, B, G, G])
+    assert state.char_status("e") is CharStatus.green
+    assert state.black == letter_mask("g")
+    assert state.status() == [None, None, None, "s", "e"]
+    assert not allows_at(state, 1, "e")
+    assert not allows_at(state, 2, "e")
+    assert state.allowed[4] == letter_bit("e")
+
+
+def test_every_copy_black() -> None:
+    state = LetterState(5).with_guess("crane", [G, B, B, B, B])
+    state = state.with_guess("cheek", [G, B, B, B, B])
+    assert state.char_status("e") is CharStatus.black
+    assert state.status() == ["c", None, None, None, None]
+    assert state.allowed[0] == letter_bit("c")
+    assert not any(allows_at(state, idx, "e") for idx in range(1, 5))
+    assert state.allows("clout")
+    assert not state.allows("clues")
+    assert not state.allows("cloud!")
+
+
+def test_states_are_immutable_values() -> None:
+    start = LetterState(5)
+    state = start.with_guess("speed", [B, B, Y, B, Y])
+    assert start == LetterState(5)
+    assert state != start
+    assert state == LetterState(5).with_guess("speed", [B, B, Y, B, Y])
+    assert hash(state) == hash(LetterState(5).with_guess("speed", [B, B, Y, B, Y]))
+    assert {state: 1}[LetterState(5).with_guess("speed", [B, B, Y, B, Y])] == 1
+
+
+def test_game_tracks_repeated_letters() -> None:
+    game = WordleGame("abbey", valid_words=["abbey", "babes", "kebab"])
+    game.guess("kebab")
+    # k black, e yellow, b green, a yellow and the last b yellow, as the word has
+    # a second b.
+    assert game.all_chars() == {
+        "k": CharStatus.black,
+        "e": CharStatus.yellow,
+        "b": CharStatus.green,
+        "a": CharStatus.yellow,
+    }
+    assert game.status() == [None, None, "b", None, None]
+    assert game.letter_state.allows("abbey")
+    assert not game.letter_state.allows("kebab")
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from wordle import GameRecord, StatsLog
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def record(
+    guesses: int, *, won: bool = True, finished_at: float = 1000.0
+) -> GameRecord:
+    return GameRecord("abbey", ["crane"] * guesses, won, 30.0, finished_at)
+
+
+def test_empty_log(tmp_path: Path) -> None:
+    log = StatsLog(tmp_path / "stats.bin")
+    assert len(log) == 0
+    assert list(log) == []
+    assert log.stats.games == 0
+    assert log.stats.win_rate == 0.0
+
+
+def test_append_and_reopen(tmp_path: Path) -> None:
+    path = tmp_path / "stats.bin"
+    log = StatsLog(path)
+    log.append(record(3))
+    log.append(record(4))
+    log.append(record(6, won=False))
+    log.append(record(2))
+
+    for opened in (log, StatsLog(path)):
+        stats = opened.stats
+        assert len(opened) == 4
+        assert (stats.games, stats.wins, stats.losses) == (4, 3, 1)
+        assert (stats.current_streak, stats.max_streak) == (1, 2)
+        assert stats.distribution[:6] == [0, 1, 1, 1, 0, 0]
+        assert stats.total_duration == pytest.approx(120.0)
+        assert [len(item.guesses) for item in opened] == [3, 4, 6, 2]
+
+
+def test_only_losses(tmp_path: Path) -> None:
+    log = StatsLog(tmp_path / "stats.bin")
+    log.extend([record(6, won=False), record(6, won=False)])
+    stats = StatsLog(log.path).stats
+    assert (stats.games, stats.wins, stats.current_streak) == (2, 0, 0)
+    assert not any(stats.distribution)
+
+
+def test_recovers_records_appended_after_the_header(tmp_path: Path) -> None:
+    path = tmp_path / "stats.bin"
+    StatsLog(path).append(record(3))
+
+    # A process that died after appending, before it rewrote the header, plus
+    # half of a record it was still writing.
+    with open(path, "ab") as f:
+        f.write(record(5).to_bytes())
+        f.write(record(2).to_bytes()[:7])
+
+    log = StatsLog(path)
+    assert len(log) == 2
+    assert log.stats.wins == 2
+    assert [len(item.guesses) for item in log] == [3, 5]
+    # The torn record is cut off, so the next append lands after the last good one.
+    log.append(record(4))
+    assert [len(item.guesses) for item in StatsLog(path)] == [3, 5, 4]
+
+
+def test_compact_keeps_the_aggregates(tmp_path: Path) -> None:
+    path = tmp_path / "stats.bin"
+    log = StatsLog(path)
+    log.extend(record(guesses) for guesses in (1, 2, 3, 4, 5))
+    size = path.stat().st_size
+
+    log.compact(keep=2)
+    assert path.stat().st_size < size
+    for opened in (log, StatsLog(path)):
+        assert len(opened) == 2
+        assert opened.stats.games == 5
+        assert [len(item.guesses) for item in opened] == [4, 5]
+
+    log.compact(keep=0)
+    assert list(StatsLog(path)) == []
+    assert StatsLog(path).stats.wins == 5
+
+
+def test_json_round_trip(tmp_path: Path) -> None:
+    log = StatsLog(tmp_path / "stats.bin")
+    log.extend([record(3, finished_at=1.5), record(6, won=False, finished_at=2.5)])
+    assert log.export_json(tmp_path / "stats.json") == 2
+
+    other = StatsLog(tmp_path / "other.bin")
+    assert other.import_json(tmp_path / "stats.json") == 2
+    assert [item.to_json() for item in other] == [item.to_json() for item in log]
+    assert other.stats.wins == 1
+
+
+def test_rejects_other_files(tmp_path: Path) -> None:
+    path = tmp_path / "stats.bin"
+    path.write_bytes(b"not a stats file" * 20)
+    with pytest.raises(ValueError):
+        StatsLog(path)
+
+    path.write_bytes(b"WSTA")
+    with pytest.raises(ValueError):
+        StatsLog(path)
+
+
+def test_record_validates_guess_length() -> None:
+    with pytest.raises(ValueError):
+        GameRecord("abbey", ["cranes"], True, 1.0)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import pytest
+
+from wordle.utils import IndexableDict, SequenceProxy
+
+
+def test_list_is_read_through() -> None:
+    items = ["a", "b"]
+    proxy = SequenceProxy(items)
+    items.append("c")
+    assert proxy[-1] == "c"
+    assert list(proxy) == ["a", "b", "c"]
+
+
+def test_set_snapshot_follows_growth() -> None:
+    items = {"b", "a"}
+    proxy = SequenceProxy(items, sorted=True)
+    assert proxy[0] == "a"
+
+    items.add("c")
+    assert len(proxy) == 3
+    assert proxy[len(proxy) - 1] == "c"
+    assert proxy[:] == ["a", "b", "c"]
+
+    items.discard("a")
+    assert proxy[0] == "b"
+    assert proxy.index("c") == 1
+
+
+def test_unsorted_set_snapshot_follows_growth() -> None:
+    items = {"a"}
+    proxy = SequenceProxy(items)
+    assert proxy[0] == "a"
+
+    items.add("b")
+    assert sorted(proxy[idx] for idx in range(len(proxy))) == ["a", "b"]
+
+
+def test_read_only() -> None:
+    proxy = SequenceProxy(["a"])
+    with pytest.raises(TypeError):
+        proxy[0] = "b"  # pyright: ignore[reportIndexIssue]
+
+
+def make() -> IndexableDict[str, int]:
+    return IndexableDict(("a", 1), ("b", 2), ("c", 3), ("d", 4))
+
+
+def test_indexable_dict_lookups() -> None:
+    data = make()
+    assert len(data) == 4
+    assert data["c"] == 3
+    assert data[2] == ("c", 3)
+    assert data[-1] == ("d", 4)
+    assert data.index("d") == 3
+    assert data.get("z") is None
+    assert data.get(9, "missing") == "missing"
+    assert "a" in data
+    assert "z" not in data
+    assert ["a"] not in data
+    with pytest.raises(KeyError):
+        data["z"]
+    with pytest.raises(IndexError):
+        data[4]
+    with pytest.raises(ValueError):
+        data.index("z")
+
+
+@pytest.mark.parametrize("key", ["b", 1, -3])
+def test_indexable_dict_delete_reindexes(key: str | int) -> None:
+    data = make()
+    del data[key]
+    assert list(data.items()) == [("a", 1), ("c", 3), ("d", 4)]
+    # Every entry after the deleted one moved down a position.
+    assert [data.index(k) for k in data] == [0, 1, 2]
+    assert data[1] == ("c", 3)
+    assert "b" not in data
+
+    data["b"] = 5
+    assert data.index("b") == 3
+    assert data[-1] == ("b", 5)
+
+
+def test_indexable_dict_delete_missing() -> None:
+    data = make()
+    with pytest.raises(KeyError):
+        del data["z"]
+    with pytest.raises(IndexError):
+        del data[4]
+    assert len(data) == 4
+
+
+def test_indexable_dict_pop() -> None:
+    data = make()
+    assert data.pop("a") == 1
+    assert data.pop(0) == ("b", 2)
+    assert data.pop("z", 0) == 0
+    assert list(data.items()) == [("c", 3), ("d", 4)]
+    assert data.index("d") == 1
+
+
+def test_indexable_dict_set_by_position() -> None:
+    data = make()
+    data[1] = ("z", 9)
+    assert list(data.keys) == ["a", "z", "c", "d"]
+    assert data.index("z") == 1
+    assert "b" not in data
+    with pytest.raises(KeyError):
+        data[0] = ("c", 0)
+
+    data["a"] = 0
+    assert data[0] == ("a", 0)
+
+
+def test_indexable_dict_equality() -> None:
+    assert make() == make()
+    assert make() != IndexableDict(("a", 1), ("b", 2))
+    # Order matters, like it does for the positions.
+    assert make() != IndexableDict(("b", 2), ("a", 1), ("c", 3), ("d", 4))
+    assert make() != {"a": 1, "b": 2, "c": 3, "d": 4}
+    with pytest.raises(TypeError):
+        hash(make())
@@ -1,4 +1,13 @@
 from . import utils as utils
+from .compiled import *
+from .daily import *
+from .dictionary import *
 from .enums import *
 from .errors import *
 from .game import *
+from .library import *
+from .multi import *
+from .rules import *
+from .snapshot import *
+from .state import *
+from .stats import *
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .enums import CharStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = (
+    "decode_pattern",
+    "encode_pattern",
+    "pattern_code",
+    "solved_pattern",
+)
+
+# Each position is a base-3 digit (black=0, yellow=1, green=2), with position 0
+# being the least significant digit.
+DIGITS = {CharStatus.black: 0, CharStatus.yellow: 1, CharStatus.green: 2}
+STATUSES = (CharStatus.black, CharStatus.yellow, CharStatus.green)
+
+
+def solved_pattern(length: int) -> int:
+    return 3**length - 1
+
+
+def encode_pattern(statuses: Iterable[CharStatus]) -> int:
+    return sum(DIGITS[status] * 3**idx for idx, status in enumerate(statuses))
+
+
+def decode_pattern(code: int, length: int) -> tuple[CharStatus, ...]:
+    statuses: list[CharStatus] = []
+    for _ in range(length):
+        code, digit = divmod(int(code), 3)
+        statuses.append(STATUSES[digit])
+    return tuple(statuses)
+
+
+def pattern_code(guess: str, answer: str) -> int:
+    if len(guess) != len(answer):
+        raise ValueError("guess and answer must have the same length")
+
+    digits = [0] * len(guess)
+    remaining: dict[str, int] = {}
+    for idx, (gchar, achar) in enumerate(zip(guess, answer)):
+        if gchar == achar:
+            digits[idx] = 2
+        else:
+            remaining[achar] = remaining.get(achar, 0) + 1
+
+    for idx, gchar in enumerate(guess):
+        if digits[idx] == 0 and remaining.get(gchar, 0) > 0:
+            digits[idx] = 1
+            remaining[gchar] -= 1
+
+    return sum(digit * 3**idx for idx, digit in enumerate(digits))
@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import mmap
+import random
+import struct
+import sys
+import threading
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, SupportsIndex, overload
+
+from .dictionary import DEFAULT_WORD_LIST, WordDictionary, WordList
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from os import PathLike
+
+__all__ = (
+    "DEFAULT_COMPILED_WORD_LIST",
+    "CompiledWordList",
+    "compile_word_list",
+    "load_compiled_words",
+    "unload_compiled_words",
+)
+
+DEFAULT_COMPILED_WORD_LIST = DEFAULT_WORD_LIST.with_suffix(".bin")
+
+# File layout (little endian):
+#   header:  magic, version, bucket count, source size, source crc32
+#   buckets: (word length, word count, byte offset of the first record)
+#   records: fixed width ascii words, sorted, grouped by length
+MAGIC = b"WRDL"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQI")
+BUCKET = struct.Struct("<HxxII")
+
+_loaded: dict[Path, tuple[tuple[int, int], CompiledWordList]] = {}
+_source_crcs: dict[Path, tuple[tuple[int, int], int]] = {}
+_load_lock = threading.Lock()
+
+
+class _Bucket:
+    __slots__ = ("count", "length", "offset", "start")
+
+    def __init__(self, length: int, count: int, offset: int, start: int) -> None:
+        self.length = length
+        self.count = count
+        self.offset = offset
+        self.start = start
+
+
+class CompiledWordList(WordList):
+    __slots__ = (
+        "__buckets",
+        "__buffer",
+        "__by_length",
+        "__length",
+        "__weakref__",
+        "source_crc",
+        "source_size",
+    )
+
+    def __init__(
+        self,
+        buffer: mmap.mmap | bytes,
+        *,
+        _buckets: list[_Bucket] | None = None,
+        _source: tuple[int, int] = (0, 0),
+    ) -> None:
+        self.__buffer = buffer
+
+        if _buckets is None:
+            magic, version, bucket_count, source_size, source_crc = HEADER.unpack_from(
+                buffer
+            )
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("Not a compiled word list, or an unsupported version")
+
+            _buckets = []
+            start = 0
+            for idx in range(bucket_count):
+                length, count, offset = BUCKET.unpack_from(
+                    buffer, HEADER.size + idx * BUCKET.size
+                )
+                _buckets.append(_Bucket(length, count, offset, start))
+                start += count
+            _source = source_size, source_crc
+
+        self.__buckets: list[_Bucket] = _buckets
+        self.__length: int = sum(bucket.count for bucket in _buckets)
+        self.__by_length: dict[int, CompiledWordList] = {}
+        self.source_size, self.source_crc = _source
+
+    @classmethod
+    def open(cls, path: str | PathLike[str]) -> CompiledWordList:
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer)
+
+    def close(self) -> None:
+        if isinstance(self.__buffer, mmap.mmap):
+            self.__buffer.close()
+
+    @property
+    def buffer(self) -> mmap.mmap | bytes:
+        return self.__buffer
+
+    @property
+    def lengths(self) -> tuple[int, ...]:
+        return tuple(bucket.length for bucket in self.__buckets)
+
+    def with_length(self, length: int, /) -> CompiledWordList:
+        # The same list is returned for a length every time, so anything cached per
+        # word list, like solvers, is shared between games of that length.
+        words = self.__by_length.get(length)
+        if words is not None:
+            return words
+
+        buckets = [bucket for bucket in self.__buckets if bucket.length == length]
+        if len(buckets) == len(self.__buckets):
+            words = self
+        else:
+            if buckets:
+                buckets = [_Bucket(length, buckets[0].count, buckets[0].offset, 0)]
+            words = CompiledWordList(
+                self.__buffer,
+                _buckets=buckets,
+                _source=(self.source_size, self.source_crc),
+            )
+        self.__by_length[length] = words
+        return words
+
+    def record_view(self, length: int) -> memoryview:
+        for bucket in self.__buckets:
+            if bucket.length == length:
+                end = bucket.offset + bucket.count * length
+                return memoryview(self.__buffer)[bucket.offset : end]
+        return memoryview(b"")
+
+    def __bucket_for_index(self, idx: int) -> _Bucket:
+        for bucket in self.__buckets:
+            if idx < bucket.start + bucket.count:
+                return bucket
+        raise IndexError("index out of range")
+
+    def __record(self, bucket: _Bucket, idx: int) -> bytes:
+        start = bucket.offset + idx * bucket.length
+        return self.__buffer[start : start + bucket.length]
+
+    def __search(self, word: str) -> int:
+        try:
+            target = word.encode("ascii")
+        except (AttributeError, UnicodeEncodeError):
+            return -1
+
+        for bucket in self.__buckets:
+            if bucket.length != len(target):
+                continue
+
+            lo, hi = 0, bucket.count
+            while lo < hi:
+                mid = (lo + hi) // 2
+                record = self.__record(bucket, mid)
+                if record < target:
+                    lo = mid + 1
+                elif record > target:
+                    hi = mid
+                else:
+                    return bucket.start + mid
+        return -1
+
+    def random_word(self, rng: random.Random | None = None) -> str:
+        return self[(rng or random).randrange(self.__length)]
+
+    def index(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        idx = self.__search(value)
+        if idx == -1 or idx < start or (stop is not None and idx >= stop):
+            raise ValueError(f"{value!r} is not in the dictionary")
+        return idx
+
+    def count(self, value: Any) -> int:
+        return int(value in self)
+
+    def __contains__(self, item: object) -> bool:
+        return isinstance(item, str) and self.__search(item) != -1
+
+    def __len__(self) -> int:
+        return self.__length
+
+    @overload
+    def __getitem__(self, idx: SupportsIndex) -> str: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[str]: ...
+
+    def __getitem__(self, idx: SupportsIndex | slice) -> str | list[str]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self.__length))]
+
+        idx = idx.__index__()
+        if idx < 0:
+            idx += self.__length
+        if not 0 <= idx < self.__length:
+            raise IndexError("index out of range")
+
+        bucket = self.__bucket_for_index(idx)
+        return self.__record(bucket, idx - bucket.start).decode("ascii")
+
+    def __iter__(self) -> Iterator[str]:
+        for bucket in self.__buckets:
+            for idx in range(bucket.count):
+                yield self.__record(bucket, idx).decode("ascii")
+
+    def __repr__(self) -> str:
+        return f"<CompiledWordList words={self.__length} lengths={self.lengths!r}>"
+
+
+def compile_word_list(
+    source: str | PathLike[str] = DEFAULT_WORD_LIST,
+    dest: str | PathLike[str] | None = None,
+) -> Path:
+    source = Path(source)
+    dest = Path(dest) if dest is not None else source.with_suffix(".bin")
+
+    raw = source.read_bytes()
+    words = WordDictionary(raw.decode("UTF-8").split())
+    if not all(word.isascii() for word in words):
+        raise ValueError("Compiled word lists only support ascii words")
+
+    buckets = [(length, len(words.with_length(length))) for length in words.lengths]
+
+    offset = HEADER.size + BUCKET.size * len(buckets)
+    parts = [HEADER.pack(MAGIC, VERSION, len(buckets), len(raw), zlib.crc32(raw))]
+    for length, count in buckets:
+        parts.append(BUCKET.pack(length, count, offset))
+        offset += length * count
+    parts.extend(word.encode("ascii") for word in words)
+
+    tmp = dest.with_name(dest.name + ".tmp")
+    tmp.write_bytes(b"".join(parts))
+    tmp.replace(dest)
+    return dest
+
+
+def _is_fresh(words: CompiledWordList, source: Path) -> bool:
+    try:
+        stat = source.stat()
+    except FileNotFoundError:
+        return True
+    if stat.st_size != words.source_size:
+        return False
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _source_crcs.get(source)
+    if cached is None or cached[0] != key:
+        cached = key, zlib.crc32(source.read_bytes())
+        _source_crcs[source] = cached
+    return cached[1] == words.source_crc
+
+
+def load_compiled_words(
+    path: str | PathLike[str] | None = None,
+    *,
+    source: str | PathLike[str] | None = DEFAULT_WORD_LIST,
+    cache: bool = True,
+) -> CompiledWordList | None:
+    # Returns None when there is no usable compiled list, so callers can fall back
+    # to the text list. A compiled list that no longer matches its source is ignored.
+    # Without `cache`, the list is opened without keeping it.
+    path = Path(path or DEFAULT_COMPILED_WORD_LIST).resolve()
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _loaded.get(path) if cache else None
+    if cached is not None and cached[0] == key:
+        words = cached[1]
+    elif not cache:
+        try:
+            words = CompiledWordList.open(path)
+        except (ValueError, struct.error):
+            return None
+    else:
+        with _load_lock:
+            cached = _loaded.get(path)
+            if cached is not None and cached[0] == key:
+                words = cached[1]
+            else:
+                try:
+                    words = CompiledWordList.open(path)
+                except (ValueError, struct.error):
+                    return None
+                _loaded[path] = key, words
+
+    if source is not None and not _is_fresh(words, Path(source).resolve()):
+        return None
+    return words
+
+
+def unload_compiled_words() -> int:
+    # Forgets every compiled list loaded so far, so the next load opens its file
+    # again. Games still using a list keep it alive.
+    with _load_lock:
+        count = len(_loaded)
+        _loaded.clear()
+        _source_crcs.clear()
+    return count
+
+
+if __name__ == "__main__":
+    out = compile_word_list(*sys.argv[1:3])
+    print(f"Wrote {out}")
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import datetime
+import hashlib
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .dictionary import WordList
+
+__all__ = ("DAILY_EPOCH", "DailySchedule")
+
+# The day of the first Wordle puzzle, which is puzzle 0.
+DAILY_EPOCH = datetime.date(2021, 6, 19)
+DEFAULT_SEED = "wordle"
+_MASK64 = (1 << 64) - 1
+
+
+def _splitmix64(state: int) -> tuple[int, int]:
+    # Returns the next state and its output. Written out instead of using `random`,
+    # so the schedule can never change with the Python version.
+    state = (state + 0x9E3779B97F4A7C15) & _MASK64
+    z = state
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return state, z ^ (z >> 31)
+
+
+def _permutation(size: int, seed: str) -> array[int]:
+    typecode = "H" if size <= 0xFFFF else "I"
+    order = array(typecode, range(size))
+    state = int.from_bytes(hashlib.blake2b(seed.encode(), digest_size=8).digest())
+    for idx in range(size - 1, 0, -1):
+        state, value = _splitmix64(state)
+        other = value % (idx + 1)
+        order[idx], order[other] = order[other], order[idx]
+    return order
+
+
+class DailySchedule:
+    # Maps every day to a word of `words` through a seeded shuffle, so everyone with
+    # the same word list and seed gets the same word without asking a server. Once
+    # every word had its day the schedule starts over in the same order.
+    #
+    # The shuffle and its inverse are computed once and kept as arrays of word
+    # indices, so the word of a day and the day of a word are both a lookup.
+    __slots__ = ("_days", "_order", "epoch", "seed", "words")
+
+    def __init__(
+        self,
+        words: WordList,
+        *,
+        seed: str = DEFAULT_SEED,
+        epoch: datetime.date = DAILY_EPOCH,
+    ) -> None:
+        if not words:
+            raise ValueError("A daily schedule needs at least one word")
+
+        self.words = words
+        self.seed = seed
+        self.epoch = epoch
+        # order[day] is the index of that day's word, days[word index] its first day.
+        self._order = _permutation(len(words), seed)
+        self._days = array(
+            self._order.typecode, bytes(self._order.itemsize * len(words))
+        )
+        for day, idx in enumerate(self._order):
+            self._days[idx] = day
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def number(self, date: datetime.date) -> int:
+        return (date - self.epoch).days
+
+    def date(self, number: int) -> datetime.date:
+        return self.epoch + datetime.timedelta(days=number)
+
+    def word(self, date: datetime.date | None = None) -> str:
+        number = self.number(date or datetime.date.today())
+        return self.words[self._order[number % len(self._order)]]
+
+    def last_date(
+        self, word: str, before: datetime.date | None = None
+    ) -> datetime.date | None:
+        # The most recent day up to `before` (today by default) with `word` as its
+        # puzzle, or None if it never was. Raises ValueError if `word` isn't in the
+        # word list.
+        first = self._days[self.words.index(word)]
+        number = self.number(before or datetime.date.today())
+        if number < first:
+            return None
+        return self.date(number - (number - first) % len(self._order))
+
+    def next_date(self, word: str, after: datetime.date | None = None) -> datetime.date:
+        # The first day from `after` (today by default) with `word` as its puzzle.
+        first = self._days[self.words.index(word)]
+        number = self.number(after or datetime.date.today())
+        return self.date(number + (first - number) % len(self._order))
+
+    def __repr__(self) -> str:
+        return f"<DailySchedule words={len(self)} seed={self.seed!r} epoch={self.epoch.isoformat()}>"
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import threading
+from abc import abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, SupportsIndex, overload
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+__all__ = (
+    "DEFAULT_WORD_LIST",
+    "WordDictionary",
+    "WordList",
+    "load_words",
+    "unload_words",
+)
+
+DEFAULT_WORD_LIST = Path(__file__).parent / "word_list.txt"
+
+_loaded: dict[Path, tuple[tuple[int, int], WordDictionary]] = {}
+_load_lock = threading.Lock()
+
+
+def _sort_key(word: str) -> tuple[int, str]:
+    return len(word), word
+
+
+class WordList(Sequence[str]):
+    # Words are ordered by (length, word) in every implementation, so an index into
+    # one word list means the same word in any other built from the same source.
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def lengths(self) -> tuple[int, ...]: ...
+
+    @abstractmethod
+    def with_length(self, length: int, /) -> WordList: ...
+
+
+class WordDictionary(WordList):
+    __slots__ = ("__by_length", "__index", "__weakref__", "__words")
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.__words: tuple[str, ...] = tuple(sorted(set(words), key=_sort_key))
+        self.__index: dict[str, int] = {
+            word: idx for idx, word in enumerate(self.__words)
+        }
+        self.__by_length: dict[int, WordDictionary] | None = None
+
+    @classmethod
+    def from_file(cls, path: str | PathLike[str]) -> WordDictionary:
+        return cls(Path(path).read_text("UTF-8").split())
+
+    @property
+    def words(self) -> tuple[str, ...]:
+        return self.__words
+
+    @property
+    def lengths(self) -> tuple[int, ...]:
+        return tuple(self.__length_index())
+
+    def __length_index(self) -> dict[int, WordDictionary]:
+        if self.__by_length is None:
+            buckets: dict[int, list[str]] = {}
+            for word in self.__words:
+                buckets.setdefault(len(word), []).append(word)
+
+            if len(buckets) == 1:
+                self.__by_length = dict.fromkeys(buckets, self)
+            else:
+                self.__by_length = {
+                    length: WordDictionary(bucket)
+                    for length, bucket in sorted(buckets.items())
+                }
+        return self.__by_length
+
+    def with_length(self, length: int, /) -> WordDictionary:
+        try:
+            return self.__length_index()[length]
+        except KeyError:
+            return WordDictionary(())
+
+    def index(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        try:
+            idx = self.__index[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"{value!r} is not in the dictionary") from None
+
+        if idx < start or (stop is not None and idx >= stop):
+            raise ValueError(f"{value!r} is not in the dictionary")
+        return idx
+
+    def count(self, value: Any) -> int:
+        return int(value in self)
+
+    def __contains__(self, item: object) -> bool:
+        try:
+            return item in self.__index
+        except TypeError:
+            return False
+
+    def __len__(self) -> int:
+        return len(self.__words)
+
+    @overload
+    def __getitem__(self, idx: SupportsIndex) -> str: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> tuple[str, ...]: ...
+
+    def __getitem__(self, idx: SupportsIndex | slice) -> str | tuple[str, ...]:
+        return self.__words[idx]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__words)
+
+    def __reversed__(self) -> Iterator[str]:
+        return reversed(self.__words)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, WordDictionary) and self.__words == other.__words
+
+    def __hash__(self) -> int:
+        return hash((WordDictionary, self.__words))
+
+    def __repr__(self) -> str:
+        return f"<WordDictionary words={len(self.__words)} lengths={self.lengths!r}>"
+
+
+def load_words(path: str | PathLike[str] | None = None) -> WordDictionary:
+    # Dictionaries are immutable, so a single instance per file is shared by every
+    # game in the process. The file is only re-read when its mtime or size changes.
+    path = Path(path or DEFAULT_WORD_LIST).resolve()
+    stat = path.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _loaded.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with _load_lock:
+        cached = _loaded.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        words = WordDictionary.from_file(path)
+        _loaded[path] = key, words
+        return words
+
+
+def unload_words() -> int:
+    # Forgets every dictionary loaded so far, so the next load reads its file again.
+    # Games still using a dictionary keep it alive.
+    with _load_lock:
+        count = len(_loaded)
+        _loaded.clear()
+    return count
@@ -1,8 +1,14 @@
+import datetime
+
 __all__ = (
+    "DailyPuzzlePlayed",
+    "DictionaryNotFound",
+    "HardModeViolation",
     "InvalidGuess",
     "InvalidGuessLength",
     "OutOfGuesses",
     "RepeatGuess",
+    "UnsupportedLength",
     "WordNotFound",
     "WordleException",
 )
@@ -44,6 +50,47 @@ class WordNotFound(InvalidGuess):
         )
 
 
+class HardModeViolation(InvalidGuess):
+    __slots__ = ("reason",)
+
+    def __init__(self, guess: str, reason: str) -> None:
+        super().__init__(f"{guess!r} breaks the hard mode rules: {reason}", guess)
+
+        self.reason = reason
+
+
 class OutOfGuesses(WordleException):
     def __init__(self) -> None:
         super().__init__("You ran out of guesses")
+
+
+class DictionaryNotFound(WordleException):
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        super().__init__(f"There is no dictionary called {name!r}")
+
+        self.name = name
+
+
+class DailyPuzzlePlayed(WordleException):
+    __slots__ = ("date",)
+
+    def __init__(self, date: datetime.date) -> None:
+        super().__init__(f"The puzzle of {date.isoformat()} was already played")
+
+        self.date = date
+
+
+class UnsupportedLength(WordleException):
+    __slots__ = ("available", "length")
+
+    def __init__(self, length: int, available: tuple[int, ...] = ()) -> None:
+        message = f"There are no {length} letter words to play with"
+        if available and length not in available:
+            lengths = ", ".join(map(str, available))
+            message += f", the word list only has {lengths} letter words"
+        super().__init__(message)
+
+        self.length = length
+        self.available = available
@@ -1,13 +1,33 @@
 from __future__ import annotations
 
 import random
-from pathlib import Path
-from typing import Literal, TypedDict, TypeVar, Unpack, overload
+import time
+from typing import TYPE_CHECKING, Literal, TypedDict, TypeVar, Unpack, overload
 
-from .enums import CharStatus
-from .errors import InvalidGuessLength, OutOfGuesses, RepeatGuess, WordNotFound
+from .codes import decode_pattern, pattern_code
+from .compiled import load_compiled_words
+from .dictionary import WordDictionary, WordList, load_words
+from .errors import (
+    HardModeViolation,
+    InvalidGuessLength,
+    OutOfGuesses,
+    RepeatGuess,
+    UnsupportedLength,
+    WordNotFound,
+)
+from .rules import HardModeRules
+from .state import LetterState, mask_letters
 from .utils import IndexableDict, SequenceProxy, cached_property
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy as np
+    import numpy.typing as npt
+
+    from .enums import CharStatus
+    from .prefix import PrefixIndex
+
 CHARS = "qwertyuiopasdghjklzxcvbnm"
 T = TypeVar("T")
 
@@ -16,7 +36,21 @@ __all__ = ("WordleGame",)
 
 class WordleOptions(TypedDict, total=False):
     amount_of_guesses: int
-    valid_words: list[str]
+    valid_words: WordList | Iterable[str]
+    # The length of the random word picked when no word is given.
+    word_length: int
+    # Every guess has to use what the earlier ones revealed, see HardModeRules.
+    hard_mode: bool
+
+
+def resolve_valid_words(options: WordleOptions) -> WordList:
+    if "valid_words" in options:
+        words = options["valid_words"]
+        if isinstance(words, WordList):
+            return words
+        return WordDictionary(words)
+
+    return load_compiled_words() or load_words()
 
 
 class WordleGame:
@@ -24,19 +58,76 @@ class WordleGame:
         self, word: str | None = None, **options: Unpack[WordleOptions]
     ) -> None:
         self.options = options
-        self.word = word or random.choice(self.valid_words)
+        if not word:
+            pool = self.valid_words
+            if "word_length" in options:
+                pool = pool.with_length(options["word_length"])
+            if not pool:
+                raise UnsupportedLength(
+                    options.get("word_length", 0), self.valid_words.lengths
+                )
+            word = random.choice(pool)
+        self.word = word
+        self.started_at = time.time()
 
         self._guesses: IndexableDict[str, list[tuple[str, CharStatus]]] = (
             IndexableDict()
         )
-        self._black_chars: set[str] = set()
-        self._yellow_chars: set[str] = set()
-        self._status: list[tuple[str, CharStatus | None]] = [
-            (char, None) for char in self.word
-        ]
+        self._state = LetterState(len(self.word))
+        self._rules = HardModeRules(len(self.word))
+        self._state_version: int = 0
+        self._patterns: list[tuple[str, int]] = []
+        # Views are made once per change of their collection instead of on every
+        # access, so rendering the game state doesn't copy anything.
+        self._black_view: SequenceProxy[str] = SequenceProxy(())
+        self._yellow_view: SequenceProxy[str] = SequenceProxy(())
+        self._past_guesses = self._guesses.values
+        self._candidates: npt.NDArray[np.intp] | None = None
+        self._narrowed: int = 0
+
+    @property
+    def state_version(self) -> int:
+        # Bumped whenever a guess changes the game, so renderers can cache
+        # anything derived from the game state.
+        return self._state_version
+
+    @property
+    def letter_state(self) -> LetterState:
+        return self._state
+
+    @property
+    def hard_mode(self) -> bool:
+        return self.options.get("hard_mode", False)
+
+    @property
+    def hard_mode_rules(self) -> HardModeRules:
+        # Kept up to date in every mode, but only enforced in hard mode.
+        return self._rules
+
+    @property
+    def hard_mode_indices(self) -> npt.NDArray[np.intp]:
+        # The words of the candidate pool the hard mode rules allow as the next guess,
+        # which never includes a word that was guessed already.
+        import numpy as np
+
+        array = self._pool_array
+        allowed = np.ones(len(array), dtype=bool)
+        for idx, (char, banned) in enumerate(
+            zip(self._rules.greens, self._rules.banned)
+        ):
+            if char is not None:
+                allowed &= array[:, idx] == ord(char)
+            for letter in mask_letters(banned):
+                allowed &= array[:, idx] != ord(letter)
+        for char, count in self._rules.min_counts:
+            allowed &= (array == ord(char)).sum(axis=1) >= count
+
+        pool = self.candidate_pool
+        allowed[[pool.index(word) for word in self._guesses if word in pool]] = False
+        return np.flatnonzero(allowed)
 
     def status(self, filler: T = None) -> list[str | T]:
-        return [filler if status is None else char for char, status in self._status]
+        return self._state.status(filler)
 
     @property
     def green_chars(self) -> list[str]:
@@ -44,39 +135,83 @@ class WordleGame:
 
     @property
     def black_chars(self) -> SequenceProxy[str]:
-        return SequenceProxy(self._black_chars)
+        return self._black_view
 
     @property
     def yellow_chars(self) -> SequenceProxy[str]:
-        return SequenceProxy(self._yellow_chars)
+        return self._yellow_view
 
     def all_chars(self) -> dict[str, CharStatus]:
-        return (
-            dict.fromkeys(self._black_chars, CharStatus.black)
-            | dict.fromkeys(self._yellow_chars, CharStatus.yellow)
-            | dict.fromkeys(self.green_chars, CharStatus.green)
-        )
+        return self._state.all_chars()
 
     @property
     def past_guesses(self) -> SequenceProxy[list[tuple[str, CharStatus]]]:
-        return self._guesses.values
+        return self._past_guesses
+
+    @property
+    def past_guess_words(self) -> SequenceProxy[str]:
+        return self._guesses.keys
 
     @property
     def amount_of_guesses(self) -> int:
         return self.options.get("amount_of_guesses", 6)
 
     @cached_property
-    def valid_words(self) -> list[str]:
-        if "valid_words" in self.options:
-            return self.options["valid_words"]
-
-        words_file = Path(__file__).parent / "word_list.txt"
-        return words_file.read_text("UTF-8").splitlines()
+    def valid_words(self) -> WordList:
+        return resolve_valid_words(self.options)
 
     @property
     def guess_length(self) -> int:
         return len(self.word)
 
+    @cached_property
+    def candidate_pool(self) -> WordList:
+        return self.valid_words.with_length(self.guess_length)
+
+    # NumPy takes a while to import, so the modules that need it are only imported
+    # once a game actually uses them. That keeps it off the plugin's startup path.
+    @cached_property
+    def prefix_index(self) -> PrefixIndex:
+        from .prefix import load_prefix_index
+
+        return load_prefix_index(self.candidate_pool)
+
+    @cached_property
+    def _pool_array(self) -> npt.NDArray[np.uint8]:
+        from .patterns import encode_words
+
+        return encode_words(self.candidate_pool, self.guess_length)
+
+    @property
+    def candidate_indices(self) -> npt.NDArray[np.intp]:
+        # Candidates are narrowed lazily, one pass per guess made since the last
+        # access, and each pass only scores the words that survived the previous one.
+        import numpy as np
+
+        from .patterns import score_patterns
+
+        if self._candidates is None:
+            self._candidates = np.arange(len(self.candidate_pool), dtype=np.intp)
+
+        for guess, code in self._patterns[self._narrowed :]:
+            candidates = self._candidates
+            patterns = score_patterns(guess, self._pool_array[candidates])
+            self._candidates = candidates[patterns == code]
+        self._narrowed = len(self._patterns)
+
+        view = self._candidates.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def remaining_candidates(self) -> list[str]:
+        pool = self.candidate_pool
+        return [pool[idx] for idx in self.candidate_indices]
+
+    @property
+    def remaining_candidate_count(self) -> int:
+        return len(self.candidate_indices)
+
     @property
     def remaining_guesses(self) -> int:
         return self.amount_of_guesses - len(self._guesses)
@@ -103,28 +238,18 @@ class WordleGame:
             if not raise_error:
                 return False
             raise WordNotFound(guess)
+        if self.hard_mode:
+            reason = self._rules.violation(guess)
+            if reason is not None:
+                if not raise_error:
+                    return False
+                raise HardModeViolation(guess, reason)
 
         return True
 
     def guess(self, guess: str) -> bool:
         self.validate_guess(guess, raise_error=True)
-        guess_data: list[tuple[str, CharStatus]] = []
-
-        for idx, char in enumerate(guess):
-            if self.word[idx] == char:
-                self._status[idx] = char, CharStatus.green
-                guess_data.append((char, CharStatus.green))
-            elif char in self.word:
-                guess_data.append((char, CharStatus.yellow))
-
-                for xchar, status in self._status:
-                    if xchar == char and status is not CharStatus.green:
-                        self._yellow_chars.add(char)
-            else:
-                guess_data.append((char, CharStatus.black))
-                self._black_chars.add(char)
-
-        self._guesses[guess] = guess_data
+        self._apply(guess)
 
         if guess == self.word:
             return True
@@ -133,3 +258,17 @@ class WordleGame:
             raise OutOfGuesses()
 
         return False
+
+    def _apply(self, guess: str) -> None:
+        code = pattern_code(guess, self.word)
+        statuses = decode_pattern(code, len(guess))
+        previous, self._state = self._state, self._state.with_guess(guess, statuses)
+        self._rules = self._rules.with_guess(guess, statuses)
+
+        self._guesses[guess] = list(zip(guess, statuses))
+        self._patterns.append((guess, code))
+        self._state_version += 1
+        if self._state.black != previous.black:
+            self._black_view = SequenceProxy(mask_letters(self._state.black))
+        if self._state.yellow != previous.yellow:
+            self._yellow_view = SequenceProxy(mask_letters(self._state.yellow))
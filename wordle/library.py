@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import re
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .compiled import load_compiled_words
+from .dictionary import DEFAULT_WORD_LIST, WordDictionary
+from .errors import DictionaryNotFound
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from .dictionary import WordList
+
+__all__ = ("DEFAULT_DICTIONARY", "MAX_LENGTH", "MIN_LENGTH", "WordListLibrary")
+
+DEFAULT_DICTIONARY = "default"
+MIN_LENGTH = 4
+MAX_LENGTH = 11
+# Letter states are bitmasks over a-z, so words with any other letters are left out
+# of the lists in the directory.
+_WORD = re.compile(rf"[a-z]{{{MIN_LENGTH},{MAX_LENGTH}}}")
+
+
+def _read_word_list(path: Path) -> WordList:
+    # The bundled list is shared with the games made without a library, instead of
+    # mapping its compiled file a second time.
+    if path == DEFAULT_WORD_LIST:
+        compiled = load_compiled_words()
+    else:
+        compiled = load_compiled_words(
+            path.with_suffix(".bin"), source=path, cache=False
+        )
+    if compiled is not None:
+        return compiled
+
+    words = WordDictionary(
+        word
+        for word in path.read_text("UTF-8").lower().split()
+        if _WORD.fullmatch(word)
+    )
+    # Indexed by length right away, so switching lengths later never has to.
+    _ = words.lengths
+    return words
+
+
+class WordListLibrary:
+    # Every .txt file in `directory` is a dictionary named after the file, next to
+    # the bundled list which is called "default". A compiled .bin of a list is used
+    # instead of the text whenever it is up to date.
+    #
+    # The `capacity` most recently used dictionaries are kept. Older ones are only
+    # kept alive by the games still using them, and are read again once nothing is.
+    def __init__(
+        self, directory: str | PathLike[str] | None = None, *, capacity: int = 2
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("The capacity has to be at least 1")
+
+        self.directory = None if directory is None else Path(directory)
+        self.capacity = capacity
+        self._recent: OrderedDict[str, WordList] = OrderedDict()
+        self._alive: weakref.WeakValueDictionary[str, WordList] = (
+            weakref.WeakValueDictionary()
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        names = {DEFAULT_DICTIONARY}
+        if self.directory is not None and self.directory.is_dir():
+            names.update(path.stem for path in self.directory.glob("*.txt"))
+        return tuple(sorted(names))
+
+    def source(self, name: str) -> Path:
+        # Names are file stems, and never paths out of the directory.
+        if self.directory is not None and Path(name).name == name:
+            path = self.directory / f"{name}.txt"
+            if path.is_file():
+                return path
+        if name == DEFAULT_DICTIONARY:
+            return DEFAULT_WORD_LIST
+        raise DictionaryNotFound(name)
+
+    def get(self, name: str) -> WordList:
+        with self._lock:
+            words = self._recent.get(name)
+            if words is not None:
+                self._recent.move_to_end(name)
+                return words
+
+            words = self._alive.get(name)
+            if words is None:
+                words = self._alive[name] = _read_word_list(self.source(name))
+
+            self._recent[name] = words
+            while len(self._recent) > self.capacity:
+                self._forget(self._recent.popitem(last=False)[1])
+            return words
+
+    def name_of(self, words: WordList) -> str | None:
+        # The name `words` was loaded with, or None if it didn't come from here.
+        with self._lock:
+            for name, loaded in self._alive.items():
+                if loaded is words:
+                    return name
+        return None
+
+    def get_length(self, name: str, length: int) -> WordList:
+        return self.get(name).with_length(length)
+
+    def evict(self, name: str) -> bool:
+        with self._lock:
+            words = self._recent.pop(name, None)
+            if words is None:
+                return False
+            self._forget(words)
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            while self._recent:
+                self._forget(self._recent.popitem()[1])
+
+    def _forget(self, words: WordList) -> None:
+        # The prefix indexes and pattern tables built over a dictionary are cached
+        # process wide, which would keep it alive forever. Those modules need NumPy,
+        # so they can only have anything cached if they were imported already.
+        pools = [words, *(words.with_length(length) for length in words.lengths)]
+        prefix = sys.modules.get(f"{__package__}.prefix")
+        if prefix is not None:
+            prefix.unload_prefix_indexes(pools)
+        pattern_table = sys.modules.get(f"{__package__}.pattern_table")
+        if pattern_table is not None:
+            pattern_table.unload_pattern_tables(pools)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and name in self.names
+
+    def __repr__(self) -> str:
+        return f"<WordListLibrary directory={self.directory!r} loaded={list(self._recent)!r}>"
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import random
+import time
+from typing import TYPE_CHECKING, Literal, Unpack, overload
+
+from .errors import (
+    InvalidGuessLength,
+    OutOfGuesses,
+    RepeatGuess,
+    UnsupportedLength,
+    WordNotFound,
+)
+from .game import resolve_valid_words
+from .state import letter_mask, mask_letters
+from .utils import SequenceProxy, cached_property
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+    import numpy.typing as npt
+
+    from .dictionary import WordList
+    from .game import WordleOptions
+    from .prefix import PrefixIndex
+
+__all__ = ("MAX_BOARDS", "MultiWordleGame")
+
+MAX_BOARDS = 32
+UNKNOWN = ord("_")
+
+
+class MultiWordleGame:
+    # Several boards with their own words, where every guess is made on all of them,
+    # like Quordle (4 boards) or Octordle (8 boards).
+    #
+    # Everything per board is kept in NumPy arrays with a row per board, so a guess
+    # is scored against every word in one pass and all boards are narrowed together,
+    # whether there are 2 boards or 32.
+    def __init__(
+        self,
+        words: Sequence[str] | None = None,
+        *,
+        boards: int = 4,
+        **options: Unpack[WordleOptions],
+    ) -> None:
+        import numpy as np
+
+        from .patterns import encode_words
+
+        self.options = options
+        if not words:
+            pool = self.valid_words
+            if "word_length" in options:
+                pool = pool.with_length(options["word_length"])
+            if len(pool) < boards:
+                raise UnsupportedLength(
+                    options.get("word_length", 0), self.valid_words.lengths
+                )
+            words = random.sample(pool, boards)
+
+        if not 1 <= len(words) <= MAX_BOARDS:
+            raise ValueError(f"Expected between 1 and {MAX_BOARDS} boards")
+        if len({len(word) for word in words}) != 1:
+            raise ValueError("Every board's word must have the same length")
+
+        self.words: tuple[str, ...] = tuple(words)
+        self.started_at = time.time()
+
+        self._targets = encode_words(self.words)
+        # known[board, position] is the letter found there, or UNKNOWN.
+        self._known = np.full(self._targets.shape, UNKNOWN, dtype=np.uint8)
+        # The guess number each board was solved with, or 0 while it isn't.
+        self._solved_at = np.zeros(len(self.words), dtype=np.intp)
+        self._guesses: list[str] = []
+        self._guess_view = SequenceProxy(self._guesses)
+        # One row of pattern codes per guess, with a column per board.
+        self._codes: list[npt.NDArray[np.integer]] = []
+        self._letters = letter_mask("".join(self.words))
+        self._black: int = 0
+        self._state_version: int = 0
+        self._alive: npt.NDArray[np.bool_] | None = None
+        self._narrowed: int = 0
+
+    @property
+    def boards(self) -> int:
+        return len(self.words)
+
+    @property
+    def state_version(self) -> int:
+        return self._state_version
+
+    @property
+    def amount_of_guesses(self) -> int:
+        # Quordle gives 9 guesses for 4 boards and Octordle 13 for 8.
+        return self.options.get("amount_of_guesses", self.boards + 5)
+
+    @cached_property
+    def valid_words(self) -> WordList:
+        return resolve_valid_words(self.options)
+
+    @property
+    def guess_length(self) -> int:
+        return len(self.words[0])
+
+    @cached_property
+    def candidate_pool(self) -> WordList:
+        return self.valid_words.with_length(self.guess_length)
+
+    @cached_property
+    def prefix_index(self) -> PrefixIndex:
+        from .prefix import load_prefix_index
+
+        return load_prefix_index(self.candidate_pool)
+
+    @cached_property
+    def _pool_array(self) -> npt.NDArray[np.uint8]:
+        from .patterns import encode_words
+
+        return encode_words(self.candidate_pool, self.guess_length)
+
+    @property
+    def past_guess_words(self) -> SequenceProxy[str]:
+        return self._guess_view
+
+    @property
+    def pattern_codes(self) -> Sequence[npt.NDArray[np.integer]]:
+        # The codes of each guess on every board, see `wordle.codes`.
+        return self._codes
+
+    @property
+    def remaining_guesses(self) -> int:
+        return self.amount_of_guesses - len(self._guesses)
+
+    @property
+    def solved(self) -> npt.NDArray[np.bool_]:
+        return self._solved_at > 0
+
+    @property
+    def solved_at(self) -> npt.NDArray[np.intp]:
+        view = self._solved_at.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def solved_count(self) -> int:
+        return int(self.solved.sum())
+
+    @property
+    def is_solved(self) -> bool:
+        return bool(self.solved.all())
+
+    @property
+    def black(self) -> int:
+        # Bitmask of the guessed letters that aren't in any board's word.
+        return self._black
+
+    @property
+    def black_chars(self) -> tuple[str, ...]:
+        return mask_letters(self._black)
+
+    def status_rows(self) -> list[str]:
+        # Every board's known letters, with '_' for the unknown ones.
+        text = self._known.tobytes().decode("ascii")
+        length = self.guess_length
+        return [text[idx : idx + length] for idx in range(0, len(text), length)]
+
+    def _narrow(self) -> npt.NDArray[np.bool_]:
+        # alive[board, word] is whether a word of the pool could still be that board's
+        # answer. Each guess is scored once, against only the words still alive on
+        # some board that wasn't solved before it, and the result narrows every board
+        # at the same time. A solved board is down to its word, which no later guess
+        # can rule out.
+        import numpy as np
+
+        from .patterns import score_patterns
+
+        if self._alive is None:
+            self._alive = np.ones((self.boards, len(self.candidate_pool)), dtype=bool)
+
+        alive = self._alive
+        for number, (guess, codes) in enumerate(
+            zip(self._guesses[self._narrowed :], self._codes[self._narrowed :]),
+            start=self._narrowed,
+        ):
+            unsolved = (self._solved_at == 0) | (self._solved_at > number)
+            columns = np.flatnonzero(alive[unsolved].any(axis=0))
+            patterns = score_patterns(guess, self._pool_array[columns])
+            alive[:, columns] &= patterns[None, :] == codes[:, None]
+        self._narrowed = len(self._guesses)
+        return alive
+
+    @property
+    def candidate_counts(self) -> npt.NDArray[np.intp]:
+        return self._narrow().sum(axis=1)
+
+    def board_candidate_indices(self, board: int) -> npt.NDArray[np.intp]:
+        import numpy as np
+
+        return np.flatnonzero(self._narrow()[board])
+
+    @property
+    def candidate_indices(self) -> npt.NDArray[np.intp]:
+        # Words that could still be the answer on any board that isn't solved yet.
+        import numpy as np
+
+        alive = self._narrow()
+        view = np.flatnonzero(alive[~self.solved].any(axis=0))
+        view.flags.writeable = False
+        return view
+
+    @property
+    def remaining_candidate_count(self) -> int:
+        return len(self.candidate_indices)
+
+    @overload
+    def validate_guess(
+        self, guess: str, *, raise_error: Literal[True]
+    ) -> Literal[True]: ...
+    @overload
+    def validate_guess(self, guess: str) -> bool: ...
+    def validate_guess(self, guess: str, *, raise_error: bool = False) -> bool:
+        if len(guess) != self.guess_length:
+            if not raise_error:
+                return False
+            raise InvalidGuessLength(guess=guess, expected_length=self.guess_length)
+        if guess in self._guesses:
+            if not raise_error:
+                return False
+            raise RepeatGuess(guess)
+        if guess not in self.valid_words and guess not in self.words:
+            if not raise_error:
+                return False
+            raise WordNotFound(guess)
+
+        return True
+
+    def guess(self, guess: str) -> bool:
+        # Returns whether every board is solved now.
+        self.validate_guess(guess, raise_error=True)
+        self._apply(guess)
+
+        if self.is_solved:
+            return True
+
+        if len(self._guesses) == self.amount_of_guesses:
+            raise OutOfGuesses()
+
+        return False
+
+    def _apply(self, guess: str) -> None:
+        from .codes import solved_pattern
+        from .patterns import encode_words, score_patterns
+
+        guess_array = encode_words(guess)
+        codes = score_patterns(guess_array, self._targets)
+        self._guesses.append(guess)
+        self._codes.append(codes)
+
+        # Solved boards keep the letters they had, like they stop taking guesses.
+        open_boards = self._solved_at == 0
+        green = (self._targets == guess_array[None, :]) & open_boards[:, None]
+        self._known[green] = self._targets[green]
+        solved = open_boards & (codes == solved_pattern(self.guess_length))
+        self._solved_at[solved] = len(self._guesses)
+        self._black |= letter_mask(guess) & ~self._letters
+        self._state_version += 1
+
+    def __repr__(self) -> str:
+        return f"<MultiWordleGame boards={self.boards} solved={self.solved_count} guesses={len(self._guesses)}>"
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from .patterns import encode_words, pattern_dtype, score_patterns
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from os import PathLike
+
+    import numpy.typing as npt
+
+    from .dictionary import WordList
+
+__all__ = (
+    "DEFAULT_CACHE_DIR",
+    "PatternTable",
+    "load_pattern_table",
+    "unload_pattern_tables",
+    "word_list_digest",
+)
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / "cache"
+
+_loaded: dict[tuple[Path, str, str], PatternTable] = {}
+_load_lock = threading.Lock()
+
+
+def word_list_digest(words: WordList) -> str:
+    array = encode_words(words)
+    digest = hashlib.sha1(str(array.shape).encode())
+    digest.update(np.ascontiguousarray(array).data)
+    return digest.hexdigest()
+
+
+class PatternTable:
+    # The file is stored answer-major, since solvers read the patterns of every
+    # guess against the few answers that are still possible. `matrix` is a
+    # (guesses, answers) view over it.
+    __slots__ = ("_data", "answers", "guesses")
+
+    def __init__(
+        self, guesses: WordList, answers: WordList, data: npt.NDArray[Any]
+    ) -> None:
+        self.guesses = guesses
+        self.answers = answers
+        self._data = data
+
+    @property
+    def matrix(self) -> npt.NDArray[Any]:
+        return self._data.T
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.matrix.shape  # pyright: ignore[reportReturnType]
+
+    def columns(self, answers: npt.NDArray[np.intp]) -> npt.NDArray[Any]:
+        return np.ascontiguousarray(self._data[answers].T)
+
+    def row(self, guess: str | int) -> npt.NDArray[Any]:
+        if isinstance(guess, str):
+            guess = self.guesses.index(guess)
+        return self.matrix[guess]
+
+    def lookup(self, guess: str | int, answer: str | int) -> int:
+        if isinstance(guess, str):
+            guess = self.guesses.index(guess)
+        if isinstance(answer, str):
+            answer = self.answers.index(answer)
+        return int(self._data[answer, guess])
+
+    def __repr__(self) -> str:
+        return f"<PatternTable guesses={self.shape[0]} answers={self.shape[1]}>"
+
+
+def _build(guesses: WordList, answers: WordList, path: Path) -> None:
+    guess_array = encode_words(guesses)
+    answer_array = encode_words(answers)
+    dtype = pattern_dtype(guess_array.shape[1])
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    out = np.lib.format.open_memmap(
+        tmp, mode="w+", dtype=dtype, shape=(len(answer_array), len(guess_array))
+    )
+    # Score in blocks straight into the memory map, so building a table with a few
+    # hundred megabytes of cells never holds more than one block in memory.
+    rows = 512
+    for start in range(0, len(answer_array), rows):
+        out[start : start + rows] = score_patterns(
+            guess_array, answer_array[start : start + rows]
+        ).T
+    out.flush()
+    del out
+    os.replace(tmp, path)
+
+
+def load_pattern_table(
+    guesses: WordList,
+    answers: WordList | None = None,
+    *,
+    cache_dir: str | PathLike[str] | None = None,
+    build: bool = True,
+) -> PatternTable | None:
+    # Tables are keyed by the contents of both word lists, so an edited list gets a
+    # fresh table instead of silently reusing stale patterns.
+    answers = guesses if answers is None else answers
+    cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR).resolve()
+    guess_digest = word_list_digest(guesses)
+    answer_digest = word_list_digest(answers)
+    key = (cache_dir, guess_digest, answer_digest)
+
+    table = _loaded.get(key)
+    if table is not None:
+        return table
+
+    with _load_lock:
+        table = _loaded.get(key)
+        if table is not None:
+            return table
+
+        path = cache_dir / f"patterns-v2-{guess_digest[:16]}-{answer_digest[:16]}.npy"
+        if not path.exists():
+            if not build:
+                return None
+            _build(guesses, answers, path)
+
+        matrix = np.load(path, mmap_mode="r")
+        table = _loaded[key] = PatternTable(guesses, answers, matrix)
+        return table
+
+
+def unload_pattern_tables(words: Iterable[WordList]) -> int:
+    # Drops the cached tables over any of `words`. The files stay in the cache dir.
+    ids = {id(word_list) for word_list in words}
+    with _load_lock:
+        stale = [
+            key
+            for key, table in _loaded.items()
+            if id(table.guesses) in ids or id(table.answers) in ids
+        ]
+        for key in stale:
+            del _loaded[key]
+    return len(stale)
+
+
+if __name__ == "__main__":
+    # Queries never build a table, so this builds one for every word length in a
+    # word list ahead of time: python -m wordle.pattern_table [word list] [cache dir]
+    from .dictionary import load_words
+
+    words = load_words(sys.argv[1] if len(sys.argv) > 1 else None)
+    cache_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    for length in words.lengths:
+        table = load_pattern_table(words.with_length(length), cache_dir=cache_dir)
+        print(f"Built {table!r}")
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from .codes import (
+    decode_pattern,
+    encode_pattern,
+    pattern_code,
+    solved_pattern,
+)
+from .compiled import CompiledWordList
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy.typing as npt
+
+__all__ = (
+    "decode_pattern",
+    "encode_pattern",
+    "encode_words",
+    "pattern_code",
+    "pattern_dtype",
+    "score_patterns",
+    "solved_pattern",
+)
+
+# Upper bound on the number of (guess, answer) cells scored per chunk, which keeps
+# the temporary arrays at a few dozen megabytes regardless of the input size.
+CHUNK_CELLS = 1 << 22
+
+
+def pattern_dtype(length: int) -> np.dtype[Any]:
+    if length <= 5:
+        return np.dtype(np.uint8)
+    if length <= 10:
+        return np.dtype(np.uint16)
+    return np.dtype(np.uint32)
+
+
+def encode_words(
+    words: Iterable[str] | npt.NDArray[np.uint8], length: int | None = None
+) -> npt.NDArray[np.uint8]:
+    if isinstance(words, np.ndarray):
+        return words
+
+    if isinstance(words, str):
+        return np.frombuffer(words.encode("ascii"), dtype=np.uint8)
+
+    if isinstance(words, CompiledWordList):
+        lengths = words.lengths if length is None else (length,)
+        if len(lengths) == 1 and lengths == words.lengths:
+            # Zero copy view straight over the memory mapped records.
+            return np.frombuffer(words.record_view(lengths[0]), dtype=np.uint8).reshape(
+                -1, lengths[0]
+            )
+
+    words = list(words)
+    if length is None:
+        length = len(words[0]) if words else 0
+    if any(len(word) != length for word in words):
+        raise ValueError("All words must have the same length")
+
+    raw = "".join(words).encode("ascii")
+    return np.frombuffer(raw, dtype=np.uint8).reshape(-1, length)
+
+
+def _letter_counts(answers: npt.NDArray[np.uint8]) -> npt.NDArray[np.uint8]:
+    # counts[letter, n] is how many times `letter` appears in answer n.
+    counts = np.zeros((256, answers.shape[0]), dtype=np.uint8)
+    columns = np.arange(answers.shape[0])
+    for idx in range(answers.shape[1]):
+        counts[answers[:, idx], columns] += 1
+    return counts
+
+
+def _score_chunk(
+    guesses: npt.NDArray[np.uint8],
+    answers: npt.NDArray[np.uint8],
+    counts: npt.NDArray[np.uint8],
+    dtype: np.dtype[Any],
+) -> npt.NDArray[Any]:
+    length = guesses.shape[1]
+    green = [guesses[:, idx, None] == answers[None, :, idx] for idx in range(length)]
+    not_green = [~mask for mask in green]
+    # same[m, i, j] is whether guess m has the same letter at positions i and j. Most
+    # guesses have no repeated letters, so the per-pair corrections below only touch
+    # the few rows that do.
+    same = guesses[:, :, None] == guesses[:, None, :]
+    codes = np.zeros((guesses.shape[0], answers.shape[0]), dtype=dtype)
+
+    for idx in range(length):
+        # How many of this letter are in the answer outside of green positions...
+        available = counts[guesses[:, idx]] - green[idx]
+        # ...minus the ones already claimed by earlier non-green copies in the guess.
+        claimed = np.zeros_like(available)
+
+        for jdx in range(length):
+            if jdx == idx:
+                continue
+            rows = np.flatnonzero(same[:, idx, jdx])
+            if not rows.size:
+                continue
+            available[rows] -= green[jdx][rows]
+            if jdx < idx:
+                claimed[rows] += not_green[jdx][rows]
+
+        yellow = not_green[idx] & (claimed < available)
+        digit = green[idx].astype(dtype) * 2 + yellow
+        codes += digit * dtype.type(3**idx)
+
+    return codes
+
+
+def score_patterns(
+    guesses: str | Iterable[str] | npt.NDArray[np.uint8],
+    answers: Iterable[str] | npt.NDArray[np.uint8],
+) -> npt.NDArray[Any]:
+    # A single guess returns shape (N,), several guesses return shape (M, N).
+    single = isinstance(guesses, str) or (
+        isinstance(guesses, np.ndarray) and guesses.ndim == 1
+    )
+    guess_array = encode_words(guesses)
+    if single:
+        guess_array = guess_array.reshape(1, -1)
+
+    length = guess_array.shape[1]
+    answer_array = encode_words(answers, length)
+    if answer_array.ndim != 2 or (
+        answer_array.size and answer_array.shape[1] != length
+    ):
+        raise ValueError("guesses and answers must have the same length")
+
+    dtype = pattern_dtype(length)
+    counts = _letter_counts(answer_array)
+    out = np.empty((guess_array.shape[0], answer_array.shape[0]), dtype=dtype)
+    rows = max(1, CHUNK_CELLS // max(1, answer_array.shape[0]))
+
+    for start in range(0, guess_array.shape[0], rows):
+        out[start : start + rows] = _score_chunk(
+            guess_array[start : start + rows], answer_array, counts, dtype
+        )
+
+    return out[0] if single else out
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .pattern_table import word_list_digest
+from .patterns import encode_words
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy.typing as npt
+
+    from .dictionary import WordList
+
+__all__ = ("PrefixIndex", "load_prefix_index", "unload_prefix_indexes")
+
+_loaded: dict[str, PrefixIndex] = {}
+_load_lock = threading.Lock()
+
+
+class PrefixIndex:
+    # Word lists are sorted, so the words starting with a prefix are one contiguous
+    # range, found with two binary searches over the words as fixed-width bytes.
+    __slots__ = ("_keys", "length", "words")
+
+    def __init__(self, words: WordList) -> None:
+        array = np.ascontiguousarray(encode_words(words))
+        self.words = words
+        self.length: int = array.shape[1]
+        self._keys = array.view(f"S{self.length}").ravel()
+
+    def span(self, prefix: str) -> tuple[int, int]:
+        if len(prefix) > self.length or not prefix.isascii():
+            return 0, 0
+
+        key = prefix.encode("ascii")
+        lo = int(np.searchsorted(self._keys, key, "left"))
+        if len(key) == self.length:
+            hi = int(np.searchsorted(self._keys, key, "right"))
+        else:
+            hi = int(np.searchsorted(self._keys, key + b"\xff", "left"))
+        return lo, hi
+
+    def count(self, prefix: str) -> int:
+        lo, hi = self.span(prefix)
+        return hi - lo
+
+    def count_candidates(self, prefix: str, candidates: npt.NDArray[np.intp]) -> int:
+        # `candidates` are sorted indices into the word list, like
+        # `WordleGame.candidate_indices`.
+        start, stop = np.searchsorted(candidates, self.span(prefix))
+        return int(stop - start)
+
+    def completions(
+        self,
+        prefix: str,
+        candidates: npt.NDArray[np.intp] | None = None,
+        k: int = 5,
+    ) -> list[tuple[str, bool]]:
+        # Returns up to k (word, is_candidate) pairs, possible answers first.
+        lo, hi = self.span(prefix)
+        picked: list[int] = []
+        if candidates is not None:
+            start, stop = np.searchsorted(candidates, (lo, hi))
+            picked = candidates[start : min(stop, start + k)].tolist()
+
+        completions = [(self.words[idx], True) for idx in picked]
+        chosen = set(picked)
+        for idx in range(lo, hi):
+            if len(completions) >= k:
+                break
+            if idx not in chosen:
+                completions.append((self.words[idx], candidates is None))
+        return completions
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"<PrefixIndex words={len(self)} length={self.length}>"
+
+
+def load_prefix_index(words: WordList) -> PrefixIndex:
+    # Shared by every game over the same words, no matter which WordList object
+    # they were handed.
+    digest = word_list_digest(words)
+    index = _loaded.get(digest)
+    if index is not None:
+        return index
+
+    with _load_lock:
+        index = _loaded.get(digest)
+        if index is None:
+            index = _loaded[digest] = PrefixIndex(words)
+        return index
+
+
+def unload_prefix_indexes(words: Iterable[WordList]) -> int:
+    # Drops the cached indexes over any of `words`, so the lists can be freed once
+    # no game uses them anymore.
+    ids = {id(word_list) for word_list in words}
+    with _load_lock:
+        stale = [key for key, index in _loaded.items() if id(index.words) in ids]
+        for key in stale:
+            del _loaded[key]
+    return len(stale)
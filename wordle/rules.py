@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Self
+
+from .enums import CharStatus
+from .state import FULL_MASK, letter_bit, mask_letters
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+__all__ = ("HardModeRules",)
+
+
+class HardModeRules:
+    # What hard mode requires of the next guess: every green letter stays where it
+    # was found, no yellow letter goes back where it was yellow, and every revealed
+    # letter is used at least as many times as it was scored green or yellow in a
+    # single guess.
+    #
+    # Rules are compiled once per guess, so checking a word while typing is a bit
+    # test per letter plus a count per required letter.
+    #
+    # positions: the letters each position can be, a single bit for greens.
+    # greens: the green letter of each position, or None.
+    # banned: a mask per position of the letters that were yellow there.
+    # min_counts: (letter, count) pairs of the letters the guess has to contain.
+    __slots__ = ("banned", "greens", "min_counts", "positions")
+
+    greens: tuple[str | None, ...]
+    banned: tuple[int, ...]
+    positions: tuple[int, ...]
+    min_counts: tuple[tuple[str, int], ...]
+
+    def __init__(
+        self,
+        length: int,
+        *,
+        greens: tuple[str | None, ...] | None = None,
+        banned: tuple[int, ...] | None = None,
+        min_counts: tuple[tuple[str, int], ...] = (),
+    ) -> None:
+        if greens is None:
+            greens = (None,) * length
+        if banned is None:
+            banned = (0,) * length
+        if len(greens) != length or len(banned) != length:
+            raise ValueError(f"Expected {length} positions")
+
+        self.greens = greens
+        self.banned = banned
+        self.positions = tuple(
+            FULL_MASK & ~mask if char is None else letter_bit(char)
+            for char, mask in zip(greens, banned)
+        )
+        self.min_counts = min_counts
+
+    @property
+    def length(self) -> int:
+        return len(self.greens)
+
+    def with_guess(self, guess: str, statuses: Iterable[CharStatus]) -> Self:
+        greens = list(self.greens)
+        banned = list(self.banned)
+        counts: dict[str, int] = {}
+        for idx, (char, status) in enumerate(zip(guess, statuses)):
+            if status is CharStatus.black:
+                continue
+            if status is CharStatus.green:
+                greens[idx] = char
+            else:
+                banned[idx] |= letter_bit(char)
+            counts[char] = counts.get(char, 0) + 1
+
+        min_counts = dict(self.min_counts)
+        for char, count in counts.items():
+            min_counts[char] = max(min_counts.get(char, 0), count)
+
+        return type(self)(
+            len(greens),
+            greens=tuple(greens),
+            banned=tuple(banned),
+            min_counts=tuple(sorted(min_counts.items())),
+        )
+
+    def _position_violation(self, idx: int, char: str) -> str | None:
+        if self.positions[idx] & letter_bit(char):
+            return None
+        if self.greens[idx] is None:
+            return f"Letter {idx + 1} can't be {char!r}, it was yellow there"
+        return f"Letter {idx + 1} has to be {self.greens[idx]!r}"
+
+    @staticmethod
+    def _count_violation(char: str, count: int) -> str:
+        if count == 1:
+            return f"The guess has to contain {char!r}"
+        return f"The guess has to contain {count} of {char!r}"
+
+    def violation(self, word: str) -> str | None:
+        # Why `word` isn't allowed as the next guess, or None if it is.
+        for idx, char in enumerate(word):
+            reason = self._position_violation(idx, char)
+            if reason is not None:
+                return reason
+
+        for char, count in self.min_counts:
+            if word.count(char) < count:
+                return self._count_violation(char, count)
+        return None
+
+    def allows(self, word: str) -> bool:
+        return self.violation(word) is None
+
+    def prefix_violation(self, prefix: str) -> str | None:
+        # Why no allowed guess can start with `prefix`, or None if one could. The
+        # letters still needed have to fit into the positions that are left,
+        # counting the greens among them. Where yellows are banned isn't counted,
+        # so a prefix that is only ruled out by those gets None.
+        for idx, char in enumerate(prefix[: self.length]):
+            reason = self._position_violation(idx, char)
+            if reason is not None:
+                return reason
+
+        rest = self.greens[len(prefix) :]
+        free = rest.count(None)
+        missing: list[tuple[str, int]] = []
+        for char, count in self.min_counts:
+            needed = count - prefix.count(char) - rest.count(char)
+            if needed > 0:
+                missing.append((char, count))
+                free -= needed
+
+        if free < 0:
+            return self._count_violation(*missing[-1])
+        return None
+
+    def allows_prefix(self, prefix: str) -> bool:
+        return self.prefix_violation(prefix) is None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, HardModeRules):
+            return NotImplemented
+        return (
+            self.greens == other.greens
+            and self.banned == other.banned
+            and self.min_counts == other.min_counts
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.greens, self.banned, self.min_counts))
+
+    def __repr__(self) -> str:
+        greens = "".join(char or "_" for char in self.greens)
+        banned = ["".join(mask_letters(mask)) for mask in self.banned]
+        return f"<HardModeRules greens={greens!r} banned={banned!r} min_counts={dict(self.min_counts)!r}>"
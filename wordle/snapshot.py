@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Unpack
+
+from .compiled import CompiledWordList
+from .game import WordleGame, resolve_valid_words
+from .multi import MultiWordleGame
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    from .dictionary import WordList
+    from .game import WordleOptions
+    from .library import WordListLibrary
+
+__all__ = (
+    "dump_snapshot",
+    "load_snapshot",
+    "read_snapshot",
+    "write_snapshot",
+)
+
+# Layout (little endian):
+#   header: magic, version, word length, amount of guesses, guess count,
+#           candidate pool size, candidate pool crc32, word index, start time,
+#           flags, dictionary name length
+#   name:   the dictionary's name in utf-8, empty if it wasn't given
+#   state:  black, yellow, green and known-position bitmasks
+#   guesses: one pool index per guess
+# A word that isn't in the pool gets the index NOT_IN_POOL and follows the
+# guesses as ascii. Only the word itself can be guessed without being in the pool.
+MAGIC = b"WGSV"
+VERSION = 1
+HEADER = struct.Struct("<4sBBBBIIIdBB")
+STATE = struct.Struct("<IIII")
+NOT_IN_POOL = 0xFFFFFFFF
+FLAG_HARD_MODE = 1
+
+# Multi board games (little endian):
+#   header:  magic, version, word length, amount of guesses, guess count,
+#            candidate pool size, candidate pool crc32, board count, start time,
+#            bitmask of the solved boards, dictionary name length
+#   name:    the dictionary's name in utf-8, empty if it wasn't given
+#   words:   one pool index per board
+#   guesses: one pool index per guess
+# Words that aren't in the pool follow the guesses as ascii, the boards' words in
+# board order and then the guesses in the order they were made.
+MULTI_MAGIC = b"WGSM"
+MULTI_VERSION = 1
+MULTI_HEADER = struct.Struct("<4sBBBBIIIdIB")
+
+
+def _pool_crc(pool: WordList) -> int:
+    if isinstance(pool, CompiledWordList) and len(pool.lengths) == 1:
+        return zlib.crc32(pool.record_view(pool.lengths[0]))
+    return zlib.crc32("".join(pool).encode("ascii"))
+
+
+def _resolve_words(
+    name: str, library: WordListLibrary | None, options: WordleOptions
+) -> WordList:
+    # Raises DictionaryNotFound if the dictionary the snapshot names is gone.
+    if name and library is not None:
+        return library.get(name)
+    return resolve_valid_words(options)
+
+
+def _dump_multi(game: MultiWordleGame, name: bytes) -> bytes:
+    pool = game.candidate_pool
+    words = [pool.index(word) if word in pool else NOT_IN_POOL for word in game.words]
+    # Any board's word can be guessed, even if it isn't in the pool.
+    guesses = [
+        pool.index(guess) if guess in pool else NOT_IN_POOL
+        for guess in game.past_guess_words
+    ]
+    solved = sum(1 << idx for idx, done in enumerate(game.solved.tolist()) if done)
+
+    parts = [
+        MULTI_HEADER.pack(
+            MULTI_MAGIC,
+            MULTI_VERSION,
+            game.guess_length,
+            game.amount_of_guesses,
+            len(guesses),
+            len(pool),
+            _pool_crc(pool),
+            game.boards,
+            game.started_at,
+            solved,
+            len(name),
+        ),
+        name,
+        struct.pack(f"<{len(words)}I{len(guesses)}I", *words, *guesses),
+    ]
+    parts.extend(
+        word.encode("ascii")
+        for word, idx in zip((*game.words, *game.past_guess_words), (*words, *guesses))
+        if idx == NOT_IN_POOL
+    )
+    return b"".join(parts)
+
+
+def _load_multi(
+    data: bytes, library: WordListLibrary | None, options: WordleOptions
+) -> MultiWordleGame:
+    if len(data) < MULTI_HEADER.size:
+        raise ValueError("The snapshot is truncated")
+
+    (
+        magic,
+        version,
+        length,
+        amount,
+        count,
+        pool_size,
+        crc,
+        boards,
+        started_at,
+        solved,
+        name_size,
+    ) = MULTI_HEADER.unpack_from(data)
+    if magic != MULTI_MAGIC or version != MULTI_VERSION:
+        raise ValueError("Not a multi board snapshot, or an unsupported version")
+
+    offset = MULTI_HEADER.size + name_size
+    name = data[MULTI_HEADER.size : offset].decode()
+    words = _resolve_words(name, library, options)
+    pool = words.with_length(length)
+    if len(pool) != pool_size or _pool_crc(pool) != crc:
+        raise ValueError("The snapshot was made with a different word list")
+
+    indices = struct.unpack_from(f"<{boards}I{count}I", data, offset)
+    offset += 4 * (boards + count)
+    played: list[str] = []
+    for idx in indices:
+        if idx == NOT_IN_POOL:
+            word = data[offset : offset + length].decode("ascii")
+            if len(word) != length:
+                raise ValueError("The snapshot is corrupt")
+            played.append(word)
+            offset += length
+        else:
+            played.append(pool[idx])
+
+    game = MultiWordleGame(
+        played[:boards],
+        **{**options, "valid_words": words, "amount_of_guesses": amount},
+    )
+    game.candidate_pool = pool
+    game.started_at = started_at
+    for guess in played[boards:]:
+        game._apply(guess)
+
+    if sum(1 << idx for idx, done in enumerate(game.solved.tolist()) if done) != solved:
+        raise ValueError("The snapshot's solved boards don't match its guesses")
+    return game
+
+
+def dump_snapshot(game: WordleGame | MultiWordleGame, dictionary: str = "") -> bytes:
+    # `dictionary` is the name of the game's word list in a WordListLibrary, which
+    # lets load_snapshot find the list again whatever the settings say by then.
+    name = dictionary.encode()
+    if isinstance(game, MultiWordleGame):
+        return _dump_multi(game, name)
+
+    pool = game.candidate_pool
+    word_index = pool.index(game.word) if game.word in pool else NOT_IN_POOL
+    guesses = [
+        pool.index(guess) if guess in pool else NOT_IN_POOL
+        for guess in game.past_guess_words
+    ]
+    state = game.letter_state
+
+    parts = [
+        HEADER.pack(
+            MAGIC,
+            VERSION,
+            game.guess_length,
+            game.amount_of_guesses,
+            len(guesses),
+            len(pool),
+            _pool_crc(pool),
+            word_index,
+            game.started_at,
+            FLAG_HARD_MODE if game.hard_mode else 0,
+            len(name),
+        ),
+        name,
+        STATE.pack(state.black, state.yellow, state.green, state.known),
+        struct.pack(f"<{len(guesses)}I", *guesses),
+    ]
+    if word_index == NOT_IN_POOL:
+        parts.append(game.word.encode("ascii"))
+    return b"".join(parts)
+
+
+def load_snapshot(
+    data: bytes,
+    *,
+    library: WordListLibrary | None = None,
+    **options: Unpack[WordleOptions],
+) -> WordleGame | MultiWordleGame:
+    # A snapshot that names its dictionary gets it from `library`. Otherwise the
+    # options have to give the same word list the snapshot was made with. Any
+    # snapshot that can't be loaded raises ValueError, however it is damaged.
+    try:
+        if data[:4] == MULTI_MAGIC:
+            return _load_multi(data, library, options)
+        return _load_single(data, library, options)
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise ValueError("The snapshot is corrupt") from e
+
+
+def _load_single(
+    data: bytes, library: WordListLibrary | None, options: WordleOptions
+) -> WordleGame:
+    if len(data) < HEADER.size + STATE.size:
+        raise ValueError("The snapshot is truncated")
+
+    (
+        magic,
+        version,
+        length,
+        amount,
+        count,
+        pool_size,
+        crc,
+        word_index,
+        started_at,
+        flags,
+        name_size,
+    ) = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a game snapshot, or an unsupported version")
+
+    state_at = HEADER.size + name_size
+    name = data[HEADER.size : state_at].decode()
+    words = _resolve_words(name, library, options)
+    pool = words.with_length(length)
+    if len(pool) != pool_size or _pool_crc(pool) != crc:
+        raise ValueError("The snapshot was made with a different word list")
+
+    offset = state_at + STATE.size
+    guesses = struct.unpack_from(f"<{count}I", data, offset)
+    offset += 4 * count
+    if word_index == NOT_IN_POOL:
+        word = data[offset:].decode("ascii")
+        if len(word) != length:
+            raise ValueError("The snapshot is corrupt")
+    else:
+        word = pool[word_index]
+
+    game = WordleGame(
+        word,
+        **{
+            **options,
+            "valid_words": words,
+            "amount_of_guesses": amount,
+            "hard_mode": bool(flags & FLAG_HARD_MODE),
+        },
+    )
+    game.candidate_pool = pool
+    game.started_at = started_at
+    for guess in guesses:
+        game._apply(word if guess == NOT_IN_POOL else pool[guess])
+
+    state = game.letter_state
+    if STATE.unpack_from(data, state_at) != (
+        state.black,
+        state.yellow,
+        state.green,
+        state.known,
+    ):
+        raise ValueError("The snapshot's letter state doesn't match its guesses")
+    return game
+
+
+def write_snapshot(path: str | PathLike[str], data: bytes | None) -> None:
+    # Written to a temporary file first, so a crash mid-write never leaves a
+    # half-written snapshot behind. None removes the snapshot.
+    path = Path(path)
+    if data is None:
+        path.unlink(missing_ok=True)
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def read_snapshot(
+    path: str | PathLike[str],
+    *,
+    library: WordListLibrary | None = None,
+    **options: Unpack[WordleOptions],
+) -> WordleGame | MultiWordleGame | None:
+    try:
+        data = Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+    return load_snapshot(data, library=library, **options)
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import json
+import math
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from .pattern_table import DEFAULT_CACHE_DIR, word_list_digest
+from .patterns import encode_words, score_patterns
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+    import numpy.typing as npt
+
+    from .dictionary import WordList
+    from .pattern_table import PatternTable
+
+__all__ = ("Hint", "Solver")
+
+OPENERS_FILE = Path(__file__).parent / "openers.json"
+
+# Rough cost ceilings, in (guess, answer) cells, that keep a later-turn ranking well
+# under 50ms. Table reads are a lot cheaper than scoring, so they get a larger budget.
+SCORE_BUDGET = 750_000
+TABLE_BUDGET = 1_000_000
+MIN_SAMPLE = 128
+OPENER_COUNT = 20
+
+_openers_lock = threading.Lock()
+
+
+class Hint:
+    __slots__ = ("entropy", "expected_remaining", "is_candidate", "word")
+
+    def __init__(
+        self, word: str, entropy: float, expected_remaining: float, is_candidate: bool
+    ) -> None:
+        self.word = word
+        self.entropy = entropy
+        self.expected_remaining = expected_remaining
+        self.is_candidate = is_candidate
+
+    def to_json(self) -> list[Any]:
+        return [self.word, self.entropy, self.expected_remaining, self.is_candidate]
+
+    @classmethod
+    def from_json(cls, data: list[Any]) -> Hint:
+        return cls(*data)
+
+    def __repr__(self) -> str:
+        return f"<Hint word={self.word!r} entropy={self.entropy:.3f} expected_remaining={self.expected_remaining:.2f}>"
+
+
+def _entropies(
+    patterns: npt.NDArray[Any], length: int
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    # Returns the expected information (bits) and the expected number of remaining
+    # candidates for every row of a (guesses, answers) pattern matrix.
+    rows, total = patterns.shape
+    if total == 0:
+        return np.zeros(rows), np.zeros(rows)
+
+    buckets = 3**length
+    if rows * buckets <= 1 << 24:
+        offsets = np.arange(rows, dtype=np.intp)[:, None] * buckets
+        flat = (patterns.astype(np.intp) + offsets).ravel()
+        counts = np.bincount(flat, minlength=rows * buckets)
+        # Only the non-empty bins matter, and there are at most `total` per row.
+        bins = np.flatnonzero(counts)
+        runs = counts[bins].astype(np.float64)
+        row_idx = bins // buckets
+        sum_plogp = np.bincount(row_idx, runs * np.log2(runs), minlength=rows)
+        squares = np.bincount(row_idx, runs * runs, minlength=rows)
+    else:
+        # Too many possible patterns for dense bins, so measure run lengths instead.
+        ordered = np.sort(patterns, axis=1)
+        starts = np.ones(ordered.shape, dtype=bool)
+        starts[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+        row_idx, col_idx = np.nonzero(starts)
+        ends = np.append(col_idx[1:], total)
+        ends[np.append(row_idx[1:] != row_idx[:-1], True)] = total
+        runs = (ends - col_idx).astype(np.float64)
+        sum_plogp = np.bincount(row_idx, runs * np.log2(runs), minlength=rows)
+        squares = np.bincount(row_idx, runs * runs, minlength=rows)
+
+    entropy = math.log2(total) - sum_plogp / total
+    return entropy, squares / total
+
+
+class Solver:
+    __slots__ = ("_array", "_openers", "seed", "table", "words")
+
+    def __init__(
+        self,
+        words: WordList,
+        *,
+        table: PatternTable | None = None,
+        seed: int = 0,
+    ) -> None:
+        if table is not None and table.shape != (len(words), len(words)):
+            raise ValueError("The pattern table was built for a different word list")
+
+        self.words = words
+        self.table = table
+        self.seed = seed
+        self._array = encode_words(words)
+        self._openers: list[Hint] | None = None
+
+    @property
+    def length(self) -> int:
+        return self._array.shape[1]
+
+    @property
+    def has_openers(self) -> bool:
+        # Whether the first turn ranking is loaded, see `openers`.
+        return self._openers is not None
+
+    def _patterns(
+        self,
+        candidates: npt.NDArray[np.intp],
+        allowed: npt.NDArray[np.intp] | None = None,
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[Any]]:
+        total = len(self.words)
+        budget = SCORE_BUDGET if self.table is None else TABLE_BUDGET
+        # Seeded by the candidate set, so the same game state always gets the same
+        # hints, no matter how often the user retypes a query.
+        rng = np.random.default_rng((self.seed, len(candidates), int(candidates.sum())))
+
+        # Estimate the pattern distribution from a sample when there are too many
+        # candidates for an exact count within the budget.
+        answers = candidates
+        if total * len(answers) > budget:
+            size = max(MIN_SAMPLE, budget // total)
+            if size < len(answers):
+                answers = np.sort(rng.choice(answers, size, replace=False))
+
+        # If that is still too expensive, only rank the candidates themselves plus a
+        # sample of the other words.
+        guesses = np.arange(total, dtype=np.intp) if allowed is None else allowed
+        if len(guesses) * len(answers) > budget:
+            own = np.intersect1d(candidates, guesses, assume_unique=True)
+            size = max(len(own), budget // len(answers))
+            if size < len(guesses):
+                others = np.setdiff1d(guesses, own, assume_unique=True)
+                extra = rng.choice(
+                    others, min(len(others), size - len(own)), replace=False
+                )
+                guesses = np.sort(np.concatenate((own, extra)))
+
+        if self.table is not None:
+            matrix = self.table.columns(answers)
+            if len(guesses) != total:
+                matrix = matrix[guesses]
+        else:
+            matrix = score_patterns(self._array[guesses], self._array[answers])
+        return guesses, matrix
+
+    def rank(
+        self,
+        candidates: npt.NDArray[np.intp] | None = None,
+        k: int = 5,
+        allowed: npt.NDArray[np.intp] | None = None,
+    ) -> list[Hint]:
+        # `allowed` limits the guesses to sorted word indices, like the ones hard
+        # mode still allows.
+        if allowed is not None and len(allowed) == len(self.words):
+            allowed = None
+        if candidates is None or len(candidates) == len(self.words):
+            # The exact first turn ranking takes seconds to build, so it is never
+            # built here. Without stored openers the first turn is estimated from a
+            # sample of answers like any other large candidate set.
+            if allowed is None:
+                hints = self.openers(k, build=False)
+                if hints:
+                    return hints
+            candidates = np.arange(len(self.words), dtype=np.intp)
+        if len(candidates) == 0:
+            return []
+        if len(candidates) <= 2:
+            # Nothing beats guessing one of the last candidates.
+            return [
+                Hint(self.words[idx], 1.0 if len(candidates) == 2 else 0.0, 1.0, True)
+                for idx in candidates[:k]
+            ]
+
+        guesses, matrix = self._patterns(candidates, allowed)
+        entropy, expected = _entropies(matrix, self.length)
+        is_candidate = np.isin(guesses, candidates, assume_unique=True)
+
+        # Highest information first, preferring words that could be the answer.
+        order = np.lexsort((~is_candidate, -entropy))[:k]
+        return [
+            Hint(
+                self.words[guesses[idx]],
+                float(entropy[idx]),
+                float(expected[idx]),
+                bool(is_candidate[idx]),
+            )
+            for idx in order
+        ]
+
+    def openers(
+        self,
+        k: int = 5,
+        *,
+        cache_dir: str | PathLike[str] | None = None,
+        build: bool = True,
+    ) -> list[Hint]:
+        # The first turn always ranks the whole list, which is by far the most
+        # expensive ranking, so it is computed once and stored next to the pattern
+        # tables. The bundled word list ships with its openers precomputed.
+        if self._openers is not None and len(self._openers) >= k:
+            return self._openers[:k]
+
+        digest = word_list_digest(self.words)
+        cache = Path(cache_dir or DEFAULT_CACHE_DIR) / f"openers-{digest[:16]}.json"
+
+        # Only the files are locked, so a ranking that is being built never blocks
+        # another thread that merely checks for stored openers.
+        with _openers_lock:
+            for path in (OPENERS_FILE, cache):
+                try:
+                    data = json.loads(path.read_text("UTF-8"))
+                except (FileNotFoundError, ValueError):
+                    continue
+                if data["digest"] == digest and len(data["hints"]) >= k:
+                    self._openers = [Hint.from_json(hint) for hint in data["hints"]]
+                    return self._openers[:k]
+
+        if not build:
+            return []
+
+        total = len(self.words)
+        entropy = np.empty(total)
+        expected = np.empty(total)
+        rows = max(1, TABLE_BUDGET // total)
+        for start in range(0, total, rows):
+            matrix = score_patterns(self._array[start : start + rows], self._array)
+            (
+                entropy[start : start + rows],
+                expected[start : start + rows],
+            ) = _entropies(matrix, self.length)
+
+        order = np.argsort(-entropy, kind="stable")[: max(k, OPENER_COUNT)]
+        hints = [
+            Hint(
+                self.words[idx],
+                float(entropy[idx]),
+                float(expected[idx]),
+                True,
+            )
+            for idx in order
+        ]
+
+        with _openers_lock:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            cache.write_text(
+                json.dumps(
+                    {"digest": digest, "hints": [hint.to_json() for hint in hints]}
+                ),
+                "UTF-8",
+            )
+        self._openers = hints
+        return hints[:k]
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Self, TypeVar
+
+from .enums import CharStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+T = TypeVar("T")
+
+__all__ = ("ALPHABET", "LetterState", "letter_bit", "letter_mask", "mask_letters")
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+FULL_MASK = (1 << len(ALPHABET)) - 1
+
+
+def letter_bit(char: str) -> int:
+    return 1 << (ord(char) - 97)
+
+
+def letter_mask(chars: Iterable[str]) -> int:
+    mask = 0
+    for char in chars:
+        mask |= 1 << (ord(char) - 97)
+    return mask
+
+
+def mask_letters(mask: int) -> tuple[str, ...]:
+    letters: list[str] = []
+    while mask:
+        low = mask & -mask
+        letters.append(ALPHABET[low.bit_length() - 1])
+        mask ^= low
+    return tuple(letters)
+
+
+class LetterState:
+    # Everything known about the letters of a word, as bitmasks over the alphabet.
+    # States are immutable, so forking one for a hypothetical guess is free and
+    # they can be used as dict keys.
+    #
+    # black: letters that aren't in the word at all.
+    # yellow: letters that were scored yellow at some point.
+    # green: letters that were scored green at some point.
+    # known: bitmask over the positions whose letter is known.
+    # allowed: the letters each position can still be.
+    __slots__ = ("_hash", "allowed", "black", "green", "known", "yellow")
+
+    black: int
+    yellow: int
+    green: int
+    known: int
+    allowed: tuple[int, ...]
+
+    def __init__(
+        self,
+        length: int,
+        *,
+        black: int = 0,
+        yellow: int = 0,
+        green: int = 0,
+        known: int = 0,
+        allowed: tuple[int, ...] | None = None,
+    ) -> None:
+        if allowed is None:
+            allowed = (FULL_MASK,) * length
+        elif len(allowed) != length:
+            raise ValueError(f"Expected {length} allowed masks, got {len(allowed)}")
+
+        self.black = black
+        self.yellow = yellow
+        self.green = green
+        self.known = known
+        self.allowed = allowed
+        self._hash: int | None = None
+
+    @property
+    def length(self) -> int:
+        return len(self.allowed)
+
+    def with_guess(self, guess: str, statuses: Iterable[CharStatus]) -> Self:
+        black = yellow = green = 0
+        known = self.known
+        allowed = list(self.allowed)
+
+        for idx, (char, status) in enumerate(zip(guess, statuses)):
+            bit = letter_bit(char)
+            if status is CharStatus.green:
+                green |= bit
+                known |= 1 << idx
+                allowed[idx] = bit
+            else:
+                allowed[idx] &= ~bit
+                if status is CharStatus.yellow:
+                    yellow |= bit
+                else:
+                    black |= bit
+
+        # A black letter is only missing from the word if none of its copies in the
+        # guess were scored yellow or green.
+        black &= ~(yellow | green)
+        if black:
+            allowed = [
+                mask if known >> idx & 1 else mask & ~black
+                for idx, mask in enumerate(allowed)
+            ]
+
+        return type(self)(
+            len(allowed),
+            black=self.black | black,
+            yellow=self.yellow | yellow,
+            green=self.green | green,
+            known=known,
+            allowed=tuple(allowed),
+        )
+
+    def char_status(self, char: str) -> CharStatus | None:
+        bit = letter_bit(char)
+        if self.green & bit:
+            return CharStatus.green
+        if self.yellow & bit:
+            return CharStatus.yellow
+        if self.black & bit:
+            return CharStatus.black
+        return None
+
+    def all_chars(self) -> dict[str, CharStatus]:
+        return {
+            char: status
+            for char in mask_letters(self.black | self.yellow | self.green)
+            if (status := self.char_status(char)) is not None
+        }
+
+    def status(self, filler: T = None) -> list[str | T]:
+        return [
+            ALPHABET[mask.bit_length() - 1] if self.known >> idx & 1 else filler
+            for idx, mask in enumerate(self.allowed)
+        ]
+
+    def allows(self, word: str) -> bool:
+        return len(word) == len(self.allowed) and all(
+            mask & letter_bit(char) for char, mask in zip(word, self.allowed)
+        )
+
+    def _key(self) -> tuple[Any, ...]:
+        return (self.black, self.yellow, self.green, self.known, self.allowed)
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LetterState):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self._key())
+        return self._hash
+
+    def __repr__(self) -> str:
+        black = "".join(mask_letters(self.black))
+        yellow = "".join(mask_letters(self.yellow))
+        green = "".join(mask_letters(self.green))
+        return f"<LetterState black={black!r} yellow={yellow!r} green={green!r} status={''.join(self.status('_'))!r}>"
@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from os import PathLike
+
+    from .game import WordleGame
+
+__all__ = ("GameRecord", "GameStats", "StatsLog")
+
+# File layout (little endian):
+#   header:  magic, version, record count, end of the last complete record,
+#            games, wins, current streak, max streak, total seconds played,
+#            then MAX_GUESSES counters of wins by guess count
+#   records: finished at, duration, word length, guess count, won, then the
+#            word and its guesses as ascii
+# Records are only ever appended, and the header is rewritten in place after
+# each append, so the aggregates never need a scan of the log.
+MAGIC = b"WSTA"
+VERSION = 1
+MAX_GUESSES = 32
+HEADER = struct.Struct(f"<4sHxxIQIIIId{MAX_GUESSES}I")
+RECORD = struct.Struct("<dfBBBx")
+
+
+class GameRecord:
+    __slots__ = ("duration", "finished_at", "guesses", "won", "word")
+
+    def __init__(
+        self,
+        word: str,
+        guesses: Iterable[str],
+        won: bool,
+        duration: float,
+        finished_at: float | None = None,
+    ) -> None:
+        self.word = word
+        self.guesses = tuple(guesses)
+        self.won = won
+        self.duration = duration
+        self.finished_at = time.time() if finished_at is None else finished_at
+
+        if any(len(guess) != len(word) for guess in self.guesses):
+            raise ValueError("Every guess must have the same length as the word")
+
+    @classmethod
+    def from_game(cls, game: WordleGame, *, won: bool) -> GameRecord:
+        finished_at = time.time()
+        return cls(
+            game.word,
+            game.past_guess_words,
+            won,
+            max(0.0, finished_at - game.started_at),
+            finished_at,
+        )
+
+    def to_bytes(self) -> bytes:
+        return RECORD.pack(
+            self.finished_at,
+            self.duration,
+            len(self.word),
+            len(self.guesses),
+            self.won,
+        ) + "".join((self.word, *self.guesses)).encode("ascii")
+
+    @classmethod
+    def from_buffer(cls, buffer: bytes, offset: int = 0) -> tuple[GameRecord, int]:
+        # Returns the record and the offset of the next one.
+        finished_at, duration, length, count, won = RECORD.unpack_from(buffer, offset)
+        start = offset + RECORD.size
+        end = start + length * (count + 1)
+        if end > len(buffer):
+            raise ValueError("The record is truncated")
+
+        text = buffer[start:end].decode("ascii")
+        words = [text[idx : idx + length] for idx in range(0, len(text), length)]
+        return cls(words[0], words[1:], bool(won), duration, finished_at), end
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "word": self.word,
+            "guesses": list(self.guesses),
+            "won": self.won,
+            "duration": self.duration,
+            "finished_at": self.finished_at,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> GameRecord:
+        return cls(
+            data["word"],
+            data["guesses"],
+            data["won"],
+            data["duration"],
+            data["finished_at"],
+        )
+
+    def __repr__(self) -> str:
+        return f"<GameRecord word={self.word!r} guesses={len(self.guesses)} won={self.won}>"
+
+
+class GameStats:
+    __slots__ = (
+        "current_streak",
+        "distribution",
+        "games",
+        "max_streak",
+        "total_duration",
+        "wins",
+    )
+
+    def __init__(self) -> None:
+        self.games = 0
+        self.wins = 0
+        self.current_streak = 0
+        self.max_streak = 0
+        self.total_duration = 0.0
+        self.distribution = [0] * MAX_GUESSES
+
+    @property
+    def losses(self) -> int:
+        return self.games - self.wins
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def average_duration(self) -> float:
+        return self.total_duration / self.games if self.games else 0.0
+
+    def add(self, record: GameRecord) -> None:
+        self.games += 1
+        self.total_duration += record.duration
+        if record.won:
+            self.wins += 1
+            self.current_streak += 1
+            self.max_streak = max(self.max_streak, self.current_streak)
+            self.distribution[min(len(record.guesses), MAX_GUESSES) - 1] += 1
+        else:
+            self.current_streak = 0
+
+    def copy(self) -> GameStats:
+        stats = GameStats()
+        stats.games = self.games
+        stats.wins = self.wins
+        stats.current_streak = self.current_streak
+        stats.max_streak = self.max_streak
+        stats.total_duration = self.total_duration
+        stats.distribution = self.distribution.copy()
+        return stats
+
+    def __repr__(self) -> str:
+        return f"<GameStats games={self.games} wins={self.wins} current_streak={self.current_streak} max_streak={self.max_streak}>"
+
+
+class StatsLog:
+    def __init__(self, path: str | PathLike[str]) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._stats = GameStats()
+        self._count = 0
+        self._end = HEADER.size
+
+        try:
+            with open(self.path, "r+b") as f:
+                self._read_header(f)
+                self._recover(f)
+        except FileNotFoundError:
+            pass
+
+    @property
+    def stats(self) -> GameStats:
+        return self._stats.copy()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _read_header(self, f: BinaryIO) -> None:
+        data = f.read(HEADER.size)
+        if len(data) < HEADER.size:
+            raise ValueError("The stats file is truncated")
+
+        (
+            magic,
+            version,
+            self._count,
+            self._end,
+            stats_games,
+            stats_wins,
+            current_streak,
+            max_streak,
+            total_duration,
+            *distribution,
+        ) = HEADER.unpack(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a stats file, or an unsupported version")
+
+        stats = self._stats
+        stats.games = stats_games
+        stats.wins = stats_wins
+        stats.current_streak = current_streak
+        stats.max_streak = max_streak
+        stats.total_duration = total_duration
+        stats.distribution = list(distribution)
+
+    def _recover(self, f: BinaryIO) -> None:
+        # Records appended after the last header write, by a process that died
+        # before it could update the header, are folded back in. A torn record at
+        # the end is cut off.
+        if f.seek(0, os.SEEK_END) < self._end:
+            raise ValueError("The stats file is truncated")
+
+        f.seek(self._end)
+        tail = f.read()
+        if not tail:
+            return
+
+        offset = 0
+        while offset < len(tail):
+            try:
+                record, offset_after = GameRecord.from_buffer(tail, offset)
+            except (struct.error, ValueError):
+                break
+            self._stats.add(record)
+            self._count += 1
+            offset = offset_after
+
+        self._end += offset
+        f.truncate(self._end)
+        self._write_header(f)
+
+    def _write_header(self, f: BinaryIO) -> None:
+        stats = self._stats
+        f.seek(0)
+        f.write(
+            HEADER.pack(
+                MAGIC,
+                VERSION,
+                self._count,
+                self._end,
+                stats.games,
+                stats.wins,
+                stats.current_streak,
+                stats.max_streak,
+                stats.total_duration,
+                *stats.distribution,
+            )
+        )
+
+    def extend(self, records: Iterable[GameRecord]) -> int:
+        # Appends every record with one write, then updates the header once, which
+        # is how bulk imports stay fast.
+        with self._lock:
+            stats = self._stats.copy()
+            parts: list[bytes] = []
+            for record in records:
+                parts.append(record.to_bytes())
+                stats.add(record)
+            if not parts:
+                return 0
+
+            data = b"".join(parts)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            mode = "r+b" if self.path.exists() else "w+b"
+            with open(self.path, mode) as f:
+                if mode == "w+b":
+                    self._write_header(f)
+                f.seek(self._end)
+                f.write(data)
+                f.flush()
+
+                self._stats = stats
+                self._count += len(parts)
+                self._end += len(data)
+                self._write_header(f)
+            return len(parts)
+
+    def append(self, record: GameRecord) -> None:
+        self.extend((record,))
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(HEADER.size)
+                data = f.read(self._end - HEADER.size)
+        except FileNotFoundError:
+            return
+
+        offset = 0
+        while offset < len(data):
+            record, offset = GameRecord.from_buffer(data, offset)
+            yield record
+
+    def compact(self, keep: int | None = None) -> None:
+        # Rewrites the log with only the newest `keep` records (all of them if
+        # None). The aggregates still cover every game ever recorded.
+        with self._lock:
+            records = list(self)
+            if keep is not None:
+                records = records[-keep:] if keep else []
+
+            data = b"".join(record.to_bytes() for record in records)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            count, end = self._count, self._end
+            self._count = len(records)
+            self._end = HEADER.size + len(data)
+            try:
+                with open(tmp, "w+b") as f:
+                    self._write_header(f)
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.path)
+            except BaseException:
+                self._count, self._end = count, end
+                raise
+
+    def export_json(self, path: str | PathLike[str]) -> int:
+        records = [record.to_json() for record in self]
+        Path(path).write_text(json.dumps(records), "UTF-8")
+        return len(records)
+
+    def import_json(self, path: str | PathLike[str]) -> int:
+        data = json.loads(Path(path).read_text("UTF-8"))
+        return self.extend(GameRecord.from_json(item) for item in data)
+
+    def __repr__(self) -> str:
+        return f"<StatsLog path={str(self.path)!r} records={self._count}>"
@@ -43,17 +43,33 @@ class cached_property(Generic[T, ValueT]):
 
 
 class SequenceProxy(Sequence[T_co]):
+    # A read-only view. Lists and tuples are read straight through without copying,
+    # anything else (like a set) is snapshotted the first time it is indexed. The
+    # snapshot is taken again once the collection's size changed, so the owner only
+    # has to make a new proxy when it swaps items without changing the size.
+    __slots__ = ("__proxied", "__snapshot", "__sorted")
+
     def __init__(self, proxied: Collection[T_co], *, sorted: bool = False) -> None:
         self.__proxied: Collection[T_co] = proxied
         self.__sorted: bool = sorted
+        self.__snapshot: Sequence[T_co] | None = (
+            proxied if not sorted and isinstance(proxied, (list, tuple)) else None
+        )
+
+    @property
+    def __view(self) -> Sequence[T_co]:
+        snapshot = self.__snapshot
+        if snapshot is not None and (
+            snapshot is self.__proxied or len(snapshot) == len(self.__proxied)
+        ):
+            return snapshot
 
-    @cached_property
-    def __copied(self) -> list[T_co]:
         if self.__sorted:
-            self.__proxied = cast("list[T_co]", sorted(self.__proxied))  # pyright: ignore[reportArgumentType]
+            snapshot = cast("list[T_co]", sorted(self.__proxied))  # pyright: ignore[reportArgumentType]
         else:
-            self.__proxied = list(self.__proxied)
-        return self.__proxied
+            snapshot = list(self.__proxied)
+        self.__snapshot = snapshot
+        return snapshot
 
     def __repr__(self) -> str:
         return f"SequenceProxy({self.__proxied!r})"
@@ -65,33 +81,45 @@ class SequenceProxy(Sequence[T_co]):
     def __getitem__(self, idx: slice) -> list[T_co]: ...
 
     def __getitem__(self, idx: SupportsIndex | slice) -> T_co | list[T_co]:
-        return self.__copied[idx]
+        if isinstance(idx, slice):
+            return list(self.__view[idx])
+        return self.__view[idx]
 
     def __len__(self) -> int:
         return len(self.__proxied)
 
     def __contains__(self, item: Any) -> bool:
-        return item in self.__copied
+        return item in self.__proxied
 
     def __iter__(self) -> Iterator[T_co]:
-        return iter(self.__copied)
+        if self.__sorted:
+            return iter(self.__view)
+        return iter(self.__proxied)
 
     def __reversed__(self) -> Iterator[T_co]:
-        return reversed(self.__copied)
+        return reversed(self.__view)
 
     def index(self, value: Any, *args: Any, **kwargs: Any) -> int:
-        return self.__copied.index(value, *args, **kwargs)
+        return self.__view.index(value, *args, **kwargs)
 
     def count(self, value: Any) -> int:
-        return self.__copied.count(value)
+        return self.__view.count(value)
 
 
 class IndexableDict(Generic[KeyT, ValueT]):
+    # Keys and values are kept in parallel lists for positional access, with a
+    # key -> position dict alongside them for constant time key lookups. Integer
+    # keys are always treated as positions.
     def __init__(self, *data: tuple[KeyT, ValueT]) -> None:
-        self.__keys: list[KeyT] = [key for key, _ in data]
-        self.__values: list[ValueT] = [val for _, val in data]
+        self.__keys: list[KeyT] = []
+        self.__values: list[ValueT] = []
+        self.__positions: dict[KeyT, int] = {}
 
-    def copy(self) -> dict[KeyT, ValueT]: ...
+        for key, value in data:
+            self[key] = value
+
+    def copy(self) -> dict[KeyT, ValueT]:
+        return dict(zip(self.__keys, self.__values))
 
     @property
     def keys(self) -> SequenceProxy[KeyT]:
@@ -105,11 +133,13 @@ class IndexableDict(Generic[KeyT, ValueT]):
         yield from zip(self.__keys, self.__values)
 
     def index(self, key: KeyT, /) -> int:
-        return self.__keys.index(key)
+        try:
+            return self.__positions[key]
+        except KeyError:
+            raise ValueError(f"{key!r} is not in IndexableDict") from None
 
     def add(self, key: KeyT, value: ValueT) -> None:
-        self.__keys.append(key)
-        self.__values.append(value)
+        self[key] = value
 
     @overload
     def get(self, key: KeyT, default: None = None, /) -> ValueT | None: ...
@@ -124,7 +154,7 @@ class IndexableDict(Generic[KeyT, ValueT]):
     def get(self, key: int | KeyT, default: Any = None, /) -> Any:
         try:
             return self[key]
-        except IndexError:
+        except (IndexError, KeyError):
             return default
 
     @overload
@@ -142,12 +172,18 @@ class IndexableDict(Generic[KeyT, ValueT]):
             val = self[key]
             del self[key]
             return val
-        except IndexError | KeyError:
+        except (IndexError, KeyError):
             return default
 
     def __len__(self) -> int:
         return len(self.__keys)
 
+    def __contains__(self, key: object, /) -> bool:
+        try:
+            return key in self.__positions
+        except TypeError:
+            return False
+
     @overload
     def __getitem__(self, key: KeyT, /) -> ValueT: ...
     @overload
@@ -159,10 +195,7 @@ class IndexableDict(Generic[KeyT, ValueT]):
             except IndexError:
                 raise IndexError("index out of range") from None
         else:
-            try:
-                return self.__values[self.__keys.index(key)]
-            except ValueError:
-                raise KeyError(key) from None
+            return self.__values[self.__positions[key]]
 
     @overload
     def __setitem__(self, key: KeyT, value: ValueT, /) -> None: ...
@@ -171,28 +204,53 @@ class IndexableDict(Generic[KeyT, ValueT]):
     def __setitem__(self, key: KeyT | int, value: Any, /) -> None:
         if isinstance(key, int):
             try:
-                self.__keys[key] = value[0]
-                self.__values[key] = value[1]
+                old_key = self.__keys[key]
             except IndexError:
                 raise IndexError("out of index") from None
+
+            new_key, new_value = value
+            if new_key != old_key and new_key in self.__positions:
+                raise KeyError(f"{new_key!r} is already in IndexableDict")
+
+            idx = key % len(self.__keys)
+            del self.__positions[old_key]
+            self.__positions[new_key] = idx
+            self.__keys[idx] = new_key
+            self.__values[idx] = new_value
+        elif key in self.__positions:
+            self.__values[self.__positions[key]] = value
         else:
+            self.__positions[key] = len(self.__keys)
             self.__keys.append(key)
             self.__values.append(value)
 
     def __delitem__(self, key: KeyT | int, /) -> None:
-        idx = key if isinstance(key, int) else self.__keys.index(key)
+        if isinstance(key, int):
+            try:
+                self.__keys[key]
+            except IndexError:
+                raise IndexError("index out of range") from None
+            idx = key % len(self.__keys)
+        else:
+            idx = self.__positions[key]
 
-        self.__keys.pop(idx)
+        del self.__positions[self.__keys.pop(idx)]
         self.__values.pop(idx)
 
+        # Only the entries after the removed one move.
+        for position in range(idx, len(self.__keys)):
+            self.__positions[self.__keys[position]] = position
+
     def __iter__(self) -> Iterator[KeyT]:
         yield from self.__keys
 
     def __eq__(self, other: object, /) -> bool:
-        return isinstance(other, IndexableDict) and hash(self) == hash(other)  # pyright: ignore[reportUnknownArgumentType]
+        if not isinstance(other, IndexableDict):
+            return NotImplemented
+        return list(self.items()) == list(other.items())  # pyright: ignore[reportUnknownArgumentType, reportUnknownMemberType]
 
-    def __hash__(self) -> int:
-        return hash((IndexableDict, self.__keys, self.__values))
+    # Mutable, so unhashable, just like dict.
+    __hash__ = None  # pyright: ignore[reportAssignmentType]
 
     @overload
     def __or__(
@@ -227,12 +285,9 @@ class IndexableDict(Generic[KeyT, ValueT]):
     def __ior__(
         self, other: IndexableDict[KeyT, ValueT] | Iterable[tuple[KeyT, ValueT]], /
     ) -> Self:
-        if isinstance(other, IndexableDict):
-            self.__keys.extend(cast("SequenceProxy[KeyT]", other.keys))
-            self.__values.extend(cast("SequenceProxy[ValueT]", other.values))  # pyright: ignore[reportUnknownMemberType]
-        else:
-            for key, value in other:
-                self[key] = value
+        pairs = other.items() if isinstance(other, IndexableDict) else other
+        for key, value in pairs:
+            self[key] = value
 
         return self
 
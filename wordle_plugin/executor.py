@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+T = TypeVar("T")
+LOG = logging.getLogger(__name__)
+
+__all__ = ("BackgroundExecutor", "ComputationCancelled")
+
+
+class ComputationCancelled(Exception):
+    def __init__(self, key: str) -> None:
+        super().__init__(f"The computation for {key!r} was superseded")
+
+        self.key = key
+
+
+class BackgroundExecutor:
+    # NumPy releases the GIL for the heavy lifting, so solver work goes to a thread.
+    # The threads are only started the first time they are needed.
+    def __init__(self, *, threads: int = 1) -> None:
+        self._threads = threads
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._pending: dict[str, asyncio.Future[Any]] = {}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                self._threads, thread_name_prefix="wordle-worker"
+            )
+        return self._thread_pool
+
+    async def run(self, key: str, func: Callable[..., T], /, *args: Any) -> T:
+        # Only the newest computation per key is kept. Starting a new one cancels the
+        # previous one: it is dropped if it hasn't started yet, and its result is
+        # discarded if it has, since a running thread can't be interrupted.
+        self.cancel(key)
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._get_executor(), func, *args)
+        self._pending[key] = future
+
+        try:
+            return await future
+        except asyncio.CancelledError:
+            task = asyncio.current_task()
+            if task is not None and task.cancelling():
+                raise
+            raise ComputationCancelled(key) from None
+        finally:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+    def cancel(self, key: str) -> bool:
+        future = self._pending.pop(key, None)
+        if future is None or future.done():
+            return False
+
+        LOG.debug("Cancelling superseded computation %r", key)
+        return future.cancel()
+
+    def shutdown(self) -> None:
+        for key in list(self._pending):
+            self.cancel(key)
+
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
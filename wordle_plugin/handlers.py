@@ -1,18 +1,33 @@
 from __future__ import annotations
 
+import datetime
 from typing import TYPE_CHECKING
 
 from flogin import Query, SearchHandler
 
-from wordle import InvalidGuessLength, RepeatGuess, WordNotFound
-
-from .enums import Icon
-from .results import MakeGuessResult, Result, StartGameResult
+from wordle import (
+    DAILY_EPOCH,
+    HardModeViolation,
+    InvalidGuessLength,
+    RepeatGuess,
+    WordNotFound,
+)
+
+from .executor import ComputationCancelled
+from .results import (
+    DailyPuzzleResult,
+    HintResult,
+    MakeGuessResult,
+    Result,
+    StartGameResult,
+    error_result,
+)
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
     from .plugin import WordlePlugin  # noqa: F401
+    from .sessions import GameSession
 
 
 class BaseHandler(SearchHandler["WordlePlugin"]):
@@ -20,52 +35,118 @@ class BaseHandler(SearchHandler["WordlePlugin"]):
 
 
 class GuessHandler(BaseHandler):
-    def condition(self, query: Query[None]) -> bool:
-        return self.plugin is not None and self.plugin.game is not None
+    def condition(self, query: Query[GameSession]) -> bool:
+        if self.plugin is None:
+            return False
 
-    async def callback(self, query: Query[None]) -> AsyncIterator[Result]:
-        assert self.plugin
-        assert self.plugin.game
-
-        try:
-            self.plugin.game.validate_guess(query.text, raise_error=True)
-        except InvalidGuessLength:
-            chars = len(query.text)
-            diff = 5 - chars
-            is_pos = abs(diff) == diff
-
-            yield Result(
-                "Invalid Guess",
-                sub=f"Your guess is {abs(diff)} characters too {'short' if is_pos else 'long'}. Remaining Guesses: {self.plugin.game.remaining_guesses}",
-                score=100,
-                icon=Icon.error,
-            )
-        except RepeatGuess:
-            yield Result(
-                "Invalid Guess",
-                sub=f"You already guessed {query.text}. Remaining Guesses: {self.plugin.game.remaining_guesses}",
-                score=100,
-                icon=Icon.error,
-            )
-        except WordNotFound:
-            yield Result(
-                "Invalid Word",
-                score=100,
-                icon=Icon.error,
-                sub=f"Remaining Guesses: {self.plugin.game.remaining_guesses}",
-            )
-        else:
-            yield MakeGuessResult(query, self.plugin.game.remaining_guesses)
+        session = self.plugin.get_session(query)
+        query.condition_data = session
+        return session.game is not None
 
-        for res in self.plugin.gen_state_results():
+    async def callback(self, query: Query[GameSession]) -> AsyncIterator[Result]:
+        assert self.plugin
+        session = query.condition_data
+        assert session
+
+        # Held while the game is read, so a guess can't be made halfway through
+        # rendering it. Hints are ranked after it is released, so a newer keystroke
+        # can start its own ranking, which cancels this one, instead of waiting.
+        hint_job = None
+        async with session.lock:
+            game = session.game
+            if game is None:
+                return
+
+            try:
+                game.validate_guess(query.text, raise_error=True)
+            except InvalidGuessLength:
+                chars = len(query.text)
+                diff = game.guess_length - chars
+                is_pos = abs(diff) == diff
+
+                yield error_result(
+                    "Invalid Guess",
+                    f"Your guess is {abs(diff)} characters too {'short' if is_pos else 'long'}. Remaining Guesses: {game.remaining_guesses}",
+                )
+
+                if is_pos and query.text:
+                    for res in self.plugin.gen_prefix_results(game, query):
+                        yield res
+            except RepeatGuess:
+                yield error_result(
+                    "Invalid Guess",
+                    f"You already guessed {query.text}. Remaining Guesses: {game.remaining_guesses}",
+                )
+            except WordNotFound:
+                yield error_result(
+                    "Invalid Word",
+                    f"Remaining Guesses: {game.remaining_guesses}",
+                )
+            except HardModeViolation as e:
+                yield error_result(
+                    "Not allowed in hard mode",
+                    f"{e.reason}. Remaining Guesses: {game.remaining_guesses}",
+                )
+            else:
+                yield MakeGuessResult(query, game)
+
+            if self.plugin.is_superseded(query):
+                return
+
+            if self.plugin.settings.show_hints:
+                hint_job = self.plugin.prepare_hints(game)
+            state_results = self.plugin.gen_state_results(session)
+
+        if hint_job is not None:
+            try:
+                hints = await self.plugin.rank_hints(session, hint_job)
+            except ComputationCancelled:
+                # A newer query is already computing its own hints, so this
+                # response is stale anyway.
+                return
+
+            if self.plugin.is_superseded(query):
+                return
+
+            for hint in hints:
+                yield HintResult(query, hint)
+
+        for res in state_results:
             yield res
 
 
 class StartGameHandler(BaseHandler):
+    def __init__(self) -> None:
+        super().__init__()
+
+        # The start prompt only depends on the keyword, so it is built once per
+        # keyword and reused on every keystroke until a game is started.
+        self._results: dict[str, StartGameResult] = {}
+        # Rebuilt once a day, and once the day's puzzle was played.
+        self._daily: dict[str, DailyPuzzleResult] = {}
+
     def condition(self, query: Query[None]) -> bool:
-        return self.plugin is not None and self.plugin.game is None
+        return self.plugin is not None and self.plugin.get_session(query).game is None
+
+    async def callback(self, query: Query[None]) -> list[Result]:
+        assert self.plugin
+
+        result = self._results.get(query.keyword)
+        if result is None:
+            result = self._results[query.keyword] = StartGameResult(
+                query, title="Start a game?", sub="Click to start a new game"
+            )
+
+        today = datetime.date.today()
+        played = self.plugin.get_daily_played() == today
+        daily = self._daily.get(query.keyword)
+        if daily is None or daily.date != today or daily.played != played:
+            number = (today - DAILY_EPOCH).days
+            daily = self._daily[query.keyword] = DailyPuzzleResult(
+                query, today, number, played=played
+            )
 
-    async def callback(self, query: Query[None]) -> Result:
-        return StartGameResult(
-            query, title="Start a game?", sub="Click to start a new game"
-        )
+        stats = self.plugin.gen_stats_result()
+        if stats is None:
+            return [result, daily]
+        return [result, daily, stats]
@@ -1,70 +1,637 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import datetime
+import functools
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
 
-from flogin import Plugin
+from flogin import Plugin, PluginNotInitialized, QueryResponse
 
-from wordle import WordleGame
+from wordle import (
+    ALPHABET,
+    DEFAULT_DICTIONARY,
+    DailyPuzzlePlayed,
+    DailySchedule,
+    DictionaryNotFound,
+    GameRecord,
+    MultiWordleGame,
+    StatsLog,
+    UnsupportedLength,
+    WordleGame,
+    WordListLibrary,
+    letter_bit,
+    mask_letters,
+    write_snapshot,
+)
 
 from .enums import BlackDisplay, Icon
+from .executor import BackgroundExecutor
 from .handlers import GuessHandler, StartGameHandler
-from .results import PastGuess, Result
+from .responses import PreparedQueryResponse
+from .results import (
+    BoardRow,
+    CachedResult,
+    CompletionResult,
+    PastGuess,
+    Result,
+    StatsResult,
+    error_result,
+)
+from .saves import GameSaver
+from .sessions import GameManager, GameSession
 from .settings import WordleSettings
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import numpy as np
+    import numpy.typing as npt
+    from flogin import ErrorResponse, Query
+
+    from wordle import WordList
+    from wordle.game import WordleOptions
+    from wordle.solver import Hint, Solver
+
+    from .sessions import Game
+
+HINT_COUNT = 3
+# Formatted with the session key.
+SAVE_FILE = "game-{}.bin"
+STATS_FILE = "stats.bin"
+# The date of the last daily puzzle started, in ISO format.
+DAILY_FILE = "daily.txt"
+DICTIONARY_DIR = "dictionaries"
+DEFAULT_WORD_LENGTH = 5
+# Boards per result when rendering a multi board game.
+BOARDS_PER_ROW = 4
+# How many dictionaries are kept loaded once no game uses them.
+DICTIONARY_CAPACITY = 2
+COMPLETION_COUNT = 3
+# How many games are kept in memory at once.
+SESSION_CAPACITY = 8
+# How many solvers are kept, one per word list hints were asked for.
+SOLVER_CAPACITY = 4
+QWERTY = "qwertyuiopasdfghjklzxcvbnm"
+LOG = logging.getLogger(__name__)
+# Flow keeps plugins in UserData/Plugins/<plugin> and their settings in
+# UserData/Settings/Plugins/<name>.
+PLUGIN_DIR = Path(__file__).resolve().parent.parent
+# Seconds between answering the first query and warming up in the background, so
+# the warm-up doesn't hold the GIL while flogin writes that first response.
+WARM_UP_DELAY = 0.05
+
 
 class WordlePlugin(Plugin[WordleSettings]):
-    game: WordleGame | None = None
+    _stats: StatsLog | None = None
+    _stats_loaded: bool = False
+    _stats_result: tuple[int, Result] | None = None
+    _library: WordListLibrary | None = None
+    # Set to False to keep games in memory only, like benchmarks and tests do.
+    persist_games: bool = True
+    _schedule: DailySchedule | None = None
+    _daily_played: datetime.date | None = None
+    _daily_loaded: bool = False
+    prepared_responses: bool = True
+    # Seconds to wait for a newer query before answering one. Zero still lets
+    # queries that arrived together coalesce into the newest one.
+    query_debounce: float = 0.0
+    # Set to False to load everything on first use instead, like benchmarks do.
+    warm_up_in_background: bool = True
+    _warm_up_task: asyncio.Task[None] | None = None
 
     def __init__(self) -> None:
         super().__init__()
 
+        # A second thread keeps hints coming while openers are built on the other.
+        self.executor = BackgroundExecutor(threads=2)
+        # Games in progress are only read from disk once they are first needed.
+        self.sessions = GameManager(capacity=SESSION_CAPACITY, loader=self.load_game)
+        self._savers: dict[str, GameSaver] = {}
+        # Stats and the last daily puzzle are written in the background.
+        self._writes: set[asyncio.Task[None]] = set()
+        self._opener_builds: dict[int, asyncio.Task[None]] = {}
+        # Keyed by the id of the word list, which the solver keeps alive.
+        self._solvers: OrderedDict[int, Solver] = OrderedDict()
+
         self.register_search_handlers(
             GuessHandler(),
             StartGameHandler(),
         )
 
-    def start_new_game(self) -> None:
-        self.game = WordleGame()
+    async def start(self) -> None:
+        try:
+            await super().start()
+        finally:
+            await self.close()
 
-    def gen_state_results(self) -> list[Result]:
-        assert self.game
-        black_kwargs: dict[str, Any] = {"icon": Icon.black_circle, "score": 40}
+    async def close(self) -> None:
+        # Background builds are dropped, but pending saves and stats are written
+        # before the worker threads are shut down.
+        for task in (self._warm_up_task, *self._opener_builds.values()):
+            if task is not None:
+                task.cancel()
+        for saver in self._savers.values():
+            await saver.flush()
+        await asyncio.gather(*self._writes, return_exceptions=True)
+        self.executor.shutdown()
 
-        match BlackDisplay(self.settings.black_letters_display_type):
-            case BlackDisplay.querty:
-                black_title = "qwertyuiopasdfghjklzxcvbnm"
-                black_highlight_data = list(range(len(black_title) + 1))
-                for char in self.game.black_chars:
-                    black_highlight_data.remove(black_title.index(char))
-                black_kwargs.update(
-                    {
-                        "sub": "Characters that could still be or are in the word are highlighted.",
-                        "title_highlight_data": black_highlight_data,
-                    }
+    def is_superseded(self, query: Query[Any]) -> bool:
+        # flogin sets `last_query` before handling a query. Queries that skip that,
+        # like the ones PluginTester sends, are never superseded.
+        return self.last_query is not None and query is not self.last_query
+
+    async def process_search_handlers(
+        self, query: Query[Any]
+    ) -> QueryResponse | ErrorResponse:
+        # Flow sends a query per keystroke and throws away the responses to all but
+        # the newest one, so superseded queries get an empty response instead.
+        # Pending settings changes are left for the next response.
+        await asyncio.sleep(self.query_debounce)
+        if self.is_superseded(query):
+            LOG.debug("Skipping superseded query %r", query.text)
+            return QueryResponse([])
+
+        response = await super().process_search_handlers(query)
+        if self.is_superseded(query) and isinstance(response, QueryResponse):
+            LOG.debug("Dropping the results of superseded query %r", query.text)
+            return QueryResponse([], response.settings_changes)
+
+        if self.warm_up_in_background and self._warm_up_task is None:
+            self._warm_up_task = asyncio.create_task(self._warm_up_later())
+
+        if self.prepared_responses and isinstance(response, QueryResponse):
+            return PreparedQueryResponse.from_response(response)
+        return response
+
+    async def _warm_up_later(self) -> None:
+        await asyncio.sleep(WARM_UP_DELAY)
+        try:
+            # The settings and the library are only used on the event loop, so the
+            # worker is handed the word list new games are played with.
+            options = self.game_options()
+            pool = options["valid_words"].with_length(options["word_length"])
+            if not pool:
+                return
+            solver = await self.executor.run("warm-up", self.warm_up, pool)
+        except Exception:
+            LOG.exception("Failed to warm up the word list and solver")
+        else:
+            solver = self.store_solver(solver)
+            await self._build_table(solver)
+            self.build_openers_later(solver)
+
+    async def _build_table(self, solver: Solver) -> None:
+        # Only the word list new games are played with gets a pattern table, since
+        # one takes several seconds and can be a few hundred megabytes on disk.
+        # Hints score on the fly until it is loaded.
+        from wordle.pattern_table import load_pattern_table
+
+        if solver.table is not None:
+            return
+        try:
+            solver.table = await self.executor.run(
+                f"table:{id(solver.words)}", load_pattern_table, solver.words
+            )
+        except Exception:
+            LOG.exception("Failed to build the pattern table for %r", solver.words)
+
+    @classmethod
+    def warm_up(cls, pool: WordList) -> Solver:
+        # Nothing a game needs is loaded on startup, so the first query can be
+        # answered right away. This loads it all in the background afterwards,
+        # only for the words new games are played with. Everything else is loaded
+        # when it is first needed.
+        from wordle.prefix import load_prefix_index
+
+        load_prefix_index(pool)
+        solver = cls.build_solver(pool)
+        solver.openers(HINT_COUNT, build=False)
+        return solver
+
+    def session_key(self, query: Query[Any]) -> str:
+        # Every action keyword plays its own game.
+        return query.keyword
+
+    def get_session(self, query: Query[Any]) -> GameSession:
+        return self.sessions.get(self.session_key(query))
+
+    def set_game(self, session: GameSession, game: Game | None) -> None:
+        session.game = game
+        self.save_game(session)
+
+    def get_data_dir(self) -> Path | None:
+        if not self.persist_games:
+            return None
+        try:
+            metadata = self.metadata
+        except PluginNotInitialized:
+            return None
+        # Next to the plugin's settings, which survive plugin updates. Found from
+        # the plugin's directory, since Flow may start it from anywhere.
+        plugin_dir = Path(metadata.directory or PLUGIN_DIR).resolve()
+        return plugin_dir.parent.parent / "Settings" / "Plugins" / metadata.name
+
+    def get_saver(self, key: str) -> GameSaver | None:
+        # Savers outlive the sessions they save, so a save that is still pending
+        # when a session is evicted isn't lost.
+        saver = self._savers.get(key)
+        if saver is None:
+            data_dir = self.get_data_dir()
+            if data_dir is None:
+                return None
+            path = data_dir / SAVE_FILE.format(quote(key, safe=""))
+            saver = self._savers[key] = GameSaver(path, self.executor)
+        return saver
+
+    def get_stats(self) -> StatsLog | None:
+        if not self._stats_loaded:
+            data_dir = self.get_data_dir()
+            if data_dir is None:
+                return None
+
+            self._stats_loaded = True
+            path = data_dir / STATS_FILE
+            try:
+                self._stats = StatsLog(path)
+            except (OSError, ValueError):
+                LOG.exception("Failed to load the game history from %s", path)
+        return self._stats
+
+    def get_library(self) -> WordListLibrary:
+        if self._library is None:
+            data_dir = self.get_data_dir()
+            self._library = WordListLibrary(
+                None if data_dir is None else data_dir / DICTIONARY_DIR,
+                capacity=DICTIONARY_CAPACITY,
+            )
+        return self._library
+
+    def game_options(self) -> WordleOptions:
+        # The dictionary and word length new games are played with. Raises
+        # DictionaryNotFound if the dictionary in the settings doesn't exist.
+        settings = self.settings
+        name = settings.dictionary or DEFAULT_DICTIONARY
+        length = int(settings.word_length or DEFAULT_WORD_LENGTH)
+        return {
+            "valid_words": self.get_library().get(name),
+            "word_length": length,
+            "hard_mode": bool(settings.hard_mode),
+        }
+
+    def new_game_options(self) -> WordleOptions:
+        # The settings can ask for any word length, so this checks the dictionary
+        # has it before a game is started. Raises UnsupportedLength if it doesn't.
+        options = self.game_options()
+        lengths = options["valid_words"].lengths
+        if options["word_length"] not in lengths:
+            raise UnsupportedLength(options["word_length"], lengths)
+        return options
+
+    def record_game(self, game: Game, *, won: bool) -> None:
+        # The history only has room for games with a single word.
+        stats = self.get_stats()
+        if stats is None or isinstance(game, MultiWordleGame):
+            return
+
+        # Appending is quick, but it is still disk access, so it happens in the
+        # background like saving the game does.
+        record = GameRecord.from_game(game, won=won)
+        task = asyncio.create_task(self._append_record(stats, record))
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _append_record(self, stats: StatsLog, record: GameRecord) -> None:
+        try:
+            await self.executor.run(f"stats:{id(record)}", stats.append, record)
+        except Exception:
+            LOG.exception("Failed to record the game in %s", stats.path)
+
+    def load_game(self, key: str) -> Game | None:
+        saver = self.get_saver(key)
+        if saver is None:
+            return None
+
+        # Saved games are loaded with the dictionary they were started with, which
+        # older saves don't name, so those get the one in the settings.
+        try:
+            return saver.load(
+                library=self.get_library(),
+                valid_words=self.game_options()["valid_words"],
+            )
+        except DictionaryNotFound as e:
+            LOG.warning("Not loading the saved game from %s: %s", saver.path, e)
+            return None
+        except (OSError, ValueError):
+            LOG.exception("Failed to load the saved game from %s", saver.path)
+            return None
+
+    def save_game(self, session: GameSession) -> None:
+        saver = self.get_saver(session.key)
+        if saver is not None:
+            game = session.game
+            name = (
+                None if game is None else self.get_library().name_of(game.valid_words)
+            )
+            saver.schedule(game, name or "")
+
+    def start_new_game(self, session: GameSession) -> Game:
+        boards = int(self.settings.boards or 1)
+        options = self.new_game_options()
+        if boards > 1:
+            game = MultiWordleGame(boards=boards, **options)
+        else:
+            game = WordleGame(**options)
+        self.set_game(session, game)
+        return game
+
+    def get_schedule(self, pool: WordList) -> DailySchedule:
+        if self._schedule is None or self._schedule.words is not pool:
+            self._schedule = DailySchedule(pool)
+        return self._schedule
+
+    def get_daily_played(self) -> datetime.date | None:
+        if not self._daily_loaded:
+            self._daily_loaded = True
+            data_dir = self.get_data_dir()
+            if data_dir is None:
+                return None
+
+            path = data_dir / DAILY_FILE
+            try:
+                self._daily_played = datetime.date.fromisoformat(
+                    path.read_text("ascii").strip()
                 )
-            case BlackDisplay.abc:
-                black_title = "abcdefghijklmnopqrstuvwxyz"
-                black_highlight_data = list(range(len(black_title) + 1))
-                for char in self.game.black_chars:
-                    black_highlight_data.remove(black_title.index(char))
-                black_kwargs.update(
-                    {
-                        "sub": "Characters that could still be or are in the word are highlighted.",
-                        "title_highlight_data": black_highlight_data,
-                    }
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError):
+                LOG.exception("Failed to read the last daily puzzle from %s", path)
+        return self._daily_played
+
+    def set_daily_played(self, date: datetime.date) -> None:
+        self._daily_played = date
+        data_dir = self.get_data_dir()
+        if data_dir is None:
+            return
+
+        task = asyncio.create_task(
+            self._write_daily_played(data_dir / DAILY_FILE, date)
+        )
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _write_daily_played(self, path: Path, date: datetime.date) -> None:
+        try:
+            await self.executor.run(
+                "daily", write_snapshot, path, date.isoformat().encode("ascii")
+            )
+        except Exception:
+            LOG.exception("Failed to write the last daily puzzle to %s", path)
+
+    def start_daily_game(
+        self, session: GameSession, date: datetime.date | None = None
+    ) -> WordleGame:
+        # Daily puzzles are always played on one board, with the dictionary and word
+        # length in the settings, since the word of the day depends on both. Each
+        # day's puzzle can only be started once, so replays never reach the stats.
+        date = date or datetime.date.today()
+        if self.get_daily_played() == date:
+            raise DailyPuzzlePlayed(date)
+
+        options = self.new_game_options()
+        pool = options["valid_words"].with_length(options["word_length"])
+        game = WordleGame(self.get_schedule(pool).word(date), **options)
+        self.set_game(session, game)
+        self.set_daily_played(date)
+        return game
+
+    # Solvers are only read and stored on the event loop. They are built on the
+    # worker thread, and stored once the job that built them is awaited.
+    def get_solver(self, pool: WordList) -> Solver | None:
+        solver = self._solvers.get(id(pool))
+        if solver is not None:
+            self._solvers.move_to_end(id(pool))
+        return solver
+
+    def store_solver(self, solver: Solver) -> Solver:
+        # The first solver stored for a word list wins, so one built by a slower
+        # job never replaces one that is already in use.
+        stored = self.get_solver(solver.words)
+        if stored is not None:
+            return stored
+
+        self._solvers[id(solver.words)] = solver
+        while len(self._solvers) > SOLVER_CAPACITY:
+            self._solvers.popitem(last=False)
+        return solver
+
+    def build_openers_later(self, solver: Solver) -> None:
+        # Ranking the first turn exactly takes seconds for a word list without
+        # stored openers. Queries make do with an estimate until this is done.
+        key = id(solver.words)
+        if solver.has_openers or key in self._opener_builds:
+            return
+        self._opener_builds[key] = asyncio.create_task(self._build_openers(solver))
+
+    async def _build_openers(self, solver: Solver) -> None:
+        key = id(solver.words)
+        try:
+            await self.executor.run(
+                f"openers:{key}",
+                functools.partial(solver.openers, HINT_COUNT, build=True),
+            )
+        except Exception:
+            LOG.exception("Failed to build the openers for %r", solver.words)
+        finally:
+            del self._opener_builds[key]
+
+    @staticmethod
+    def build_solver(pool: WordList) -> Solver:
+        from wordle.pattern_table import load_pattern_table
+        from wordle.solver import Solver
+
+        # Never build the pattern table from a query, it takes several seconds.
+        # It is built after warming up, or with `python -m wordle.pattern_table`.
+        table = load_pattern_table(pool, build=False)
+        return Solver(pool, table=table)
+
+    @classmethod
+    def _rank(
+        cls,
+        solver: Solver | None,
+        pool: WordList,
+        candidates: npt.NDArray[np.intp],
+        allowed: npt.NDArray[np.intp] | None,
+    ) -> tuple[Solver, list[Hint]]:
+        if solver is None:
+            solver = cls.build_solver(pool)
+        return solver, solver.rank(candidates, HINT_COUNT, allowed)
+
+    def prepare_hints(self, game: Game) -> Callable[[], tuple[Solver, list[Hint]]]:
+        # Narrowing mutates the game, so it stays on the event loop, while the game's
+        # session is locked. The job it returns only reads arrays the game never
+        # changes again, so it can be ranked after the lock is released.
+        candidates = game.candidate_indices
+        allowed = None
+        if isinstance(game, WordleGame) and game.hard_mode:
+            allowed = game.hard_mode_indices
+        pool = game.candidate_pool
+        return functools.partial(
+            self._rank, self.get_solver(pool), pool, candidates, allowed
+        )
+
+    async def rank_hints(
+        self, session: GameSession, job: Callable[[], tuple[Solver, list[Hint]]]
+    ) -> list[Hint]:
+        # Starting a new ranking cancels the last one for the same game, see
+        # BackgroundExecutor. Games of other keywords keep their own.
+        solver, hints = await self.executor.run(f"hints:{session.key}", job)
+        self.build_openers_later(self.store_solver(solver))
+        return hints
+
+    def gen_prefix_results(self, game: Game, query: Query[Any]) -> list[Result]:
+        index = game.prefix_index
+        candidates = game.candidate_indices
+        valid = index.count(query.text)
+        if not valid:
+            return [
+                error_result(
+                    "No valid words start with that",
+                    f"Nothing in the word list starts with {query.text!r}",
                 )
-            case BlackDisplay.only_blacks:
-                black_title = "".join(self.game.black_chars)
+            ]
+
+        # Possible answers always follow the hard mode rules, so only the other
+        # completions need checking.
+        rules = None
+        if isinstance(game, WordleGame) and game.hard_mode:
+            rules = game.hard_mode_rules
+            reason = rules.prefix_violation(query.text)
+            if reason is not None:
+                return [error_result("No hard mode guess starts with that", reason)]
 
+        possible = index.count_candidates(query.text, candidates)
         return [
             Result(
-                " ".join(self.game.status("_")),
+                f"Valid words starting with {query.text!r}: {valid}",
+                sub=f"Possible answers: {possible}",
+                icon=Icon.qmark,
+                score=48,
+            ),
+            *[
+                CompletionResult(query, word, is_candidate)
+                for word, is_candidate in index.completions(
+                    query.text, candidates, COMPLETION_COUNT
+                )
+                if rules is None or is_candidate or rules.allows(word)
+            ],
+        ]
+
+    def gen_stats_result(self) -> Result | None:
+        log = self.get_stats()
+        if log is None:
+            return None
+
+        # Rendered from the aggregates in the log's header, so this never reads the
+        # log itself, and only re-rendered after another game was recorded.
+        stats = log.stats
+        if not stats.games:
+            return None
+        if self._stats_result is not None and self._stats_result[0] == stats.games:
+            return self._stats_result[1]
+
+        result = StatsResult(stats)
+        self._stats_result = (stats.games, result)
+        return result
+
+    def gen_state_results(self, session: GameSession) -> list[Result]:
+        game = session.game
+        assert game
+
+        # The state results only change when a guess is made, so they are built
+        # once per game state and display setting, then reused on every keystroke.
+        display = BlackDisplay(self.settings.black_letters_display_type)
+        key = (game, game.state_version, display)
+        if session.state_results is not None and session.state_results[0] == key:
+            return session.state_results[1]
+
+        if isinstance(game, MultiWordleGame):
+            results = self._gen_multi_state_results(game, display)
+        else:
+            results = [
+                CachedResult(
+                    " ".join(game.status("_")),
+                    sub=f"Possible answers: {game.remaining_candidate_count}",
+                    icon=Icon.green_circle,
+                    score=50,
+                ),
+                self._gen_black_result(game.letter_state.black, display),
+                *[PastGuess(guess, idx) for idx, guess in enumerate(game.past_guesses)],
+            ]
+        session.state_results = (key, results)
+        return results
+
+    def _gen_multi_state_results(
+        self, game: MultiWordleGame, display: BlackDisplay
+    ) -> list[Result]:
+        # A result per row of boards rather than per board, so even 32 boards stay a
+        # handful of results. Every board's letters come out of a single array.
+        rows = game.status_rows()
+        solved = game.solved.tolist()
+        counts = game.candidate_counts.tolist()
+        cells = [
+            word.upper() if done else " ".join(row)
+            for row, word, done in zip(rows, game.words, solved)
+        ]
+
+        results: list[Result] = [
+            CachedResult(
+                f"Solved {game.solved_count} of {game.boards} boards",
+                sub=f"Possible answers on the other boards: {game.remaining_candidate_count}",
                 icon=Icon.green_circle,
                 score=50,
             ),
-            Result(black_title, **black_kwargs),
             *[
-                PastGuess(guess, idx)
-                for idx, guess in enumerate(self.game.past_guesses)
+                BoardRow(
+                    "   |   ".join(cells[first : first + BOARDS_PER_ROW]),
+                    first,
+                    counts[first : first + BOARDS_PER_ROW],
+                    idx,
+                )
+                for idx, first in enumerate(range(0, game.boards, BOARDS_PER_ROW))
             ],
+            self._gen_black_result(game.black, display),
         ]
+        if game.past_guess_words:
+            results.append(
+                CachedResult(
+                    ", ".join(game.past_guess_words),
+                    sub="Your guesses so far",
+                    score=1,
+                )
+            )
+        return results
+
+    def _gen_black_result(self, black: int, display: BlackDisplay) -> Result:
+        kwargs: dict[str, Any] = {"icon": Icon.black_circle, "score": 40}
+
+        match display:
+            case BlackDisplay.querty | BlackDisplay.abc:
+                title = QWERTY if display is BlackDisplay.querty else ALPHABET
+                kwargs.update(
+                    {
+                        "sub": "Characters that could still be or are in the word are highlighted.",
+                        "title_highlight_data": [
+                            idx
+                            for idx, char in enumerate(title)
+                            if not black & letter_bit(char)
+                        ],
+                    }
+                )
+            case BlackDisplay.only_blacks:
+                title = "".join(mask_letters(black))
+
+        return CachedResult(title, **kwargs)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from flogin import QueryResponse
+
+from .results import CachedResult
+
+if TYPE_CHECKING:
+    from flogin import Result
+
+__all__ = ("PreparedQueryResponse",)
+
+
+def result_payload(result: Result) -> bytes:
+    if isinstance(result, CachedResult):
+        return result.payload
+    return json.dumps(result.to_dict()).encode()
+
+
+class PreparedQueryResponse(QueryResponse):
+    # Writes the same message as QueryResponse, but splices in the JSON that cached
+    # results already hold instead of serializing every result again.
+    @classmethod
+    def from_response(cls, response: QueryResponse) -> PreparedQueryResponse:
+        return cls(response.results, response.settings_changes, response.debug_message)
+
+    def to_message(self, id: int) -> bytes:
+        return b"".join(
+            (
+                b'{"jsonrpc": "2.0", "result": {"result": [',
+                b", ".join(result_payload(result) for result in self.results),
+                b'], "SettingsChange": ',
+                json.dumps(self.settings_changes).encode(),
+                b', "debugMessage": ',
+                json.dumps(self.debug_message).encode(),
+                b'}, "id": ',
+                json.dumps(id).encode(),
+                b"}\r\n",
+            )
+        )
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import json
 import random
-from typing import TYPE_CHECKING, TypedDict, Unpack
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, TypedDict, Unpack
 
 from flogin import (
     ExecuteResponse,
@@ -14,14 +16,26 @@ from flogin import (
     Result as _Res,
 )
 
-from wordle import CharStatus, OutOfGuesses
+from wordle import (
+    CharStatus,
+    DailyPuzzlePlayed,
+    DictionaryNotFound,
+    MultiWordleGame,
+    OutOfGuesses,
+    UnsupportedLength,
+)
 
 from .enums import Icon
 
 if TYPE_CHECKING:
+    import datetime
     from collections.abc import Iterable
 
+    from wordle import GameStats
+    from wordle.solver import Hint
+
     from .plugin import WordlePlugin  # noqa: F401
+    from .sessions import Game, GameSession
 
 
 class ResultOptions(TypedDict, total=False):
@@ -72,54 +86,93 @@ class Result(_Res["WordlePlugin"]):
         )
 
 
+class CachedResult(Result):
+    # Serialized once and then reused, for results that are cached across queries.
+    # Changing one after it was sent has no effect.
+    _data: dict[str, Any] | None = None
+    _payload: bytes | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = super().to_dict()
+        return self._data
+
+    @property
+    def payload(self) -> bytes:
+        # The JSON for this result, which PreparedQueryResponse writes out as is.
+        if self._payload is None:
+            self._payload = json.dumps(self.to_dict()).encode()
+        return self._payload
+
+
+@lru_cache(maxsize=256)
+def error_result(title: str, sub: str) -> CachedResult:
+    return CachedResult(title, sub=sub, score=100, icon=Icon.error)
+
+
 class MakeGuessResult(Result):
-    def __init__(self, query: Query[None], remaining_guesses: int) -> None:
+    def __init__(self, query: Query[None], game: Game) -> None:
         super().__init__(
             title=f"Guess {query.text}?",
-            sub=f"Remaining Guesses: {remaining_guesses}",
+            sub=f"Remaining Guesses: {game.remaining_guesses}",
             icon=Icon.qmark,
             score=100,
         )
 
         self.query = query
+        self.game = game
 
     async def callback(self) -> ExecuteResponse:
         assert self.plugin
-        assert self.plugin.game
 
         results: list[Result] = []
         correct = False
+        session = self.plugin.get_session(self.query)
+
+        # Only the guess is made under the lock. Changing the query makes Flow send
+        # a new one, which has to be able to take the lock.
+        async with session.lock:
+            game = session.game
+            # A result from before the game changed, like a second click on it.
+            if game is not self.game or not game.validate_guess(self.query.text):
+                game = None
+
+            if game is not None:
+                try:
+                    correct = game.guess(self.query.text)
+                except OutOfGuesses:
+                    self.plugin.record_game(game, won=False)
+                    results.append(
+                        StartGameResult(
+                            self.query,
+                            title="You ran out of guesses, game over.",
+                            sub="Click to start a new game",
+                            score=100001,
+                        )
+                    )
+                    if isinstance(game, MultiWordleGame):
+                        words = ", ".join(game.words)
+                        title = f"The words were: {words}"
+                    else:
+                        words = game.word
+                        title = f"The word was: {words}"
+                    results.append(Result(title, copy_text=words, score=100000))
+                    self.plugin.set_game(session, None)
+
+                if correct:
+                    self.plugin.record_game(game, won=True)
+                    results.append(
+                        StartGameResult(
+                            self.query,
+                            title="You guessed it!",
+                            sub="Click to start a new game",
+                            score=100000,
+                        )
+                    )
+                    self.plugin.set_game(session, None)
 
-        try:
-            correct = self.plugin.game.guess(self.query.text)
-        except OutOfGuesses:
-            results.append(
-                StartGameResult(
-                    self.query,
-                    title="You ran out of guesses, game over.",
-                    sub="Click to start a new game",
-                    score=100001,
-                )
-            )
-            results.append(
-                Result(
-                    f"The word was: {self.plugin.game.word}",
-                    copy_text=self.plugin.game.word,
-                    score=100000,
-                )
-            )
-            self.plugin.game = None
-
-        if correct:
-            results.append(
-                StartGameResult(
-                    self.query,
-                    title="You guessed it!",
-                    sub="Click to start a new game",
-                    score=100000,
-                )
-            )
-            self.plugin.game = None
+                if not results:
+                    self.plugin.save_game(session)
 
         if results:
             await self.plugin.api.update_results(self.query.raw_text, results)  # pyright: ignore[reportArgumentType]
@@ -129,17 +182,27 @@ class MakeGuessResult(Result):
         return ExecuteResponse(hide=False)
 
 
-class StartGameResult(Result):
+class StartGameResult(CachedResult):
     def __init__(self, query: Query[None], **kwargs: Unpack[ResultOptions]) -> None:
         super().__init__(**kwargs)
 
         self.query = query
 
+    def start_game(self, session: GameSession) -> Game:
+        assert self.plugin
+        return self.plugin.start_new_game(session)
+
     async def callback(self) -> ExecuteResponse:
         assert self.plugin
 
-        self.plugin.start_new_game()
-        assert self.plugin.game
+        session = self.plugin.get_session(self.query)
+        async with session.lock:
+            try:
+                self.start_game(session)
+            except (DailyPuzzlePlayed, DictionaryNotFound, UnsupportedLength) as e:
+                results = [error_result("Can't start a game", str(e))]
+            else:
+                results = self.plugin.gen_state_results(session)
 
         # Flow Launcher strips the raw text, so 'update_results' won't work if the user did `wordle `.
         # so my solution is change query to `wordle`, update results, then change query to `wordle `, to control the query.
@@ -147,14 +210,39 @@ class StartGameResult(Result):
         await self.plugin.api.change_query(self.query.keyword)
         await self.plugin.api.update_results(
             self.query.keyword,
-            self.plugin.gen_state_results(),  # pyright: ignore[reportArgumentType]
+            results,  # pyright: ignore[reportArgumentType]
         )
         # await self.plugin.api.change_query(f"{self.query.keyword} ")
 
         return ExecuteResponse(hide=False)
 
 
-class PastGuess(Result):
+class DailyPuzzleResult(StartGameResult):
+    # Starts the puzzle of the day the result was made on, so a prompt left open
+    # past midnight still starts the puzzle it shows.
+    def __init__(
+        self,
+        query: Query[None],
+        date: datetime.date,
+        number: int,
+        *,
+        played: bool = False,
+    ) -> None:
+        if played:
+            sub = f"Puzzle #{number} is done, come back tomorrow for the next one"
+        else:
+            sub = f"Puzzle #{number}, the same word for everyone with this dictionary"
+        super().__init__(query, title="Today's puzzle", sub=sub, icon=Icon.green_circle)
+
+        self.date = date
+        self.played = played
+
+    def start_game(self, session: GameSession) -> Game:
+        assert self.plugin
+        return self.plugin.start_daily_game(session, self.date)
+
+
+class PastGuess(CachedResult):
     def __init__(self, guess_chars: list[tuple[str, CharStatus]], idx: int) -> None:
         word = ""
         highlight_data: list[int] = []
@@ -171,3 +259,85 @@ class PastGuess(Result):
             score=idx,
             glyph=Glyph(f"#{idx + 1}", "Calibri"),
         )
+
+
+class SuggestionResult(Result):
+    # A word to guess, which is typed into the query when clicked.
+    def __init__(
+        self, query: Query[None], word: str, **kwargs: Unpack[ResultOptions]
+    ) -> None:
+        super().__init__(**kwargs)
+
+        self.query = query
+        self.word = word
+
+    async def callback(self) -> ExecuteResponse:
+        assert self.plugin
+
+        await self.plugin.api.change_query(f"{self.query.keyword} {self.word}")
+        return ExecuteResponse(hide=False)
+
+
+class HintResult(SuggestionResult):
+    def __init__(self, query: Query[None], hint: Hint) -> None:
+        super().__init__(
+            query,
+            hint.word,
+            title=f"Try {hint.word}",
+            sub=f"{hint.entropy:.2f} bits of information, about {hint.expected_remaining:.1f} possible answers left",
+            icon=Icon.yellow_circle,
+            score=45,
+        )
+
+
+class CompletionResult(SuggestionResult):
+    def __init__(self, query: Query[None], word: str, is_candidate: bool) -> None:
+        super().__init__(
+            query,
+            word,
+            title=word,
+            sub="Could be the answer"
+            if is_candidate
+            else "A valid word, but it can't be the answer",
+            icon=Icon.qmark,
+            score=47,
+        )
+
+
+class StatsResult(CachedResult):
+    def __init__(self, stats: GameStats) -> None:
+        # Buckets past the last one with any wins are left out, but never fewer
+        # than the default six guesses.
+        last = max(
+            6,
+            max(
+                (idx + 1 for idx, count in enumerate(stats.distribution) if count),
+                default=0,
+            ),
+        )
+        distribution = " ".join(
+            f"{idx + 1}:{count}" for idx, count in enumerate(stats.distribution[:last])
+        )
+        minutes, seconds = divmod(round(stats.average_duration), 60)
+
+        super().__init__(
+            f"Played {stats.games}, won {stats.win_rate:.0%}, streak {stats.current_streak} (best {stats.max_streak})",
+            sub=f"Wins by guesses: {distribution}, {minutes}m {seconds:02}s a game on average",
+            icon=Icon.green_circle,
+            score=10,
+        )
+
+
+class BoardRow(CachedResult):
+    def __init__(self, title: str, first: int, counts: list[int], idx: int) -> None:
+        boards = (
+            f"Board {first + 1}"
+            if len(counts) == 1
+            else f"Boards {first + 1}-{first + len(counts)}"
+        )
+        super().__init__(
+            title,
+            sub=f"{boards}, possible answers: {', '.join(map(str, counts))}",
+            icon=Icon.green_circle,
+            score=49 - idx,
+        )
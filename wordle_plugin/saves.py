@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Unpack
+
+from wordle import dump_snapshot, load_snapshot, read_snapshot, write_snapshot
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from wordle import WordListLibrary
+    from wordle.game import WordleOptions
+
+    from .executor import BackgroundExecutor
+    from .sessions import Game
+
+LOG = logging.getLogger(__name__)
+
+__all__ = ("GameSaver",)
+
+
+class GameSaver:
+    # Snapshots are taken on the event loop, since the game can't change while
+    # that runs, but written on the background executor. Saves requested while a
+    # write is in flight are coalesced into a single write of the newest snapshot.
+    def __init__(
+        self, path: Path, executor: BackgroundExecutor, *, delay: float = 0.0
+    ) -> None:
+        self.path = path
+        self.executor = executor
+        self.delay = delay
+        self._snapshot: bytes | None = None
+        self._dirty = False
+        self._task: asyncio.Task[None] | None = None
+
+    def schedule(self, game: Game | None, dictionary: str = "") -> None:
+        self._snapshot = None if game is None else dump_snapshot(game, dictionary)
+        self._dirty = True
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._dirty = False
+            write_snapshot(self.path, self._snapshot)
+            return
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._write_pending())
+
+    async def _write_pending(self) -> None:
+        await asyncio.sleep(self.delay)
+        while self._dirty:
+            self._dirty = False
+            try:
+                await self.executor.run(
+                    f"save:{self.path}", write_snapshot, self.path, self._snapshot
+                )
+            except Exception:
+                LOG.exception("Failed to save the game to %s", self.path)
+
+    def load(
+        self,
+        *,
+        library: WordListLibrary | None = None,
+        **options: Unpack[WordleOptions],
+    ) -> Game | None:
+        # A save that hasn't been written yet is newer than what is on disk.
+        if self._task is not None and not self._task.done():
+            if self._snapshot is None:
+                return None
+            return load_snapshot(self._snapshot, library=library, **options)
+        return read_snapshot(self.path, library=library, **options)
+
+    async def flush(self) -> None:
+        if self._task is not None:
+            await self._task
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from wordle import MultiWordleGame, WordleGame
+
+    from .enums import BlackDisplay
+    from .results import Result
+
+    Game: TypeAlias = WordleGame | MultiWordleGame
+
+__all__ = ("GameManager", "GameSession")
+
+
+class GameSession:
+    # One game slot, like the game behind an action keyword. Anything that changes
+    # the game, or reads it across an await, holds the lock while doing so.
+    __slots__ = ("game", "key", "lock", "state_results")
+
+    def __init__(self, key: str, game: Game | None = None) -> None:
+        self.key = key
+        self.game = game
+        self.lock = asyncio.Lock()
+        self.state_results: (
+            tuple[tuple[Game, int, BlackDisplay], list[Result]] | None
+        ) = None
+
+    def __repr__(self) -> str:
+        return f"<GameSession key={self.key!r} game={self.game!r}>"
+
+
+class GameManager:
+    # Keeps the most recently used sessions in memory. Idle sessions past the
+    # capacity are dropped, which loses nothing as long as the loader can bring
+    # their games back, like loading the saved game does.
+    def __init__(
+        self,
+        *,
+        capacity: int = 8,
+        loader: Callable[[str], Game | None] | None = None,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("The capacity has to be at least 1")
+
+        self.capacity = capacity
+        self.loader = loader
+        self._sessions: OrderedDict[str, GameSession] = OrderedDict()
+
+    def get(self, key: str) -> GameSession:
+        session = self._sessions.get(key)
+        if session is None:
+            game = None if self.loader is None else self.loader(key)
+            session = self._sessions[key] = GameSession(key, game)
+            self._evict()
+        else:
+            self._sessions.move_to_end(key)
+        return session
+
+    def peek(self, key: str) -> GameSession | None:
+        return self._sessions.get(key)
+
+    def _evict(self) -> None:
+        # Sessions whose lock is held are in use, so they are skipped even if they
+        # are the least recently used. So is the newest one, which was just asked for.
+        excess = len(self._sessions) - self.capacity
+        if excess <= 0:
+            return
+
+        for key, session in list(self._sessions.items())[:-1]:
+            if excess <= 0:
+                break
+            if not session.lock.locked():
+                del self._sessions[key]
+                excess -= 1
+
+    def discard(self, key: str) -> GameSession | None:
+        return self._sessions.pop(key, None)
+
+    def clear(self) -> None:
+        self._sessions.clear()
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __iter__(self) -> Iterator[GameSession]:
+        return iter(list(self._sessions.values()))
+
+    def __repr__(self) -> str:
+        return f"<GameManager sessions={len(self)} capacity={self.capacity}>"
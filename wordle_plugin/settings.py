@@ -3,3 +3,8 @@ from flogin import Settings
 
 class WordleSettings(Settings):
     black_letters_display_type: str
+    show_hints: bool
+    word_length: str
+    dictionary: str
+    boards: str
+    hard_mode: bool